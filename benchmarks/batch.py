@@ -0,0 +1,54 @@
+from harness import timed
+from core.ai.evaluation import evaluate as scalar_evaluate
+from core.misc.bitboard import legal_moves as scalar_legal_moves
+from core.objects.board import Board
+from core.ai import batch
+from argparse import ArgumentParser
+from random import Random
+import numpy as np
+import sys
+
+
+def random_boards(count: int, seed: int) -> list[Board]:
+    """ This function plays random games and samples a board after every move """
+    random: Random = Random(seed)
+    boards: list[Board] = []
+
+    while len(boards) < count:
+        board: Board = Board()
+        while not board.is_game_over and len(boards) < count:
+            moves: list[int] = [square for square in range(64) if board.legal_moves >> square & 1]
+            board.play(random.choice(moves) if moves else 64)
+            boards.append(board.copy())
+
+    return boards
+
+
+def main() -> int:
+    parser: ArgumentParser = ArgumentParser(description='Batch evaluation against the per-board scalar functions')
+    parser.add_argument('--boards', type=int, default=100000)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    boards: list[Board] = random_boards(args.boards, args.seed)
+    packed: np.ndarray = batch.from_boards(boards)
+    pairs: list[tuple[int, int]] = [(int(player), int(opponent)) for player, opponent in packed]
+
+    scores, scalar_time = timed(lambda: [scalar_evaluate(player, opponent) for player, opponent in pairs], repeat=args.repeat)
+    batch_scores, batch_time = timed(batch.evaluate, packed, repeat=args.repeat)
+
+    # Any mismatch with the scalar reference fails the run
+    moves: list[int] = [scalar_legal_moves(player, opponent) for player, opponent in pairs]
+    failed: bool = (batch_scores.tolist() != scores or batch.legal_moves(packed).tolist() != moves or
+                    batch.mobility(packed).tolist() != [mask.bit_count() for mask in moves] or
+                    batch.disc_counts(packed).tolist() != [[player.bit_count(), opponent.bit_count()] for player, opponent in pairs])
+
+    print(f"{args.boards:,} boards  scalar {scalar_time:.3f}s ({args.boards / scalar_time:,.0f}/s)  "
+          f"batch {batch_time:.3f}s ({args.boards / batch_time:,.0f}/s)  speedup {scalar_time / batch_time:.1f}x")
+    print('MISMATCH with the scalar reference' if failed else 'results match the scalar reference')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,58 @@
+from harness import ROOT, timed, load_baseline, save_baseline, compare
+from core.ai.endgame import EndgameSolver
+from core.enums.coin_state import CoinState
+from core.objects.board import Board
+from argparse import ArgumentParser
+import json
+import sys
+
+
+def load_positions() -> list[dict]:
+    """ This function loads the endgame positions with their exact scores """
+    with open(ROOT / 'endgame_positions.json') as file:
+        return json.load(file)
+
+def main() -> int:
+    parser: ArgumentParser = ArgumentParser(description='Exact endgame solver benchmark')
+    parser.add_argument('--max-empties', type=int, default=64, help='skip positions with more empty squares')
+    parser.add_argument('--threshold', type=float, default=0.20, help='allowed throughput drop as a fraction')
+    parser.add_argument('--update-baseline', action='store_true', help='store this run as the new baseline')
+    args = parser.parse_args()
+
+    results: dict = {}
+    failures: list[str] = []
+
+    for position in load_positions():
+        if position['empties'] > args.max_empties:
+            continue
+
+        board: Board = Board(int(position['black'], 16), int(position['white'], 16), CoinState[position['turn']])
+        solved, elapsed = timed(EndgameSolver().solve, board)
+
+        results[f"endgame/{position['name']}"] = {
+            'empties': position['empties'],
+            'nodes': solved.nodes,
+            'seconds': round(elapsed, 6),
+            'nodes_per_sec': round(solved.nodes / elapsed)
+        }
+        print(f"{position['name']:<8} {position['empties']:>2} empties  score {solved.score:+3}  "
+              f"{solved.nodes:>10,} nodes  {elapsed:8.3f}s")
+
+        # Exact scores never depend on the machine, a mismatch is a solver bug
+        if solved.score != position['score']:
+            failures.append(f"{position['name']}: score {solved.score}, expected {position['score']}")
+
+    if args.update_baseline:
+        save_baseline('endgame', {**load_baseline('endgame'), **results})
+        print('Baseline updated.')
+        return 1 if failures else 0
+
+    failures += compare(results, load_baseline('endgame'), 'nodes_per_sec', args.threshold)
+    for failure in failures:
+        print(f'FAIL {failure}')
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
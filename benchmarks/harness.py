@@ -0,0 +1,75 @@
+from pathlib import Path
+from time import perf_counter
+import json
+import sys
+
+# Benchmarks run as plain scripts, so the source root is put on the import path here
+ROOT: Path = Path(__file__).resolve().parent
+SRC: Path = ROOT.parent / 'src'
+BASELINES: Path = ROOT / 'baselines'
+
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from core.misc.func import from_label_position
+from core.misc.bitboard import square_of
+from core.objects.board import Board
+
+
+def parse_moves(moves: str) -> list[int]:
+    """ This function converts a move string like 'F5D6C3' to bit indexes """
+    return [square_of(from_label_position(moves[i:i + 2])) for i in range(0, len(moves), 2)]
+
+def board_after(moves: str) -> Board:
+    """ This function plays a move string from the opening position, passing where forced """
+    board: Board = Board()
+
+    for square in parse_moves(moves):
+        if board.must_pass:
+            board.pass_turn()
+        board.play(square)
+
+    return board
+
+def timed(function, *args, repeat: int = 1) -> tuple[object, float]:
+    """ This function runs a callable and returns its result with the best wall time out of repeat runs """
+    best: float = float('inf')
+    result: object = None
+
+    for _ in range(repeat):
+        start: float = perf_counter()
+        result = function(*args)
+        best = min(best, perf_counter() - start)
+
+    return result, best
+
+def load_baseline(name: str) -> dict:
+    """ This function loads a stored baseline, empty if there is none yet """
+    path: Path = BASELINES / f'{name}.json'
+    if not path.exists():
+        return {}
+
+    with open(path) as file:
+        return json.load(file)
+
+def save_baseline(name: str, results: dict) -> None:
+    """ This function stores results as the new baseline """
+    BASELINES.mkdir(exist_ok=True)
+    with open(BASELINES / f'{name}.json', 'w') as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+        file.write('\n')
+
+def compare(results: dict, baseline: dict, metric: str, threshold: float) -> list[str]:
+    """ This function returns a failure line for every result whose metric dropped below the threshold """
+    failures: list[str] = []
+
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+
+        expected: float = baseline[key][metric]
+        actual: float = result[metric]
+        if actual < expected * (1 - threshold):
+            failures.append(f"{key}: {metric} {actual:,.0f} is {1 - actual / expected:.1%} below baseline {expected:,.0f}")
+
+    return failures
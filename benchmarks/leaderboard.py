@@ -0,0 +1,71 @@
+from harness import timed
+from core.objects.player_store import PlayerStore
+from core.objects.player import Player
+from argparse import ArgumentParser
+from random import Random
+from uuid import UUID
+import sys
+
+
+def random_store(count: int, seed: int) -> PlayerStore:
+    """ This function builds a store of players with random scores and xp """
+    random: Random = Random(seed)
+    return PlayerStore(Player(UUID(int=random.getrandbits(128)), f'player{index}', f'player{index}@example.com',
+                              random.randrange(3000), 0, random.randrange(100)) for index in range(count))
+
+def check(store: PlayerStore) -> list[str]:
+    """ This function returns a failure line for every rank query that disagrees with a sorted list """
+    failures: list[str] = []
+    expected: list[Player] = sorted(store, key=lambda player: (-player.score, -player.xp, player.id))
+
+    for rank, player in enumerate(expected, start=1):
+        if store.at_rank(rank) is not player or store.rank(player.id) != rank:
+            failures.append(f"rank {rank}: got {store.at_rank(rank).name}, expected {player.name}")
+            break
+
+    # Ranks are 1-based, anything outside 1..len must be rejected instead of wrapping around
+    for rank in (0, -1, len(store) + 1):
+        try:
+            store.at_rank(rank)
+            failures.append(f"at_rank({rank}) returned a player")
+        except ValueError:
+            pass
+
+    return failures
+
+def main() -> int:
+    parser: ArgumentParser = ArgumentParser(description='Cost of leaderboard queries, checked against a sorted list')
+    parser.add_argument('--players', type=int, default=100000)
+    parser.add_argument('--queries', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    store: PlayerStore = random_store(args.players, 0)
+    ids: list[UUID] = [player.id for player in store][:args.queries]
+    random: Random = Random(1)
+    ranks: list[int] = [random.randint(1, len(store)) for _ in range(args.queries)]
+
+    def rank_of() -> None:
+        for id in ids:
+            store.rank(id)
+
+    def at_rank() -> None:
+        for rank in ranks:
+            store.at_rank(rank)
+
+    def rescore() -> None:
+        for id in ids:
+            store.set_score(id, random.randrange(3000))
+
+    for name, function in (('rank', rank_of), ('at_rank', at_rank), ('set_score', rescore)):
+        _, elapsed = timed(function, repeat=args.repeat)
+        print(f"{name:<12} {elapsed / args.queries * 1e6:8.2f} us")
+
+    failures: list[str] = check(store)
+    for failure in failures:
+        print(f'FAIL {failure}')
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
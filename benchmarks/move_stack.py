@@ -0,0 +1,81 @@
+from harness import timed
+from core.misc.bitboard import squares
+from core.objects.board import Board
+from core.enums.guard_mode import GuardMode
+from core.shield.guard import Guard
+from argparse import ArgumentParser
+from random import Random
+import sys
+
+
+def random_game(seed: int) -> list[int]:
+    """ This function returns the plies of a random game, passes included """
+    random: Random = Random(seed)
+    board: Board = Board()
+
+    while not board.is_game_over:
+        if board.legal_moves:
+            board.play(random.choice(list(squares(board.legal_moves))))
+        else:
+            board.pass_turn()
+    return board.moves
+
+def replay(plies: list[int], ply: int) -> Board:
+    """ This function rebuilds a board up to a ply, the only way back before the move stack """
+    board: Board = Board()
+    for square in plies[:ply]:
+        board.play(square)
+    return board
+
+
+def main() -> int:
+    parser: ArgumentParser = ArgumentParser(description='Cost of taking moves back with the move stack against copying and replaying')
+    parser.add_argument('--games', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    Guard.set_mode(GuardMode.TRUSTED)
+    games: list[list[int]] = [random_game(seed) for seed in range(args.games)]
+    plies: int = sum(len(game) for game in games)
+
+    def copy_and_play() -> None:
+        for game in games:
+            board: Board = Board()
+            for square in game:
+                child: Board = board.copy()
+                child.play(square)
+                board.play(square)
+
+    def play_and_undo() -> None:
+        for game in games:
+            board: Board = Board()
+            for square in game:
+                board.play(square)
+                board.undo()
+                board.play(square)
+
+    def scrub_by_replay() -> None:
+        for game in games:
+            for ply in range(len(game), -1, -1):
+                replay(game, ply)
+
+    def scrub_by_seek() -> None:
+        for game in games:
+            board: Board = replay(game, len(game))
+            for ply in range(len(game), -1, -1):
+                board.seek(ply)
+
+    _, copied = timed(copy_and_play, repeat=args.repeat)
+    _, undone = timed(play_and_undo, repeat=args.repeat)
+    print(f"{'copy + play per ply':<24} {copied / plies * 1e6:8.2f} us")
+    print(f"{'play + undo per ply':<24} {undone / plies * 1e6:8.2f} us")
+
+    _, replayed = timed(scrub_by_replay, repeat=args.repeat)
+    _, sought = timed(scrub_by_seek, repeat=args.repeat)
+    print(f"{'scrub back by replay':<24} {replayed / plies * 1e6:8.2f} us/ply")
+    print(f"{'scrub back by seek':<24} {sought / plies * 1e6:8.2f} us/ply")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
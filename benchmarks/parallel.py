@@ -0,0 +1,48 @@
+from harness import board_after
+from core.ai.parallel import ParallelSearch
+from core.ai.transposition import TranspositionTable
+from core.ai.search import Search
+from core.objects.board import Board
+from argparse import ArgumentParser
+from os import cpu_count
+import sys
+
+POSITIONS: dict[str, str] = {
+    'midgame-12': 'C4C5B6D3C2A7D6E7D7E3B5D2',
+    'midgame-20': 'D3C3B3E3F3C5F6G2B5C6F4A5H1F5D6E7D7E6D8C4',
+    'midgame-28': 'C4C5F6C3B5G7E3E6C2F3G3A5H8B3F4F2B4F5F7H3A3D2E2E1A6E7D7C1'
+}
+
+
+def main() -> int:
+    parser: ArgumentParser = ArgumentParser(description='Speedup of the multi-process root-split search')
+    parser.add_argument('--workers', type=int, default=cpu_count() or 1)
+    parser.add_argument('--depth', type=int, default=6, help='fixed depth searched by both modes')
+    args = parser.parse_args()
+
+    serial_total: float = 0.0
+    parallel_total: float = 0.0
+
+    with ParallelSearch(args.workers) as parallel:
+        # Worker start-up is paid once per pool, not per move
+        parallel.run(Board(), 60, 1)
+
+        for name, moves in POSITIONS.items():
+            board: Board = board_after(moves)
+
+            # Each mode keeps its own tables so neither reuses the other's work
+            serial = Search(table=TranspositionTable(16)).run(board, 3600, args.depth)
+            result = parallel.run(board, 3600, args.depth)
+
+            serial_total += serial.elapsed
+            parallel_total += result.elapsed
+            print(f"{name:<12} serial {serial.elapsed:7.3f}s ({serial.nodes:,} nodes)  "
+                  f"parallel {result.elapsed:7.3f}s ({result.nodes:,} nodes)  speedup {serial.elapsed / result.elapsed:5.2f}x")
+
+    speedup: float = serial_total / parallel_total
+    print(f"{args.workers} workers: speedup {speedup:.2f}x, efficiency {speedup / args.workers:.0%}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,113 @@
+from harness import board_after, timed, load_baseline, save_baseline, compare
+from core.misc.bitboard import legal_moves, flips, squares
+from core.objects.board import Board
+from argparse import ArgumentParser
+import sys
+
+# Fixed positions given as the moves played from the opening, with the perft depth used for each suite
+POSITIONS: dict[str, tuple[str, int, int]] = {
+    'opening': ('', 7, 6),
+    'midgame-12': ('C4C5B6D3C2A7D6E7D7E3B5D2', 5, 4),
+    'midgame-20': ('D3C3B3E3F3C5F6G2B5C6F4A5H1F5D6E7D7E6D8C4', 5, 4),
+    'midgame-28': ('C4C5F6C3B5G7E3E6C2F3G3A5H8B3F4F2B4F5F7H3A3D2E2E1A6E7D7C1', 4, 4),
+    'midgame-36': ('C4E3F2C5D6E2F3G1D1G3E6C3B6E1B2A7G4F4H2F7D2H3B4C1G8E7F8A5A4B3C2D3H4D7C7E8', 5, 4)
+}
+
+
+def perft(player: int, opponent: int, depth: int, passed: bool = False) -> int:
+    """ This function counts leaf nodes to a depth on raw bitboards, a pass counts as a move """
+    if depth == 0:
+        return 1
+
+    moves: int = legal_moves(player, opponent)
+    if not moves:
+        # Both sides passing ends the game, which is a leaf
+        return 1 if passed else perft(opponent, player, depth - 1, True)
+
+    nodes: int = 0
+    for square in squares(moves):
+        flipped: int = flips(player, opponent, square)
+        nodes += perft(opponent ^ flipped, player | flipped | (1 << square), depth - 1)
+
+    return nodes
+
+def perft_board(board: Board, depth: int) -> int:
+    """ This function counts leaf nodes to a depth through the Board object API """
+    if depth == 0:
+        return 1
+
+    if board.is_game_over:
+        return 1
+
+    if board.must_pass:
+        child: Board = board.copy()
+        child.pass_turn()
+        return perft_board(child, depth - 1)
+
+    nodes: int = 0
+    for position in board.legal_positions():
+        child = board.copy()
+        child.play_at(position)
+        nodes += perft_board(child, depth - 1)
+
+    return nodes
+
+def run(suite: str, repeat: int) -> dict:
+    """ This function runs one suite over every fixed position """
+    results: dict = {}
+
+    for name, (moves, bitboard_depth, board_depth) in POSITIONS.items():
+        board: Board = board_after(moves)
+
+        if suite == 'bitboard':
+            nodes, elapsed = timed(perft, board.player, board.opponent, bitboard_depth, repeat=repeat)
+            depth: int = bitboard_depth
+        else:
+            nodes, elapsed = timed(perft_board, board, board_depth, repeat=repeat)
+            depth = board_depth
+
+        results[f'{suite}/{name}'] = {
+            'depth': depth,
+            'nodes': nodes,
+            'seconds': round(elapsed, 6),
+            'nodes_per_sec': round(nodes / elapsed)
+        }
+
+    return results
+
+def main() -> int:
+    parser: ArgumentParser = ArgumentParser(description='Perft move-generation benchmark')
+    parser.add_argument('--suite', choices=['bitboard', 'board', 'all'], default='all')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per position, the best time is kept')
+    parser.add_argument('--threshold', type=float, default=0.20, help='allowed throughput drop as a fraction')
+    parser.add_argument('--update-baseline', action='store_true', help='store this run as the new baseline')
+    args = parser.parse_args()
+
+    results: dict = {}
+    for suite in (['bitboard', 'board'] if args.suite == 'all' else [args.suite]):
+        results.update(run(suite, args.repeat))
+
+    baseline: dict = load_baseline('perft')
+    failures: list[str] = []
+
+    for key, result in results.items():
+        print(f"{key:<24} depth {result['depth']}  {result['nodes']:>10,} nodes  {result['nodes_per_sec']:>10,} nodes/sec")
+
+        # Node counts never depend on the machine, a mismatch is a move-generation bug
+        if key in baseline and baseline[key]['nodes'] != result['nodes']:
+            failures.append(f"{key}: {result['nodes']:,} nodes, expected {baseline[key]['nodes']:,}")
+
+    if args.update_baseline:
+        save_baseline('perft', {**baseline, **results})
+        print('Baseline updated.')
+        return 0
+
+    failures += compare(results, baseline, 'nodes_per_sec', args.threshold)
+    for failure in failures:
+        print(f'FAIL {failure}')
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
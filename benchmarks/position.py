@@ -0,0 +1,55 @@
+from harness import timed
+from core.misc.bitboard import position_of, square_of
+from core.misc.func import from_label_position
+from core.enums.coin_state import CoinState
+from core.misc.position import Position
+from core.objects.coin import Coin
+from argparse import ArgumentParser
+from uuid import uuid4
+import tracemalloc
+import sys
+
+
+def per_call(function, calls: int, repeat: int) -> float:
+    """ This function returns the best cost of one call in nanoseconds """
+    def run() -> None:
+        for index in range(calls):
+            function(index & 63)
+
+    _, elapsed = timed(run, repeat=repeat)
+    _, empty = timed(lambda: [None for _ in range(calls)], repeat=repeat)
+    return max(0.0, elapsed - empty) / calls * 1e9
+
+def coin_bytes(count: int) -> float:
+    """ This function returns the memory held per placed coin """
+    ids = [uuid4() for _ in range(count)]
+    tracemalloc.start()
+    coins: list[Coin] = [Coin(id, CoinState.BLACK, position_of(index & 63)) for index, id in enumerate(ids)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (size - sys.getsizeof(coins)) / count
+
+
+def main() -> int:
+    parser: ArgumentParser = ArgumentParser(description='Per-call cost of the square value objects')
+    parser.add_argument('--calls', type=int, default=200000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    labels: list[str] = [f"{'ABCDEFGH'[square % 8]}{square // 8 + 1}" for square in range(64)]
+    cases: dict[str, object] = {
+        'Position(row, column)': lambda square: Position(square // 8 + 1, square % 8 + 1),
+        'Position.of(row, column)': lambda square: Position.of(square // 8 + 1, square % 8 + 1),
+        'position_of(square)': position_of,
+        'square_of(position)': lambda square: square_of(position_of(square)),
+        'from_label_position(label)': lambda square: from_label_position(labels[square])
+    }
+
+    for name, function in cases.items():
+        print(f"{name:<28} {per_call(function, args.calls, args.repeat):8.0f} ns/call")
+    print(f"{'Coin':<28} {coin_bytes(10000):8.0f} bytes/instance")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,78 @@
+from core.ai.evaluation import MOBILITY_WEIGHT, WEIGHTS
+from core.objects.board import Board
+import numpy as np
+
+# Batches are (N, 2) uint64 arrays, column 0 holds the side to move and column 1 its opponent,
+# the same (player, opponent) order the scalar functions take.
+
+_INNER_FILES: np.uint64 = np.uint64(0x7E7E7E7E7E7E7E7E)
+
+# (shift, opponent mask) per direction pair, as in core.misc.bitboard
+_DIRECTIONS: tuple[tuple[np.uint64, bool], ...] = (
+    (np.uint64(1), True), (np.uint64(8), False), (np.uint64(7), True), (np.uint64(9), True)
+)
+
+# Set bits and summed square values of every byte, bitboards are processed as 8 little-endian bytes
+_POPCOUNT: np.ndarray = np.array([bin(pattern).count('1') for pattern in range(256)], dtype=np.int64)
+_ROW_TABLES: np.ndarray = np.array([
+    [sum(WEIGHTS[row * 8 + column] for column in range(8) if pattern >> column & 1) for pattern in range(256)]
+    for row in range(8)
+], dtype=np.int64)
+_ROWS: np.ndarray = np.arange(8)
+
+
+def from_boards(boards: list[Board]) -> np.ndarray:
+    """ This function packs boards into a batch from each side to move's point of view """
+    return np.array([(board.player, board.opponent) for board in boards], dtype=np.uint64).reshape(-1, 2)
+
+def _bytes(masks: np.ndarray) -> np.ndarray:
+    """ This function views bitboards as their 8 bytes, lowest first """
+    return np.ascontiguousarray(masks, dtype='<u8').view(np.uint8).reshape(masks.shape + (8,))
+
+def popcount(masks: np.ndarray) -> np.ndarray:
+    return _POPCOUNT[_bytes(masks)].sum(axis=-1)
+
+def legal_moves(boards: np.ndarray) -> np.ndarray:
+    """ This function returns the legal move mask of every board """
+    return _legal_moves(boards[:, 0], boards[:, 1])
+
+def _legal_moves(player: np.ndarray, opponent: np.ndarray) -> np.ndarray:
+    empty: np.ndarray = ~(player | opponent)
+    moves: np.ndarray = np.zeros_like(player)
+
+    for shift, masked in _DIRECTIONS:
+        o: np.ndarray = opponent & _INNER_FILES if masked else opponent
+
+        # Towards higher bits
+        run: np.ndarray = o & (player << shift)
+        for _ in range(5):
+            run |= o & (run << shift)
+        moves |= run << shift
+
+        # Towards lower bits
+        run = o & (player >> shift)
+        for _ in range(5):
+            run |= o & (run >> shift)
+        moves |= run >> shift
+
+    return moves & empty
+
+def mobility(boards: np.ndarray) -> np.ndarray:
+    """ This function counts the legal moves of the side to move on every board """
+    return popcount(legal_moves(boards))
+
+def disc_counts(boards: np.ndarray) -> np.ndarray:
+    """ This function counts the discs of both sides, shaped like the batch """
+    return popcount(boards)
+
+def positional(discs: np.ndarray) -> np.ndarray:
+    """ This function sums the static square values of every bitboard """
+    return _ROW_TABLES[_ROWS, _bytes(discs)].sum(axis=-1)
+
+def evaluate(boards: np.ndarray) -> np.ndarray:
+    """ This function scores every board exactly as core.ai.evaluation.evaluate does """
+    player: np.ndarray = boards[:, 0]
+    opponent: np.ndarray = boards[:, 1]
+
+    moves: np.ndarray = popcount(_legal_moves(player, opponent)) - popcount(_legal_moves(opponent, player))
+    return positional(player) - positional(opponent) + MOBILITY_WEIGHT * moves
@@ -0,0 +1,233 @@
+from core.misc.bitboard import FULL, PASS, squares, legal_moves, flips
+from core.ai.errors import SearchTimeout
+from core.objects.board import Board
+from time import perf_counter
+
+# Quadrants of the board, an empty region with an odd count is worth moving into first
+QUADRANTS: tuple[int, ...] = (0x000000000F0F0F0F, 0x00000000F0F0F0F0, 0x0F0F0F0F00000000, 0xF0F0F0F000000000)
+CORNERS: int = 0x8100000000000081
+
+# Empties from which moves are ordered by the replies they leave (fastest-first), below it parity alone decides
+_FASTEST_FIRST_EMPTIES: int = 7
+
+# Empties handled by the dedicated routine that walks the empty squares instead of generating moves
+_LAST_EMPTIES: int = 4
+
+# Empties from which proven bounds are kept for positions reached again through another move order
+_TABLE_EMPTIES: int = 7
+
+_CLOCK_INTERVAL: int = 1023
+
+
+def final_difference(player: int, opponent: int) -> int:
+    """ This function returns the final disc differential, empty squares go to the winner """
+    own: int = player.bit_count()
+    other: int = opponent.bit_count()
+    empties: int = 64 - own - other
+
+    if own > other:
+        return own - other + empties
+    if own < other:
+        return own - other - empties
+    return 0
+
+def odd_quadrants(empties: int) -> int:
+    """ This function returns the mask of empty squares lying in quadrants with an odd number of empties """
+    mask: int = 0
+    for quadrant in QUADRANTS:
+        region: int = empties & quadrant
+        if region.bit_count() & 1:
+            mask |= region
+    return mask
+
+
+class EndgameResult:
+    def __init__(self, score: int, line: list[int], nodes: int, elapsed: float):
+        self.score: int = score
+        self.line: list[int] = line
+        self.nodes: int = nodes
+        self.elapsed: float = elapsed
+
+    @property
+    def move(self) -> int:
+        return self.line[0] if self.line else PASS
+
+    def __repr__(self) -> str:
+        """ This method provides object as string for output """
+        return f"(score: {self.score}, line: {self.line}, nodes: {self.nodes}, elapsed: {self.elapsed:.3f}s)"
+
+
+class EndgameSolver:
+    # Constructor
+    def __init__(self):
+        self._deadline: float = float('inf')
+        # Ends a running solve from another thread, like the deadline
+        self.stopped: bool = False
+        self._bounds: dict[tuple[int, int], tuple[int, int]] = {}
+        self.nodes: int = 0
+
+    def solve(self, board: Board, time_budget: float = float('inf')) -> EndgameResult:
+        """ This method returns the exact disc differential for the side to move and a best line """
+        start: float = perf_counter()
+        self._deadline = start + time_budget
+        self._bounds = {}
+        self.nodes = 0
+
+        player: int = board.player
+        opponent: int = board.opponent
+        score: int = self._solve(player, opponent, -64, 64, False)
+        line: list[int] = self._line(player, opponent, score)
+
+        return EndgameResult(score, line, self.nodes, perf_counter() - start)
+
+    def _line(self, player: int, opponent: int, score: int) -> list[int]:
+        """ This method walks down a line that keeps the known exact score, PASS marks a pass """
+        line: list[int] = []
+
+        while True:
+            moves: int = legal_moves(player, opponent)
+            if not moves:
+                if not legal_moves(opponent, player):
+                    return line
+                line.append(PASS)
+                player, opponent, score = opponent, player, -score
+                continue
+
+            # A null window around the known score proves which move reaches it
+            for move in squares(moves):
+                flipped: int = flips(player, opponent, move)
+                child_player: int = opponent ^ flipped
+                child_opponent: int = player | flipped | (1 << move)
+
+                if -self._solve(child_player, child_opponent, -score - 1, -score + 1, False) == score:
+                    line.append(move)
+                    player, opponent, score = child_player, child_opponent, -score
+                    break
+            else:
+                return line
+
+    def _solve(self, player: int, opponent: int, alpha: int, beta: int, passed: bool) -> int:
+        """ This method returns the exact score within the window with alpha-beta pruning """
+        self.nodes += 1
+        if not self.nodes & _CLOCK_INTERVAL and (perf_counter() >= self._deadline or self.stopped):
+            raise SearchTimeout()
+
+        empties: int = ~(player | opponent) & FULL
+        count: int = empties.bit_count()
+        if count <= _LAST_EMPTIES:
+            return self._solve_last(player, opponent, alpha, beta, self._parity_order(empties))
+
+        moves: int = legal_moves(player, opponent)
+        if not moves:
+            if passed:
+                return final_difference(player, opponent)
+            return -self._solve(opponent, player, -beta, -alpha, True)
+
+        # Bounds proven earlier for the same discs narrow the window or settle the node
+        key: tuple[int, int] = (player, opponent)
+        stored: tuple[int, int] | None = self._bounds.get(key) if count >= _TABLE_EMPTIES else None
+        if stored is not None:
+            lower, upper = stored
+            if lower >= beta:
+                return lower
+            if upper <= alpha:
+                return upper
+            alpha = max(alpha, lower)
+            beta = min(beta, upper)
+        original_alpha: int = alpha
+
+        # Principal variation search: the first move gets the full window, the rest only have to prove they are worse
+        best: int = -65
+        for move, flipped in self._order(player, opponent, moves, empties, count):
+            child_player: int = opponent ^ flipped
+            child_opponent: int = player | flipped | (1 << move)
+
+            if best == -65:
+                score: int = -self._solve(child_player, child_opponent, -beta, -alpha, False)
+            else:
+                score = -self._solve(child_player, child_opponent, -alpha - 1, -alpha, False)
+                if alpha < score < beta:
+                    score = -self._solve(child_player, child_opponent, -beta, -score, False)
+
+            if score > best:
+                best = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        if count >= _TABLE_EMPTIES:
+            lower, upper = stored if stored is not None else (-64, 64)
+            if best <= original_alpha:
+                upper = best
+            elif best >= beta:
+                lower = best
+            else:
+                lower = upper = best
+            self._bounds[key] = (lower, upper)
+
+        return best
+
+    def _solve_last(self, player: int, opponent: int, alpha: int, beta: int, empties: list[int]) -> int:
+        """ This method solves the last few empties by trying each empty square directly """
+        self.nodes += 1
+        best: int = -65
+
+        for index, square in enumerate(empties):
+            flipped: int = flips(player, opponent, square)
+            if not flipped:
+                continue
+
+            rest: list[int] = empties[:index] + empties[index + 1:]
+            child_player: int = opponent ^ flipped
+            child_opponent: int = player | flipped | (1 << square)
+
+            if rest:
+                score: int = -self._solve_last(child_player, child_opponent, -beta, -alpha, rest)
+            else:
+                score = -final_difference(child_player, child_opponent)
+
+            if score > best:
+                best = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        return best
+
+        if best > -65:
+            return best
+
+        # No move for the side to move: the opponent plays on, or the game is over
+        for square in empties:
+            if flips(opponent, player, square):
+                return -self._solve_last(opponent, player, -beta, -alpha, empties)
+
+        return final_difference(player, opponent)
+
+    @staticmethod
+    def _parity_order(empties: int) -> list[int]:
+        """ This method lists empty squares, those in odd quadrants first """
+        odd: int = odd_quadrants(empties)
+        return list(squares(odd)) + list(squares(empties & ~odd))
+
+    @staticmethod
+    def _order(player: int, opponent: int, moves: int, empties: int, count: int) -> list[tuple[int, int]]:
+        """ This method orders moves by corners and parity, then fastest-first by the replies they leave """
+        odd: int = odd_quadrants(empties)
+        ordered: list[tuple[int, int, int]] = []
+
+        for move in squares(moves):
+            flipped: int = flips(player, opponent, move)
+            key: int = 0
+
+            if count >= _FASTEST_FIRST_EMPTIES:
+                key = legal_moves(opponent ^ flipped, player | flipped | (1 << move)).bit_count() * 4
+            if odd >> move & 1:
+                key -= 2
+            if CORNERS >> move & 1:
+                key -= 3
+
+            ordered.append((key, move, flipped))
+
+        ordered.sort()
+        return [(move, flipped) for _, move, flipped in ordered]
@@ -0,0 +1,2 @@
+class SearchTimeout(Exception):
+    """ Raised inside a search when the time budget runs out """
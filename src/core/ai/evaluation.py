@@ -0,0 +1,50 @@
+from core.misc.bitboard import legal_moves
+
+# Score of a finished game before the disc differential is added, keeps exact results above any heuristic
+WIN: int = 10000
+
+MOBILITY_WEIGHT: int = 5
+
+# Static square values, indexed by bit (A1 = 0, H8 = 63)
+WEIGHTS: tuple[int, ...] = (
+    100, -20, 10,  5,  5, 10, -20, 100,
+    -20, -50, -2, -2, -2, -2, -50, -20,
+     10,  -2, -1, -1, -1, -1,  -2,  10,
+      5,  -2, -1, -1, -1, -1,  -2,   5,
+      5,  -2, -1, -1, -1, -1,  -2,   5,
+     10,  -2, -1, -1, -1, -1,  -2,  10,
+    -20, -50, -2, -2, -2, -2, -50, -20,
+    100, -20, 10,  5,  5, 10, -20, 100
+)
+
+# Sum of WEIGHTS for every byte pattern of every row, so a bitboard is scored with 8 lookups
+_ROW_TABLES: tuple[tuple[int, ...], ...] = tuple(
+    tuple(sum(WEIGHTS[row * 8 + column] for column in range(8) if pattern >> column & 1) for pattern in range(256))
+    for row in range(8)
+)
+
+
+def positional(discs: int) -> int:
+    """ This function sums the static square values of a bitboard """
+    tables = _ROW_TABLES
+    return (tables[0][discs & 0xFF] + tables[1][discs >> 8 & 0xFF] +
+            tables[2][discs >> 16 & 0xFF] + tables[3][discs >> 24 & 0xFF] +
+            tables[4][discs >> 32 & 0xFF] + tables[5][discs >> 40 & 0xFF] +
+            tables[6][discs >> 48 & 0xFF] + tables[7][discs >> 56 & 0xFF])
+
+def evaluate(player: int, opponent: int) -> int:
+    """ This function scores a position from the side to move's point of view """
+    mobility: int = legal_moves(player, opponent).bit_count() - legal_moves(opponent, player).bit_count()
+    return positional(player) - positional(opponent) + MOBILITY_WEIGHT * mobility
+
+def final_score(player: int, opponent: int) -> int:
+    """ This function scores a finished game, empty squares go to the winner """
+    own: int = player.bit_count()
+    other: int = opponent.bit_count()
+    difference: int = own - other
+
+    if difference > 0:
+        return WIN + difference + (64 - own - other)
+    if difference < 0:
+        return -WIN + difference - (64 - own - other)
+    return 0
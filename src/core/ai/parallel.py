@@ -0,0 +1,152 @@
+from concurrent.futures import ProcessPoolExecutor, Future, wait
+from core.ai.search import INFINITY, Search, SearchResult
+from core.ai.errors import SearchTimeout
+from core.ai.transposition import TranspositionTable
+from core.misc.bitboard import PASS, squares
+from core.enums.coin_state import CoinState
+from core.ai.evaluation import WIN, evaluate
+from core.objects.board import Board
+from core.shield.guard import Guard
+from time import perf_counter, monotonic
+from os import cpu_count
+
+# Search of the worker process, its table lives as long as the pool
+_worker_search: Search | None = None
+
+
+def _init_worker(table_mb: float, evaluator) -> None:
+    """ This function prepares the search of a worker process """
+    global _worker_search
+    _worker_search = Search(evaluator, TranspositionTable(table_mb))
+
+def _search_move(black: int, white: int, turn: int, move: int, depth: int, alpha: int, deadline: float) -> tuple[int, int | None, int]:
+    """ This function scores one root move inside a worker, the score is None when time ran out.
+    The deadline is absolute on time.monotonic(), so a task that waited in the queue doesn't get a fresh budget. """
+    if monotonic() >= deadline:
+        return move, None, 0
+    board: Board = Board(black, white, CoinState(turn))
+
+    try:
+        score: int | None = _worker_search.search_move(board, move, depth, deadline, alpha)
+    except SearchTimeout:
+        score = None
+
+    return move, score, _worker_search.nodes
+
+
+class ParallelSearch:
+    # Constructor
+    def __init__(self, workers: int | None = None, table_mb: float = 16, evaluator=evaluate):
+        workers = workers if workers is not None else cpu_count() or 1
+        Guard.against_zero_or_less(workers, 'workers')
+        self.__workers: int = workers
+
+        Guard.against_zero_or_less(table_mb, 'table memory')
+        self.__table_mb: float = table_mb
+        self.__evaluator = evaluator
+
+        self.__pool: ProcessPoolExecutor | None = None
+        self.nodes: int = 0
+
+    ###########
+    # Getters #
+    ###########
+
+    @property
+    def workers(self) -> int:
+        return self.__workers
+
+    def run(self, board: Board, time_budget: float, max_depth: int = 60) -> SearchResult:
+        """ This method searches with iterative deepening, splitting root moves across worker processes """
+        Guard.against_zero_or_less(time_budget, 'time budget')
+        Guard.against_zero_or_less(max_depth, 'max depth')
+
+        start: float = perf_counter()
+        # Workers compare against the deadline on their own, so it is taken on a clock all processes share
+        deadline: float = monotonic() + time_budget
+        self.nodes = 0
+
+        moves: list[int] = list(squares(board.legal_moves))
+        if not moves:
+            return SearchResult(PASS, 0, 0, 0, perf_counter() - start)
+
+        best: SearchResult = SearchResult(moves[0], 0, 0, 0, 0.0)
+        max_depth = min(max_depth, board.empties.bit_count())
+
+        for depth in range(1, max_depth + 1):
+            scores, complete = self._root(board, moves, depth, deadline)
+
+            if not complete:
+                # A move that beat the leading one before time ran out is still the better choice
+                if scores and depth > 1:
+                    move: int = max(scores, key=scores.__getitem__)
+                    if move != moves[0]:
+                        best.move, best.score = move, scores[move]
+                break
+
+            # The best move leads the next iteration and the rest follow in score order
+            moves.sort(key=lambda move: -scores[move])
+            best = SearchResult(moves[0], scores[moves[0]], depth, self.nodes, perf_counter() - start)
+
+            if abs(best.score) > WIN or perf_counter() - start > time_budget / 2:
+                break
+
+        best.nodes = self.nodes
+        best.elapsed = perf_counter() - start
+        return best
+
+    def _root(self, board: Board, moves: list[int], depth: int, deadline: float) -> tuple[dict[int, int], bool]:
+        """ This method scores the root moves to a depth and tells whether every move finished before the deadline """
+        pool: ProcessPoolExecutor = self._pool()
+        position: tuple[int, int, int] = (board.black, board.white, board.turn.value)
+        scores: dict[int, int] = {}
+
+        # The leading move is searched alone first so its score can bound every other worker
+        first: Future = pool.submit(_search_move, *position, moves[0], depth, -INFINITY, deadline)
+        move, alpha, nodes = first.result()
+        self.nodes += nodes
+        if alpha is None:
+            return scores, False
+
+        scores[move] = alpha
+        if monotonic() >= deadline:
+            return scores, False
+
+        futures: list[Future] = [pool.submit(_search_move, *position, move, depth, alpha, deadline) for move in moves[1:]]
+        wait(futures)
+        complete: bool = True
+
+        for future in futures:
+            move, score, nodes = future.result()
+            self.nodes += nodes
+
+            if score is None:
+                complete = False
+            else:
+                # Scores at or below alpha are only bounds, they still rank below the leading move
+                scores[move] = score if score > alpha else alpha - 1
+
+        return scores, complete
+
+    def _pool(self) -> ProcessPoolExecutor:
+        """ This method starts the worker processes on first use """
+        if self.__pool is None:
+            self.__pool = ProcessPoolExecutor(
+                max_workers=self.__workers,
+                initializer=_init_worker,
+                initargs=(self.__table_mb / self.__workers, self.__evaluator)
+            )
+
+        return self.__pool
+
+    def close(self) -> None:
+        """ This method shuts the worker processes down """
+        if self.__pool is not None:
+            self.__pool.shutdown(cancel_futures=True)
+            self.__pool = None
+
+    def __enter__(self) -> 'ParallelSearch':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
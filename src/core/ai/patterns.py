@@ -0,0 +1,199 @@
+from core.ai.evaluation import WIN
+from core.misc.symmetry import SQUARE_MAPS, TRANSFORMS
+from operator import getitem
+from pathlib import Path
+import numpy as np
+import struct
+
+# Weights are stored in 1/SCALE discs of the final disc differential, from the side to move's point of view
+SCALE: int = 32
+
+# Games are split into phases of 4 discs, every phase has its own weights
+PHASES: int = 15
+PHASE_OF: tuple[int, ...] = tuple(min(PHASES - 1, max(0, discs - 5) // 4) for discs in range(65))
+
+# Base squares of every pattern family, the other instances are its symmetric images.
+# A digit per square makes up the base-3 index: 0 empty, 1 side to move, 2 opponent.
+FAMILIES: tuple[tuple[str, tuple[int, ...]], ...] = (
+    ('edge_x', (0, 1, 2, 3, 4, 5, 6, 7, 9, 14)),
+    ('corner_3x3', (0, 1, 2, 8, 9, 10, 16, 17, 18)),
+    ('corner_2x5', (0, 1, 2, 3, 4, 8, 9, 10, 11, 12)),
+    ('row_2', (8, 9, 10, 11, 12, 13, 14, 15)),
+    ('row_3', (16, 17, 18, 19, 20, 21, 22, 23)),
+    ('row_4', (24, 25, 26, 27, 28, 29, 30, 31)),
+    ('diagonal_8', (0, 9, 18, 27, 36, 45, 54, 63)),
+    ('diagonal_7', (1, 10, 19, 28, 37, 46, 55)),
+    ('diagonal_6', (2, 11, 20, 29, 38, 47)),
+    ('diagonal_5', (3, 12, 21, 30, 39)),
+    ('diagonal_4', (4, 13, 22, 31))
+)
+SIZES: tuple[int, ...] = tuple(3 ** len(base) for _, base in FAMILIES)
+
+
+def _instances() -> tuple[tuple[int, tuple[int, ...]], ...]:
+    """ This function lists (family, squares) of every distinct symmetric image of the base patterns """
+    instances: list[tuple[int, tuple[int, ...]]] = []
+
+    for family, (_, base) in enumerate(FAMILIES):
+        seen: set[frozenset[int]] = set()
+        for transform_id in TRANSFORMS:
+            image: tuple[int, ...] = tuple(SQUARE_MAPS[transform_id][square] for square in base)
+            if frozenset(image) not in seen:
+                seen.add(frozenset(image))
+                instances.append((family, image))
+
+    return tuple(instances)
+
+INSTANCES: tuple[tuple[int, tuple[int, ...]], ...] = _instances()
+
+# All instance indexes are packed into one int, 16 bits each, so a move updates them with a few additions
+_FIELD: int = 16
+_FIELD_BYTES: int = len(INSTANCES) * _FIELD // 8
+
+
+def _packed(square: int, digit: int) -> int:
+    """ This function returns the packed change of giving a square a digit in every instance holding it """
+    return sum(digit * 3 ** instance[1].index(square) << _FIELD * number
+               for number, instance in enumerate(INSTANCES) if square in instance[1])
+
+# Colours are absolute here (digit 1 black, 2 white), side to move is applied when scoring
+_SQUARE: tuple[int, ...] = tuple(_packed(square, 1) for square in range(64))
+_ROW_TABLES: tuple[tuple[int, ...], ...] = tuple(
+    tuple(sum(_SQUARE[row * 8 + column] for column in range(8) if pattern >> column & 1) for pattern in range(256))
+    for row in range(8)
+)
+
+# A placed disc adds its colour's digit, a flip to black takes 1 off every digit and a flip to white adds 1
+_PLACE: tuple[tuple[int, ...], ...] = tuple(tuple(square * (color + 1) for square in _SQUARE) for color in (0, 1))
+_FLIP: tuple[tuple[tuple[int, ...], ...], ...] = tuple(
+    tuple(tuple(value * (2 * color - 1) for value in table) for table in _ROW_TABLES) for color in (0, 1)
+)
+
+# File layout: a header, one int16 bias per phase, then every family's (phases, 3^n) int16 table
+MAGIC: bytes = b'RVPW'
+VERSION: int = 1
+HEADER: struct.Struct = struct.Struct('<4sHHH')            # magic, version, phases, families
+
+
+def swap_digits(size: int) -> np.ndarray:
+    """ This function maps every index of a pattern of size squares to the index seen by the other side """
+    digits: np.ndarray = np.arange(3 ** size)
+    swapped: np.ndarray = np.zeros_like(digits)
+    for position in range(size):
+        digit: np.ndarray = digits // 3 ** position % 3
+        swapped += np.where(digit == 0, 0, 3 - digit) * 3 ** position
+    return swapped
+
+def features(black: int, white: int) -> int:
+    """ This function returns the packed indexes of every pattern instance """
+    tables = _ROW_TABLES
+    packed: int = 0
+    for row in range(8):
+        shift: int = row * 8
+        packed += tables[row][black >> shift & 0xFF] + 2 * tables[row][white >> shift & 0xFF]
+    return packed
+
+def delta(color: int, move: int, flipped: int) -> int:
+    """ This function returns the change of the packed indexes when a colour plays a move flipping discs """
+    flip = _FLIP[color]
+    return (_PLACE[color][move] +
+            flip[0][flipped & 0xFF] + flip[1][flipped >> 8 & 0xFF] +
+            flip[2][flipped >> 16 & 0xFF] + flip[3][flipped >> 24 & 0xFF] +
+            flip[4][flipped >> 32 & 0xFF] + flip[5][flipped >> 40 & 0xFF] +
+            flip[6][flipped >> 48 & 0xFF] + flip[7][flipped >> 56 & 0xFF])
+
+def unpack(packed: int) -> np.ndarray:
+    """ This function returns the index of every pattern instance """
+    return np.frombuffer(packed.to_bytes(_FIELD_BYTES, 'little'), dtype='<u2')
+
+
+class PatternEvaluator:
+    # Constructor
+    def __init__(self, tables: list[np.ndarray], bias: np.ndarray):
+        if len(tables) != len(FAMILIES) or any(table.shape != (PHASES, size) for table, size in zip(tables, SIZES)):
+            raise ValueError(f"Expected {len(FAMILIES)} tables shaped ({PHASES}, 3^n).")
+
+        self.__tables: list[np.ndarray] = [np.ascontiguousarray(table, dtype=np.int16) for table in tables]
+        self.__bias: np.ndarray = np.ascontiguousarray(bias, dtype=np.int16)
+
+        # Per colour and phase, the table row each instance reads. Memoryviews return plain ints without copying,
+        # white to move reads tables whose indexes were swapped once here instead of at every node.
+        swapped: list[np.ndarray] = [table[:, swap_digits(len(base))] for table, (_, base) in zip(self.__tables, FAMILIES)]
+        self.__rows: tuple[tuple[tuple[memoryview, ...], ...], ...] = tuple(
+            tuple(tuple(memoryview(by_colour[family][phase]) for family, _ in INSTANCES) for phase in range(PHASES))
+            for by_colour in (self.__tables, swapped)
+        )
+        self.__biases: tuple[int, ...] = tuple(int(value) for value in self.__bias)
+
+    ###########
+    # Getters #
+    ###########
+
+    @property
+    def tables(self) -> list[np.ndarray]:
+        return self.__tables
+
+    @property
+    def bias(self) -> np.ndarray:
+        return self.__bias
+
+    # Incremental updates don't depend on the weights, search calls the module functions directly
+    features = staticmethod(features)
+    delta = staticmethod(delta)
+
+    def score(self, packed: int, color: int, player: int, opponent: int) -> int:
+        """ This method scores a position for the side to move from its packed pattern indexes """
+        phase: int = PHASE_OF[(player | opponent).bit_count()]
+        indexes = memoryview(packed.to_bytes(_FIELD_BYTES, 'little')).cast('H')
+        total: int = self.__biases[phase] + sum(map(getitem, self.__rows[color][phase], indexes))
+
+        # Kept clear of the proven win and loss scores
+        return max(-WIN + 1, min(WIN - 1, total))
+
+    def __call__(self, player: int, opponent: int) -> int:
+        """ This method scores a position for the side to move, indexes are computed from scratch """
+        return self.score(features(player, opponent), 0, player, opponent)
+
+    def __reduce__(self):
+        """ Memoryviews don't pickle, worker processes rebuild the evaluator from its tables """
+        return PatternEvaluator, (self.__tables, self.__bias)
+
+    @staticmethod
+    def zeros() -> 'PatternEvaluator':
+        return PatternEvaluator([np.zeros((PHASES, size), dtype=np.int16) for size in SIZES], np.zeros(PHASES, dtype=np.int16))
+
+    @staticmethod
+    def load(path: str | Path) -> 'PatternEvaluator':
+        with open(path, 'rb') as file:
+            data: bytes = file.read()
+
+        magic, version, phases, families = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION or phases != PHASES or families != len(FAMILIES):
+            raise ValueError(f"{path} is not a version {VERSION} pattern file with {PHASES} phases and {len(FAMILIES)} families.")
+
+        expected: int = HEADER.size + 2 * PHASES * (1 + sum(SIZES))
+        if len(data) != expected:
+            raise ValueError(f"{path} should hold {expected} bytes, not {len(data)}.")
+
+        offset: int = HEADER.size
+        bias: np.ndarray = np.frombuffer(data, dtype='<i2', count=PHASES, offset=offset)
+        offset += 2 * PHASES
+
+        tables: list[np.ndarray] = []
+        for size in SIZES:
+            tables.append(np.frombuffer(data, dtype='<i2', count=PHASES * size, offset=offset).reshape(PHASES, size))
+            offset += 2 * PHASES * size
+
+        return PatternEvaluator(tables, bias)
+
+    def save(self, path: str | Path) -> None:
+        path = Path(path)
+
+        # Written next to the target and renamed over it, so a running engine never reads a half-written file
+        temporary: Path = path.with_suffix(path.suffix + '.tmp')
+        with open(temporary, 'wb') as file:
+            file.write(HEADER.pack(MAGIC, VERSION, PHASES, len(FAMILIES)))
+            file.write(self.__bias.astype('<i2').tobytes())
+            for table in self.__tables:
+                file.write(table.astype('<i2').tobytes())
+        temporary.replace(path)
@@ -0,0 +1,140 @@
+from core.ai.search import Search, SearchResult
+from core.misc.bitboard import PASS, squares
+from core.objects.board import Board
+from threading import Thread
+from time import perf_counter
+
+# Budget of a ponder search, the opponent's move stops it long before
+PONDER_BUDGET: float = 3600.0
+
+# Budget of the shallow search guessing the opponent's reply when the table has no move for it
+_PREDICT_BUDGET: float = 0.01
+
+
+class PonderStatistics:
+    # Constructor
+    def __init__(self):
+        self.ponders: int = 0
+        self.hits: int = 0
+        # Seconds of search a hit didn't have to spend again because they were spent on the opponent's time
+        self.saved: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.ponders if self.ponders else 0.0
+
+    def reset(self) -> None:
+        self.ponders = 0
+        self.hits = 0
+        self.saved = 0.0
+
+    def __repr__(self) -> str:
+        """ This method provides object as string for output """
+        return f"(ponders: {self.ponders}, hits: {self.hits} ({self.hit_rate:.0%}), saved: {self.saved:.2f}s)"
+
+
+class Ponderer:
+    # Constructor
+    def __init__(self, search: Search):
+        # Ponder and move searches take turns on one search, so the table filled while pondering serves the next move
+        self.__search: Search = search
+
+        # Position after the predicted reply, searched on the background thread
+        self.__board: Board | None = None
+        self.__prediction: int | None = None
+        self.__thread: Thread | None = None
+        self.__result: SearchResult | None = None
+        self.__started: float = 0.0
+
+        self.statistics: PonderStatistics = PonderStatistics()
+
+    ###########
+    # Getters #
+    ###########
+
+    @property
+    def is_pondering(self) -> bool:
+        return self.__thread is not None
+
+    @property
+    def prediction(self) -> int | None:
+        """ Reply the current ponder search expects, None when not pondering """
+        return self.__prediction if self.__thread is not None else None
+
+    def predict(self, board: Board) -> int | None:
+        """ This method guesses the reply of the side to move, None when the game is over """
+        moves: int = board.legal_moves
+        if not moves:
+            return None if board.is_game_over else PASS
+
+        # The search that chose the last move stored the refutation it expected for the position it left
+        table = self.__search.table
+        entry: tuple[int, int, int, int] | None = table.probe(board.hash) if table is not None else None
+        if entry is not None and entry[3] != PASS and moves >> entry[3] & 1:
+            return entry[3]
+
+        if moves.bit_count() == 1:
+            return next(squares(moves))
+        return self.__search.run(board, _PREDICT_BUDGET, 1).move
+
+    ############
+    # Mutators #
+    ############
+
+    def start(self, board: Board, max_depth: int = 60) -> int | None:
+        """ This method searches the position after the opponent's predicted reply on a background thread while the opponent
+        thinks, returns the predicted reply or None when there is nothing to ponder """
+        self.stop()
+
+        # A forced pass leaves the opponent nothing to think about, so no time to ponder on
+        prediction: int | None = self.predict(board)
+        if prediction is None or prediction == PASS:
+            return None
+
+        self.__board = Board(board.black, board.white, board.turn)
+        self.__board.play(prediction)
+        if self.__board.is_game_over:
+            return None
+
+        self.__prediction = prediction
+        self.__result = None
+        self.__started = perf_counter()
+        self.__thread = Thread(target=self.__run, args=(self.__board, max_depth), name='ponder', daemon=True)
+        self.__thread.start()
+        self.statistics.ponders += 1
+        return prediction
+
+    def resolve(self, board: Board, time_budget: float) -> SearchResult | None:
+        """ This method ends pondering once the opponent moved, returns the ponder result on a hit and None on a miss """
+        if self.__thread is None:
+            return None
+
+        pondered: float = perf_counter() - self.__started
+        hit: bool = (board.black, board.white, board.turn) == (self.__board.black, self.__board.white, self.__board.turn)
+        if not hit:
+            self.stop()
+            return None
+
+        # A hit keeps searching until it had the budget of a normal move, the opponent's time counts towards it
+        resolved: float = perf_counter()
+        self.__thread.join(max(0.0, time_budget - pondered))
+        self.stop()
+        waited: float = perf_counter() - resolved
+
+        result: SearchResult = self.__result
+        self.statistics.hits += 1
+        self.statistics.saved += max(0.0, min(result.elapsed, time_budget) - waited)
+        return result
+
+    def stop(self) -> None:
+        """ This method cancels the ponder search and waits for its thread, the search stops at its next clock check """
+        if self.__thread is None:
+            return
+
+        self.__search.stopped = True
+        self.__thread.join()
+        self.__search.stopped = False
+        self.__thread = None
+
+    def __run(self, board: Board, max_depth: int) -> None:
+        self.__result = self.__search.run(board, PONDER_BUDGET, max_depth)
@@ -0,0 +1,255 @@
+from core.ai.evaluation import WIN, evaluate, final_score
+from core.misc.bitboard import PASS, squares, legal_moves, flips
+from core.ai.transposition import TranspositionTable
+from core.ai.endgame import EndgameSolver
+from core.ai.errors import SearchTimeout
+from core.misc.zobrist import SIDE, move_delta
+from core.objects.board import Board
+from core.enums.bound import Bound
+from core.shield.guard import Guard
+from time import perf_counter, monotonic
+
+INFINITY: int = 1 << 30
+CORNERS: int = 0x8100000000000081
+
+# Nodes searched between two clock reads
+_CLOCK_INTERVAL: int = 255
+
+_EXACT: int = Bound.EXACT.value
+_LOWER: int = Bound.LOWER.value
+_UPPER: int = Bound.UPPER.value
+
+# Below this remaining depth children are ordered statically instead of by mobility
+_MOBILITY_ORDER_DEPTH: int = 3
+
+
+class SearchResult:
+    def __init__(self, move: int, score: int, depth: int, nodes: int, elapsed: float):
+        self.move: int = move
+        self.score: int = score
+        self.depth: int = depth
+        self.nodes: int = nodes
+        self.elapsed: float = elapsed
+
+    @property
+    def nodes_per_sec(self) -> float:
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __repr__(self) -> str:
+        """ This method provides object as string for output """
+        return f"(move: {self.move}, score: {self.score}, depth: {self.depth}, nodes: {self.nodes}, elapsed: {self.elapsed:.3f}s)"
+
+
+class Search:
+    # Constructor
+    def __init__(self, evaluator=evaluate, table: TranspositionTable | None = None, endgame_empties: int = 12):
+        self._evaluate = evaluator
+
+        # Evaluators with a delta keep their features up to date along the searched line, like the hash key
+        self._delta = getattr(evaluator, 'delta', None)
+        self.table: TranspositionTable | None = table
+
+        # At or below this many empty squares the exact solver replaces the heuristic search
+        Guard.against_negative(endgame_empties, 'endgame empties')
+        self.endgame_empties: int = endgame_empties
+        self._solver: EndgameSolver = EndgameSolver()
+
+        self._deadline: float = INFINITY
+        self._stopped: bool = False
+        self.nodes: int = 0
+
+    @property
+    def stopped(self) -> bool:
+        """ Set from another thread to end a running search with its best move so far, cleared again once it returned """
+        return self._stopped
+
+    @stopped.setter
+    def stopped(self, value: bool):
+        self._stopped = value
+        self._solver.stopped = value
+
+    def run(self, board: Board, time_budget: float, max_depth: int = 60) -> SearchResult:
+        """ This method searches with iterative deepening and returns the best move found within the budget """
+        Guard.against_zero_or_less(time_budget, 'time budget')
+        Guard.against_zero_or_less(max_depth, 'max depth')
+
+        player: int = board.player
+        opponent: int = board.opponent
+        color: int = board.turn.value
+        key: int = board.hash
+        features: int = self._evaluate.features(board.black, board.white) if self._delta is not None else 0
+
+        start: float = perf_counter()
+        self.nodes = 0
+
+        moves: list[int] = list(squares(legal_moves(player, opponent)))
+        if not moves:
+            return SearchResult(PASS, 0, 0, 0, perf_counter() - start)
+
+        empties: int = board.empties.bit_count()
+        if empties <= self.endgame_empties:
+            # Half the budget goes to the exact solve, the heuristic search keeps the rest if it runs out
+            try:
+                solved = self._solver.solve(board, time_budget / 2)
+                difference: int = solved.score
+                score: int = difference + (WIN if difference > 0 else -WIN if difference < 0 else 0)
+                return SearchResult(solved.move, score, empties, solved.nodes, perf_counter() - start)
+            except SearchTimeout:
+                self.nodes = self._solver.nodes
+
+        # Iterations are paced on the time left once the solver had its share
+        started: float = perf_counter()
+        available: float = start + time_budget - started
+        self._deadline = start + time_budget
+
+        ordered: list[int] = self._order(player, opponent, moves, PASS, _MOBILITY_ORDER_DEPTH)
+        best: SearchResult = SearchResult(ordered[0], 0, 0, 0, 0.0)
+        max_depth = min(max_depth, empties)
+
+        for depth in range(1, max_depth + 1):
+            try:
+                move, score = self._root(player, opponent, color, key, features, ordered, depth, best)
+            except SearchTimeout:
+                break
+
+            best = SearchResult(move, score, depth, self.nodes, perf_counter() - start)
+
+            # Previous best move is searched first in the next iteration
+            ordered.remove(move)
+            ordered.insert(0, move)
+
+            # A proven result can't change with more depth
+            if abs(score) > WIN:
+                break
+
+            # Each iteration costs several times the previous one, starting one that can't finish only burns time
+            if perf_counter() - started > available / 2:
+                break
+
+        best.nodes = self.nodes
+        best.elapsed = perf_counter() - start
+        return best
+
+    def search_move(self, board: Board, move: int, depth: int, deadline: float, alpha: int = -INFINITY) -> int:
+        """ This method scores one move of the side to move to a depth, exact only above alpha.
+        The deadline is a time.monotonic() reading, a clock every process shares. """
+        self._deadline = perf_counter() + (deadline - monotonic())
+        self.nodes = 0
+
+        player: int = board.player
+        opponent: int = board.opponent
+        color: int = board.turn.value
+        flipped: int = flips(player, opponent, move)
+        features: int = self._evaluate.features(board.black, board.white) + self._delta(color, move, flipped) if self._delta is not None else 0
+
+        return -self._negamax(opponent ^ flipped, player | flipped | (1 << move), 1 - color,
+                              board.hash ^ move_delta(color, move, flipped), features, depth - 1, -INFINITY, -alpha)
+
+    def _root(self, player: int, opponent: int, color: int, key: int, features: int, moves: list[int], depth: int,
+              best: SearchResult) -> tuple[int, int]:
+        """ This method searches every root move to a depth """
+        alpha: int = -INFINITY
+        best_move: int = moves[0]
+        delta = self._delta
+
+        for move in moves:
+            flipped: int = flips(player, opponent, move)
+
+            try:
+                score: int = -self._negamax(opponent ^ flipped, player | flipped | (1 << move), 1 - color,
+                                            key ^ move_delta(color, move, flipped),
+                                            features + delta(color, move, flipped) if delta is not None else 0,
+                                            depth - 1, -INFINITY, -alpha)
+            except SearchTimeout:
+                # The previous best is searched first, so anything beating it at this depth is the better choice
+                if alpha > -INFINITY and best_move != best.move:
+                    best.move = best_move
+                    best.score = alpha
+                raise
+
+            if score > alpha:
+                alpha = score
+                best_move = move
+
+        if self.table is not None:
+            self.table.store(key, depth, _EXACT, alpha, best_move)
+
+        return best_move, alpha
+
+    def _negamax(self, player: int, opponent: int, color: int, key: int, features: int, depth: int, alpha: int, beta: int) -> int:
+        """ This method returns the score of a position for the side to move with alpha-beta pruning """
+        self.nodes += 1
+        if not self.nodes & _CLOCK_INTERVAL and (perf_counter() >= self._deadline or self._stopped):
+            raise SearchTimeout()
+
+        moves: int = legal_moves(player, opponent)
+        if not moves:
+            if not legal_moves(opponent, player):
+                return final_score(player, opponent)
+            return -self._negamax(opponent, player, 1 - color, key ^ SIDE, features, depth, -beta, -alpha)
+
+        delta = self._delta
+        if depth == 0:
+            if delta is not None:
+                return self._evaluate.score(features, color, player, opponent)
+            return self._evaluate(player, opponent)
+
+        # Stored results either answer the node outright or narrow the window, their move is tried first
+        table: TranspositionTable | None = self.table
+        first: int = PASS
+        if table is not None:
+            entry: tuple[int, int, int, int] | None = table.probe(key)
+            if entry is not None:
+                stored_depth, bound, score, first = entry
+                if stored_depth >= depth:
+                    if bound == _EXACT:
+                        return score
+                    if bound == _LOWER and score >= beta:
+                        return score
+                    if bound == _UPPER and score <= alpha:
+                        return score
+
+        original_alpha: int = alpha
+        best: int = -INFINITY
+        best_move: int = PASS
+
+        for move in self._order(player, opponent, list(squares(moves)), first, depth):
+            flipped: int = flips(player, opponent, move)
+            score = -self._negamax(opponent ^ flipped, player | flipped | (1 << move), 1 - color,
+                                   key ^ move_delta(color, move, flipped),
+                                   features + delta(color, move, flipped) if delta is not None else 0,
+                                   depth - 1, -beta, -alpha)
+
+            if score > best:
+                best = score
+                best_move = move
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        if table is not None:
+            bound = _UPPER if best <= original_alpha else _LOWER if best >= beta else _EXACT
+            table.store(key, depth, bound, best, best_move)
+
+        return best
+
+    @staticmethod
+    def _order(player: int, opponent: int, moves: list[int], first: int, depth: int) -> list[int]:
+        """ This method orders moves: the given first move, then corners, then by the replies left to the opponent """
+        if len(moves) < 2:
+            return moves
+
+        keys: dict[int, int] = {}
+        for move in moves:
+            if move == first:
+                keys[move] = -INFINITY
+            elif CORNERS >> move & 1:
+                keys[move] = -64
+            elif depth >= _MOBILITY_ORDER_DEPTH:
+                flipped: int = flips(player, opponent, move)
+                keys[move] = legal_moves(opponent ^ flipped, player | flipped | (1 << move)).bit_count()
+            else:
+                keys[move] = 0
+
+        return sorted(moves, key=keys.__getitem__)
@@ -0,0 +1,111 @@
+from core.ai.patterns import FAMILIES, INSTANCES, PHASES, PHASE_OF, SCALE, SIZES, PatternEvaluator, features, delta, swap_digits, unpack
+from core.misc.bitboard import PASS, flips
+from core.objects.board import Board
+from core.shield.guard import Guard
+import numpy as np
+
+# Column of every pattern family in the weight vector of a phase, the bias comes last
+_OFFSETS: np.ndarray = np.cumsum((0,) + SIZES[:-1])
+_BIAS: int = sum(SIZES)
+_INSTANCE_FAMILIES: np.ndarray = np.array([family for family, _ in INSTANCES])
+
+
+class PatternTrainer:
+    # Constructor
+    def __init__(self, regularization: float = 1.0):
+        Guard.against_negative(regularization, 'regularization')
+        self.__regularization: float = regularization
+
+        # One row per position: the absolute index of every instance, and who was to move
+        self.__indexes: list[np.ndarray] = []
+        self.__colors: list[int] = []
+        self.__phases: list[int] = []
+        self.__results: list[int] = []
+
+    @property
+    def positions(self) -> int:
+        return len(self.__colors)
+
+    def add_game(self, moves: list[int], result: int) -> None:
+        """ This method records every position of a game with its final disc differential for black """
+        board: Board = Board()
+        packed: int = features(board.black, board.white)
+
+        for move in moves:
+            if move == PASS:
+                board.pass_turn()
+                continue
+
+            self.__indexes.append(unpack(packed))
+            self.__colors.append(board.turn.value)
+            self.__phases.append(PHASE_OF[64 - board.empties.bit_count()])
+            self.__results.append(result)
+
+            # The indexes follow the game move by move instead of being recomputed
+            color: int = board.turn.value
+            flipped: int = flips(board.player, board.opponent, move)
+            packed += delta(color, move, flipped)
+            board.play(move)
+
+    def fit(self, iterations: int = 100) -> PatternEvaluator:
+        """ This method fits the weights of every phase by regularized least squares """
+        Guard.against_zero_or_less(iterations, 'iterations')
+
+        # Positions are seen from the side to move, white's indexes and targets are swapped
+        indexes: np.ndarray = np.stack(self.__indexes).astype(np.int64) if self.__indexes else np.zeros((0, len(INSTANCES)), np.int64)
+        colors: np.ndarray = np.array(self.__colors, dtype=np.int64)
+        phases: np.ndarray = np.array(self.__phases, dtype=np.int64)
+        targets: np.ndarray = np.array(self.__results, dtype=np.float64) * np.where(colors == 0, 1, -1) * SCALE
+
+        white: np.ndarray = colors == 1
+        for family, (_, base) in enumerate(FAMILIES):
+            columns: np.ndarray = _INSTANCE_FAMILIES == family
+            indexes[np.ix_(white, columns)] = swap_digits(len(base))[indexes[np.ix_(white, columns)]]
+        indexes += _OFFSETS[_INSTANCE_FAMILIES]
+
+        weights: np.ndarray = np.zeros((PHASES, _BIAS + 1))
+        for phase in range(PHASES):
+            rows: np.ndarray = phases == phase
+            if rows.any():
+                weights[phase] = self._solve(indexes[rows], targets[rows], iterations)
+
+        weights = np.clip(np.rint(weights), -32768, 32767).astype(np.int16)
+        tables: list[np.ndarray] = [weights[:, offset:offset + size] for offset, size in zip(_OFFSETS, SIZES)]
+        return PatternEvaluator(tables, weights[:, _BIAS])
+
+    def _solve(self, columns: np.ndarray, targets: np.ndarray, iterations: int) -> np.ndarray:
+        """ This method runs conjugate gradients on the normal equations of a sparse 0/1 design matrix """
+        size: int = _BIAS + 1
+        flat: np.ndarray = columns.ravel()
+        width: int = columns.shape[1]
+        penalty: float = self.__regularization
+
+        def product(x: np.ndarray) -> np.ndarray:
+            return x[columns].sum(axis=1) + x[_BIAS]
+
+        def transposed(r: np.ndarray) -> np.ndarray:
+            result: np.ndarray = np.bincount(flat, weights=np.repeat(r, width), minlength=size)
+            result[_BIAS] += r.sum()
+            return result
+
+        x: np.ndarray = np.zeros(size)
+        residual: np.ndarray = targets.copy()
+        gradient: np.ndarray = transposed(residual)
+        direction: np.ndarray = gradient.copy()
+        norm: float = gradient @ gradient
+
+        for _ in range(iterations):
+            if norm < 1e-9:
+                break
+
+            step_product: np.ndarray = product(direction)
+            alpha: float = norm / (step_product @ step_product + penalty * (direction @ direction))
+            x += alpha * direction
+            residual -= alpha * step_product
+
+            gradient = transposed(residual) - penalty * x
+            updated: float = gradient @ gradient
+            direction = gradient + updated / norm * direction
+            norm = updated
+
+        return x
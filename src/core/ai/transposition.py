@@ -0,0 +1,103 @@
+from core.shield.guard import Guard
+from array import array
+
+# Every entry is a 64-bit key plus a 64-bit packed record
+ENTRY_BYTES: int = 16
+
+# Packed record layout, an all-zero record marks an empty slot
+_SCORE_OFFSET: int = 1 << 31
+_DEPTH_SHIFT: int = 32
+_BOUND_SHIFT: int = 40
+_MOVE_SHIFT: int = 42
+_USED: int = 1 << 49
+
+
+class TranspositionTable:
+    # Constructor
+    def __init__(self, memory_mb: float = 16):
+        Guard.against_zero_or_less(memory_mb, 'memory')
+        self.__memory_mb: float = memory_mb
+
+        # Buckets of two slots: even slots keep the deepest entry, odd slots always take the newest
+        self.__buckets: int = max(1, int(memory_mb * 1024 * 1024) // (2 * ENTRY_BYTES))
+        self.__keys: array = array('Q', bytes(16 * self.__buckets))
+        self.__records: array = array('Q', bytes(16 * self.__buckets))
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.collisions: int = 0
+
+    ###########
+    # Getters #
+    ###########
+
+    @property
+    def memory_mb(self) -> float:
+        return self.__memory_mb
+
+    @property
+    def capacity(self) -> int:
+        """ Number of entries the table can hold """
+        return 2 * self.__buckets
+
+    @property
+    def usage(self) -> float:
+        """ Fraction of slots in use """
+        return sum(1 for record in self.__records if record) / self.capacity
+
+    @property
+    def hit_rate(self) -> float:
+        probes: int = self.hits + self.misses
+        return self.hits / probes if probes else 0.0
+
+    def probe(self, key: int) -> tuple[int, int, int, int] | None:
+        """ This method returns (depth, bound, score, move) stored for the key, None on a miss """
+        slot: int = 2 * (key % self.__buckets)
+        keys: array = self.__keys
+        records: array = self.__records
+
+        if keys[slot] == key and records[slot]:
+            record: int = records[slot]
+        elif keys[slot + 1] == key and records[slot + 1]:
+            record = records[slot + 1]
+        else:
+            self.misses += 1
+            if records[slot] or records[slot + 1]:
+                self.collisions += 1
+            return None
+
+        self.hits += 1
+        return (record >> _DEPTH_SHIFT & 0xFF, record >> _BOUND_SHIFT & 0x3,
+                (record & 0xFFFFFFFF) - _SCORE_OFFSET, record >> _MOVE_SHIFT & 0x7F)
+
+    def store(self, key: int, depth: int, bound: int, score: int, move: int) -> None:
+        """ This method stores a search result, bound is a Bound value """
+        slot: int = 2 * (key % self.__buckets)
+        record: int = (_USED | move << _MOVE_SHIFT | bound << _BOUND_SHIFT |
+                       depth << _DEPTH_SHIFT | (score + _SCORE_OFFSET))
+        keys: array = self.__keys
+        records: array = self.__records
+
+        kept: int = records[slot]
+        if not kept or keys[slot] == key or depth >= (kept >> _DEPTH_SHIFT & 0xFF):
+            keys[slot] = key
+            records[slot] = record
+
+            # Drop a stale copy of the same position from the other slot
+            if keys[slot + 1] == key:
+                records[slot + 1] = 0
+        else:
+            keys[slot + 1] = key
+            records[slot + 1] = record
+
+    def clear(self) -> None:
+        """ This method empties the table and resets its counters """
+        self.__keys = array('Q', bytes(16 * self.__buckets))
+        self.__records = array('Q', bytes(16 * self.__buckets))
+        self.hits = 0
+        self.misses = 0
+        self.collisions = 0
+
+    def __repr__(self) -> str:
+        """ This method provides object as string for output """
+        return f"(entries: {self.capacity}, hits: {self.hits}, misses: {self.misses}, collisions: {self.collisions})"
@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class MatchAttribute(Enum):
+    ID = 'id'
+    BLACK = 'black'
+    WHITE = 'white'
+    MOVES = 'moves'
+    LENGTH = 'length'
+    BLACK_DISCS = 'black_discs'
+    WHITE_DISCS = 'white_discs'
+    RESULT = 'result'
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class Bound(Enum):
+    EXACT = 0
+    LOWER = 1
+    UPPER = 2
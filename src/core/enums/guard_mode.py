@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class GuardMode(Enum):
+    STRICT = 'strict'
+    FAST = 'fast'
+    TRUSTED = 'trusted'
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class TournamentFormat(Enum):
+    ROUND_ROBIN = 'round-robin'
+    SWISS = 'swiss'
@@ -0,0 +1,91 @@
+from core.misc.position import Position
+
+# Bitboard layout: the square at Position(row, column) is bit (row - 1) * 8 + (column - 1),
+# so A1 is bit 0, H1 is bit 7 and H8 is bit 63.
+
+FULL: int = 0xFFFFFFFFFFFFFFFF
+INNER_FILES: int = 0x7E7E7E7E7E7E7E7E   # Every file except A and H
+
+INITIAL_BLACK: int = 0x0000000810000000  # E4, D5
+INITIAL_WHITE: int = 0x0000001008000000  # D4, E5
+
+# Sentinel move used for a pass
+PASS: int = 64
+
+# Interned position of every bit index
+_POSITIONS: tuple[Position, ...] = tuple(Position.of(square // 8 + 1, square % 8 + 1) for square in range(64))
+
+# (shift, opponent mask) per direction pair, the mask stops runs from wrapping around an edge file
+_DIRECTIONS: tuple[tuple[int, bool], ...] = ((1, True), (8, False), (7, True), (9, True))
+
+
+def square_of(position: Position) -> int:
+    """ This function converts a position to its bit index """
+    return (position.row - 1) * 8 + position.column - 1
+
+def position_of(square: int) -> Position:
+    """ This function converts a bit index to its position """
+    return _POSITIONS[square]
+
+def squares(mask: int):
+    """ This function yields the bit index of every set bit in the mask """
+    while mask:
+        low: int = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+def legal_moves(player: int, opponent: int) -> int:
+    """ This function returns the mask of every square the player can move to """
+    empty: int = ~(player | opponent) & FULL
+    moves: int = 0
+
+    for shift, masked in _DIRECTIONS:
+        o: int = opponent & INNER_FILES if masked else opponent
+
+        # Towards higher bits
+        run: int = o & (player << shift)
+        run |= o & (run << shift)
+        run |= o & (run << shift)
+        run |= o & (run << shift)
+        run |= o & (run << shift)
+        run |= o & (run << shift)
+        moves |= run << shift
+
+        # Towards lower bits
+        run = o & (player >> shift)
+        run |= o & (run >> shift)
+        run |= o & (run >> shift)
+        run |= o & (run >> shift)
+        run |= o & (run >> shift)
+        run |= o & (run >> shift)
+        moves |= run >> shift
+
+    return moves & empty
+
+def flips(player: int, opponent: int, square: int) -> int:
+    """ This function returns the mask of opponent discs flipped by a move at the square """
+    move: int = 1 << square
+    flipped: int = 0
+
+    for shift, masked in _DIRECTIONS:
+        o: int = opponent & INNER_FILES if masked else opponent
+
+        # Towards higher bits
+        run: int = 0
+        x: int = (move << shift) & o
+        while x:
+            run |= x
+            x = (x << shift) & o
+        if (run << shift) & player:
+            flipped |= run
+
+        # Towards lower bits
+        run = 0
+        x = (move >> shift) & o
+        while x:
+            run |= x
+            x = (x >> shift) & o
+        if (run >> shift) & player:
+            flipped |= run
+
+    return flipped
@@ -1,46 +1,35 @@
+from core.misc.square import INDEXES, LABELS, POSITIONS
 from core.misc.position import Position
+from core.misc.bitboard import PASS
 from core.shield.guard import Guard
-from os import system, name
 from uuid import uuid4
+import sys
+
+# Erases the terminal and homes the cursor, without starting a shell like `cls`/`clear` would
+CLEAR_SEQUENCE: str = '\033[2J\033[3J\033[H'
 
 # Generates a random GUID
 generate_guid = lambda : uuid4()
 
 def to_label_position(position: Position) -> str:
     """ This function converts a normal position to a labeled position """
-    row: str = str(position.row)
-    labels: str = "ABCDEFGH"
-    column: str = labels[position.column - 1]
-
-    return column + row
+    return LABELS[(position.row - 1) * 8 + position.column - 1]
 
 def from_label_position(position: str) -> Position:
     """ This function converts a labeled position to a normal position """
-    # Validation Checks
-    Guard.against_size(2, position, 'position')
-
-    if not position[1].isdigit():
-        raise Exception("The position must contain a digit.")
-    if not position[0] in 'ABCDEFGH':
-        raise Exception("The position must contain a label.")
+    # Only the 64 exact labels are in the table, so 'AB', 'A0', 'A9' and 'a1' are all rejected here
+    square: int | None = INDEXES.get(position)
+    if square is None or square == PASS:
+        raise ValueError(f"{position!r} is not a position, positions are a label A-H followed by a digit 1-8.")
 
-    # Conversion
-    row: int = int(position[1])
-    column: int = ord(position[0]) - ord('A') + 1
-
-    return Position(row, column)
+    return POSITIONS[square]
 
 def print_n(value: str, limit: int, line_break: bool = True) -> None:
     """ This function prints a given string in N times """
     Guard.against_zero_or_less(limit, 'limit')
-
-    for count in range(limit):
-        print(value, end='')
-
-    if line_break:
-        print()
+    print(value * limit, end='\n' if line_break else '')
 
 def clear_screen() -> None:
     """ This function clears console/terminal screen """
-    command: str = 'cls' if name == 'nt' else 'clear'
-    system(command)
+    sys.stdout.write(CLEAR_SEQUENCE)
+    sys.stdout.flush()
@@ -0,0 +1,144 @@
+from random import Random
+
+# Enough levels for tens of millions of entries at a promotion chance of 1/4
+MAX_LEVEL: int = 16
+PROMOTION: float = 0.25
+
+
+class _Node:
+    __slots__ = ('key', 'next', 'width')
+
+    def __init__(self, key, level: int):
+        self.key = key
+        self.next: list['_Node | None'] = [None] * level
+        # Number of level-0 steps each link skips, so ranks are summed on the way down
+        self.width: list[int] = [1] * level
+
+
+class Leaderboard:
+    """ Indexable skip list of ascending keys, every operation is O(log n) on average """
+
+    # Constructor
+    def __init__(self, seed: int = 0):
+        self.__head: _Node = _Node(None, MAX_LEVEL)
+        self.__level: int = 1
+        self.__size: int = 0
+        self.__random: Random = Random(seed)
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __iter__(self):
+        node: _Node | None = self.__head.next[0]
+        while node is not None:
+            yield node.key
+            node = node.next[0]
+
+    def __contains__(self, key) -> bool:
+        node: _Node | None = self._before(key)[0][0].next[0]
+        return node is not None and node.key == key
+
+    def __getitem__(self, index: int):
+        """ This method returns the key at a 0-based index """
+        if index < 0:
+            index += self.__size
+        if not 0 <= index < self.__size:
+            raise IndexError('leaderboard index out of range')
+
+        node: _Node = self.__head
+        remaining: int = index + 1
+        for level in range(self.__level - 1, -1, -1):
+            while node.next[level] is not None and node.width[level] <= remaining:
+                remaining -= node.width[level]
+                node = node.next[level]
+        return node.key
+
+    def add(self, key) -> None:
+        """ This method inserts a key, keys must be unique """
+        chain, steps = self._before(key)
+        following: _Node | None = chain[0].next[0]
+        if following is not None and following.key == key:
+            raise KeyError(f"{key!r} is already ranked.")
+
+        level: int = self._random_level()
+        if level > self.__level:
+            for extra in range(self.__level, level):
+                chain[extra] = self.__head
+                steps[extra] = 0
+                self.__head.width[extra] = self.__size + 1
+            self.__level = level
+
+        node: _Node = _Node(key, level)
+        # Steps from the head to the new node's predecessor, per level
+        offset: int = steps[0]
+        for index in range(level):
+            previous: _Node = chain[index]
+            skipped: int = offset - steps[index]
+            node.next[index] = previous.next[index]
+            node.width[index] = previous.width[index] - skipped
+            previous.next[index] = node
+            previous.width[index] = skipped + 1
+
+        for index in range(level, self.__level):
+            chain[index].width[index] += 1
+
+        self.__size += 1
+
+    def remove(self, key) -> None:
+        chain, _ = self._before(key)
+        node: _Node | None = chain[0].next[0]
+        if node is None or node.key != key:
+            raise KeyError(f"{key!r} is not ranked.")
+
+        for index in range(self.__level):
+            previous: _Node = chain[index]
+            if previous.next[index] is node:
+                previous.width[index] += node.width[index] - 1
+                previous.next[index] = node.next[index]
+            else:
+                previous.width[index] -= 1
+
+        while self.__level > 1 and self.__head.next[self.__level - 1] is None:
+            self.__level -= 1
+        self.__size -= 1
+
+    def rank(self, key) -> int:
+        """ This method returns the 0-based index of a ranked key """
+        chain, steps = self._before(key)
+        node: _Node | None = chain[0].next[0]
+        if node is None or node.key != key:
+            raise KeyError(f"{key!r} is not ranked.")
+        return steps[0]
+
+    def top(self, count: int) -> list:
+        """ This method returns the first keys without touching the rest """
+        keys: list = []
+        node: _Node | None = self.__head.next[0]
+        while node is not None and len(keys) < count:
+            keys.append(node.key)
+            node = node.next[0]
+        return keys
+
+    def _before(self, key) -> tuple[list[_Node], list[int]]:
+        """ This method finds the last node before a key on every level and how many steps in it is """
+        chain: list[_Node] = [self.__head] * MAX_LEVEL
+        steps: list[int] = [0] * MAX_LEVEL
+
+        node: _Node = self.__head
+        position: int = 0
+        for level in range(self.__level - 1, -1, -1):
+            following: _Node | None = node.next[level]
+            while following is not None and following.key < key:
+                position += node.width[level]
+                node = following
+                following = node.next[level]
+            chain[level] = node
+            steps[level] = position
+
+        return chain, steps
+
+    def _random_level(self) -> int:
+        level: int = 1
+        while level < MAX_LEVEL and self.__random.random() < PROMOTION:
+            level += 1
+        return level
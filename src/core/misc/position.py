@@ -1,14 +1,19 @@
 from core.shield.guard import Guard
 from core.misc.range import Range
 
+# Rows and columns both run from 1 to 8, built once instead of on every validation
+_RANGE: Range = Range(1, 8)
+
 
 class Position:
+    __slots__ = ('__row', '__column')
+
     # Constructor
     def __init__(self, row: int, column: int):
-        Guard.against_out_of_range(Position.range(), row, 'row')
+        Guard.against_out_of_range(_RANGE, row, 'row')
         self.__row: int = row
 
-        Guard.against_out_of_range(Position.range(), column, 'column')
+        Guard.against_out_of_range(_RANGE, column, 'column')
         self.__column: int = column
 
     ###########
@@ -25,8 +30,28 @@ class Position:
 
     @staticmethod
     def range() -> Range:
-        return Range(1, 8)
+        return _RANGE
+
+    @staticmethod
+    def of(row: int, column: int) -> 'Position':
+        """ This method returns the shared, already validated instance of a square """
+        if 1 <= row <= 8 and 1 <= column <= 8:
+            return _INTERNED[(row - 1) * 8 + column - 1]
+
+        Guard.against_out_of_range(_RANGE, row, 'row')
+        Guard.against_out_of_range(_RANGE, column, 'column')
+        raise ValueError(f"Position ({row}, {column}) is out of range.")
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Position) and self.__row == other.__row and self.__column == other.__column
+
+    def __hash__(self) -> int:
+        return (self.__row - 1) * 8 + self.__column - 1
 
     def __repr__(self) -> str:
         """ This method provides object as string for output """
         return f"({self.row}, {self.column})"
+
+
+# Every square in bit order (A1 first, H8 last), positions are immutable so these are shared freely
+_INTERNED: tuple[Position, ...] = tuple(Position(row, column) for row in range(1, 9) for column in range(1, 9))
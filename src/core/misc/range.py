@@ -1,4 +1,6 @@
 class Range:
+    __slots__ = ('__start', '__end')
+
     # Constructor
     def __init__(self, start: int | float, end: int | float):
         self.__start: int | float = start
@@ -0,0 +1,67 @@
+from math import log, log10, pi, sqrt
+
+# Normal quantile of a two-sided 95% interval
+Z_95: float = 1.96
+
+# Elo points a single game moves a rating by at most
+ELO_K: float = 16
+
+# Glicko-1: new players start at 1500 ± 350, every rating period without games widens the deviation by C
+INITIAL_RATING: float = 1500
+INITIAL_DEVIATION: float = 350
+MIN_DEVIATION: float = 30
+DEVIATION_GROWTH: float = 30
+_Q: float = log(10) / 400
+
+
+def expected_score(difference: float) -> float:
+    """ This function returns the expected score of a player rated difference points above the opponent """
+    return 1 / (1 + 10 ** (-difference / 400))
+
+def elo_from_score(score: float) -> float:
+    """ This function converts a score fraction into an Elo difference """
+    if score <= 0:
+        return float('-inf')
+    if score >= 1:
+        return float('inf')
+    return -400 * log10(1 / score - 1)
+
+def elo_difference(wins: int, draws: int, losses: int) -> tuple[float, float]:
+    """ This function estimates the Elo difference of a match result and its 95% error margin """
+    games: int = wins + draws + losses
+    if games == 0:
+        return 0.0, float('inf')
+
+    score: float = (wins + draws / 2) / games
+    variance: float = (wins * (1 - score) ** 2 + draws * (0.5 - score) ** 2 + losses * score ** 2) / games
+    deviation: float = sqrt(variance / games)
+
+    # A clean sweep (or none) gives no finite bound
+    if score in (0, 1):
+        return elo_from_score(score), float('inf')
+
+    low: float = elo_from_score(score - Z_95 * deviation)
+    high: float = elo_from_score(score + Z_95 * deviation)
+    return elo_from_score(score), (high - low) / 2
+
+def elo_update(rating: float, opponent: float, score: float, k: float = ELO_K) -> float:
+    """ This function returns a rating after one game, score is 1 for a win, 0.5 for a draw and 0 for a loss """
+    return rating + k * (score - expected_score(rating - opponent))
+
+def _attenuation(deviation: float) -> float:
+    """ This function returns Glicko's g, how much an opponent's uncertain rating weakens what a game says """
+    return 1 / sqrt(1 + 3 * (_Q * deviation / pi) ** 2)
+
+def glicko_update(rating: float, deviation: float, opponent: float, opponent_deviation: float, score: float) -> tuple[float, float]:
+    """ This function returns (rating, deviation) after one game, a rating period of its own, so results apply as they arrive """
+    g: float = _attenuation(opponent_deviation)
+    expected: float = 1 / (1 + 10 ** (-g * (rating - opponent) / 400))
+    inverse_variance: float = _Q ** 2 * g ** 2 * expected * (1 - expected)
+
+    precision: float = 1 / deviation ** 2 + inverse_variance
+    rating += _Q / precision * g * (score - expected)
+    return rating, max(MIN_DEVIATION, sqrt(1 / precision))
+
+def glicko_widen(deviation: float, periods: int = 1) -> float:
+    """ This function returns the deviation of a rating after rating periods without games """
+    return min(INITIAL_DEVIATION, sqrt(deviation ** 2 + periods * DEVIATION_GROWTH ** 2))
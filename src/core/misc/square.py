@@ -0,0 +1,59 @@
+from core.misc.bitboard import PASS, position_of
+from core.misc.position import Position
+from array import array
+from operator import or_
+
+# Label of a pass in recorded move strings
+PASS_LABEL: str = '--'
+
+# Per bit index: label, 1-based row and column, position and bit mask. Index PASS is the pass, it has no square.
+LABELS: tuple[str, ...] = tuple(f"{'ABCDEFGH'[square % 8]}{square // 8 + 1}" for square in range(64)) + (PASS_LABEL,)
+ROWS: tuple[int, ...] = tuple(square // 8 + 1 for square in range(64))
+COLUMNS: tuple[int, ...] = tuple(square % 8 + 1 for square in range(64))
+POSITIONS: tuple[Position, ...] = tuple(position_of(square) for square in range(64))
+MASKS: tuple[int, ...] = tuple(1 << square for square in range(64))
+
+# Bit index of every label, only the exact 2-character uppercase labels are in it
+INDEXES: dict[str, int] = {label: square for square, label in enumerate(LABELS)}
+
+# Byte tables for whole move strings: a column letter becomes its column index, a row digit its row index times 8,
+# the dashes of a pass add up to PASS and every other byte becomes 0xFF, which survives the OR as a marker
+_INVALID: int = 0xFF
+_COLUMN_TABLE: bytes = bytes(
+    'ABCDEFGH'.index(chr(byte)) if chr(byte) in 'ABCDEFGH' else PASS if byte == ord('-') else _INVALID for byte in range(256)
+)
+_ROW_TABLE: bytes = bytes(
+    8 * '12345678'.index(chr(byte)) if chr(byte) in '12345678' else 0 if byte == ord('-') else _INVALID for byte in range(256)
+)
+_DASH_TABLE: bytes = bytes(1 if byte == ord('-') else 0 for byte in range(256))
+
+
+def label_of(square: int) -> str:
+    """ This function returns the label of a bit index, '--' for a pass """
+    return LABELS[square]
+
+def index_of(label: str) -> int:
+    """ This function returns the bit index of a label like 'F5', PASS for '--' """
+    square: int | None = INDEXES.get(label)
+    if square is None:
+        raise ValueError(f"{label!r} is not a square label, labels are a column A-H followed by a row 1-8.")
+    return square
+
+def parse_moves(moves: str) -> array:
+    """ This function converts a whole move string like 'F5D6C3', '--' marking a pass, to bit indexes in one pass """
+    if len(moves) % 2:
+        raise ValueError(f"A move string holds 2 characters per move, not {len(moves)} characters.")
+
+    # Archives often record lowercase moves, non-ASCII characters become '?' and fail below like any other
+    data: bytes = moves.upper().encode('ascii', 'replace')
+    columns: bytes = data[0::2]
+    rows: bytes = data[1::2]
+
+    # Every step runs in C over the whole string, no Python code runs per move
+    squares: bytes = bytes(map(or_, columns.translate(_COLUMN_TABLE), rows.translate(_ROW_TABLE)))
+    if _INVALID in squares or columns.translate(_DASH_TABLE) != rows.translate(_DASH_TABLE):
+        # Only a broken string pays for finding the move to report
+        for index in range(0, len(moves), 2):
+            index_of(moves[index:index + 2].upper())
+
+    return array('B', squares)
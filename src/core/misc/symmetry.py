@@ -0,0 +1,94 @@
+from core.misc.square import LABELS, index_of
+from core.misc.bitboard import FULL, PASS, square_of, position_of
+from core.misc.position import Position
+
+# Transform ids are bit sets: 4 transposes (A1-H8 diagonal), then 2 flips the rows, then 1 mirrors the columns
+IDENTITY: int = 0
+TRANSFORMS: range = range(8)
+
+
+def flip_vertical(discs: int) -> int:
+    """ This function flips a bitboard top to bottom (row 1 <-> row 8) """
+    return int.from_bytes(discs.to_bytes(8, 'little'), 'big')
+
+def mirror_horizontal(discs: int) -> int:
+    """ This function mirrors a bitboard left to right (column A <-> column H) """
+    discs = ((discs >> 1) & 0x5555555555555555) | ((discs & 0x5555555555555555) << 1)
+    discs = ((discs >> 2) & 0x3333333333333333) | ((discs & 0x3333333333333333) << 2)
+    return ((discs >> 4) & 0x0F0F0F0F0F0F0F0F) | ((discs & 0x0F0F0F0F0F0F0F0F) << 4)
+
+def transpose(discs: int) -> int:
+    """ This function flips a bitboard about the A1-H8 diagonal with delta swaps """
+    swap: int = 0x0F0F0F0F00000000 & (discs ^ (discs << 28))
+    discs ^= swap ^ (swap >> 28)
+    swap = 0x3333000033330000 & (discs ^ (discs << 14))
+    discs ^= swap ^ (swap >> 14)
+    swap = 0x5500550055005500 & (discs ^ (discs << 7))
+    return (discs ^ swap ^ (swap >> 7)) & FULL
+
+def transform(discs: int, transform_id: int) -> int:
+    """ This function applies one of the 8 board symmetries to a bitboard """
+    if transform_id & 4:
+        discs = transpose(discs)
+    if transform_id & 2:
+        discs = flip_vertical(discs)
+    if transform_id & 1:
+        discs = mirror_horizontal(discs)
+    return discs
+
+# Square each square lands on under every transform, and the transform undoing each one
+SQUARE_MAPS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(transform(1 << square, transform_id).bit_length() - 1 for square in range(64))
+    for transform_id in TRANSFORMS
+)
+INVERSE: tuple[int, ...] = tuple(
+    next(inverse for inverse in TRANSFORMS if all(SQUARE_MAPS[inverse][SQUARE_MAPS[transform_id][square]] == square for square in range(64)))
+    for transform_id in TRANSFORMS
+)
+
+
+def images(discs: int) -> tuple[int, ...]:
+    """ This function returns a bitboard under all 8 transforms, indexed by transform id, with 7 operations """
+    transposed: int = transpose(discs)
+    flipped: int = flip_vertical(discs)
+    transposed_flipped: int = flip_vertical(transposed)
+    return (discs, mirror_horizontal(discs), flipped, mirror_horizontal(flipped),
+            transposed, mirror_horizontal(transposed), transposed_flipped, mirror_horizontal(transposed_flipped))
+
+def canonical(player: int, opponent: int) -> tuple[int, int, int]:
+    """ This function returns the smallest of the 8 symmetric images of a position and the transform producing it """
+    # Most positions are told apart by the player's discs alone, the opponent's are only transformed on a tie
+    player_images: tuple[int, ...] = images(player)
+    smallest: int = min(player_images)
+    candidates: list[int] = [transform_id for transform_id in TRANSFORMS if player_images[transform_id] == smallest]
+
+    if len(candidates) == 1:
+        return smallest, transform(opponent, candidates[0]), candidates[0]
+
+    opponent_images: tuple[int, ...] = images(opponent)
+    transform_id: int = min(candidates, key=opponent_images.__getitem__)
+    return smallest, opponent_images[transform_id], transform_id
+
+def transform_square(square: int, transform_id: int) -> int:
+    """ This function maps a move onto the transformed board, a pass stays a pass """
+    return square if square == PASS else SQUARE_MAPS[transform_id][square]
+
+def restore_square(square: int, transform_id: int) -> int:
+    """ This function maps a move on the transformed board back onto the original one """
+    return square if square == PASS else SQUARE_MAPS[INVERSE[transform_id]][square]
+
+def transform_position(position: Position, transform_id: int) -> Position:
+    """ This function maps a position onto the transformed board """
+    return position_of(SQUARE_MAPS[transform_id][square_of(position)])
+
+def restore_position(position: Position, transform_id: int) -> Position:
+    """ This function maps a position on the transformed board back onto the original one """
+    return position_of(SQUARE_MAPS[INVERSE[transform_id]][square_of(position)])
+
+def transform_label(label: str, transform_id: int) -> str:
+    """ This function maps a labeled move like 'F5' onto the transformed board """
+    return LABELS[transform_square(index_of(label), transform_id)]
+
+def restore_label(label: str, transform_id: int) -> str:
+    """ This function maps a labeled move on the transformed board back onto the original one """
+    return LABELS[restore_square(index_of(label), transform_id)]
@@ -0,0 +1,49 @@
+from random import Random
+
+# Fixed seed so hashes agree between processes and runs
+SEED: int = 0x5EED0D0C
+
+_random: Random = Random(SEED)
+
+# Key of a disc per colour (indexed by CoinState value) and square, plus the key of white to move
+KEYS: tuple[tuple[int, ...], ...] = tuple(tuple(_random.getrandbits(64) for _ in range(64)) for _ in range(2))
+SIDE: int = _random.getrandbits(64)
+
+
+def _byte_tables(keys) -> tuple[tuple[int, ...], ...]:
+    """ This function builds the XOR of keys for every byte pattern of every row """
+    tables: list[tuple[int, ...]] = []
+
+    for row in range(8):
+        table: list[int] = [0] * 256
+        for pattern in range(1, 256):
+            low: int = (pattern & -pattern).bit_length() - 1
+            table[pattern] = table[pattern & (pattern - 1)] ^ keys(row * 8 + low)
+        tables.append(tuple(table))
+
+    return tuple(tables)
+
+_DISC_TABLES: tuple[tuple[tuple[int, ...], ...], ...] = (
+    _byte_tables(lambda square: KEYS[0][square]),
+    _byte_tables(lambda square: KEYS[1][square])
+)
+
+# Flipping a disc removes one colour's key and adds the other's, whichever way it goes
+_FLIP_TABLES: tuple[tuple[int, ...], ...] = _byte_tables(lambda square: KEYS[0][square] ^ KEYS[1][square])
+
+
+def _lookup(tables: tuple[tuple[int, ...], ...], discs: int) -> int:
+    """ This function XORs the table entries of every byte of a bitboard """
+    return (tables[0][discs & 0xFF] ^ tables[1][discs >> 8 & 0xFF] ^
+            tables[2][discs >> 16 & 0xFF] ^ tables[3][discs >> 24 & 0xFF] ^
+            tables[4][discs >> 32 & 0xFF] ^ tables[5][discs >> 40 & 0xFF] ^
+            tables[6][discs >> 48 & 0xFF] ^ tables[7][discs >> 56 & 0xFF])
+
+def hash_of(black: int, white: int, turn: int) -> int:
+    """ This function hashes a whole position, turn is the CoinState value of the side to move """
+    key: int = _lookup(_DISC_TABLES[0], black) ^ _lookup(_DISC_TABLES[1], white)
+    return key ^ SIDE if turn else key
+
+def move_delta(turn: int, square: int, flipped: int) -> int:
+    """ This function returns what to XOR into a hash when the side to move plays a square and flips discs """
+    return KEYS[turn][square] ^ _lookup(_FLIP_TABLES, flipped) ^ SIDE
@@ -0,0 +1,137 @@
+from core.ai.transposition import TranspositionTable
+from core.ai.evaluation import evaluate
+from core.ai.search import Search, SearchResult
+from core.objects.base_object import BaseObject
+from core.objects.board import Board
+from core.shield.guard import Guard
+from typing import TYPE_CHECKING
+from time import perf_counter
+from uuid import UUID
+
+# Core never imports the data layer at runtime, the book is handed in by whoever wires the player
+if TYPE_CHECKING:
+    from data.book.opening_book import OpeningBook, BookEntry
+    from core.ai.parallel import ParallelSearch
+    from core.ai.ponder import Ponderer, PonderStatistics
+
+
+class AIPlayer(BaseObject):
+    # Constructor
+    def __init__(self, id: UUID, name: str, time_budget: float = 1.0, max_depth: int = 60, table_mb: float = 16, workers: int = 1,
+                 book: 'OpeningBook | None' = None, evaluator=evaluate):
+        super().__init__(id)
+
+        Guard.against_empty_or_whitespace(name, 'name')
+        self.__name: str = name
+
+        Guard.against_zero_or_less(time_budget, 'time budget')
+        self.__time_budget: float = time_budget
+
+        Guard.against_zero_or_less(max_depth, 'max depth')
+        self.__max_depth: int = max_depth
+
+        # The table outlives single moves, so positions seen in earlier searches stay cheap
+        Guard.against_zero_or_less(workers, 'workers')
+        if workers > 1:
+            # Process pools pull in multiprocessing, single threaded players never pay for its import
+            from core.ai.parallel import ParallelSearch
+            self.__search: 'Search | ParallelSearch' = ParallelSearch(workers, table_mb, evaluator)
+        else:
+            self.__search: 'Search | ParallelSearch' = Search(evaluator, TranspositionTable(table_mb))
+        self.__book: 'OpeningBook | None' = book
+        self.__last_result: SearchResult | None = None
+        self.__ponderer: 'Ponderer | None' = None
+
+    ###########
+    # Getters #
+    ###########
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @property
+    def time_budget(self) -> float:
+        return self.__time_budget
+
+    @property
+    def max_depth(self) -> int:
+        return self.__max_depth
+
+    @property
+    def last_result(self) -> SearchResult | None:
+        return self.__last_result
+
+    @property
+    def ponder_statistics(self) -> 'PonderStatistics | None':
+        """ Ponder hits and time saved, None until the player pondered """
+        return self.__ponderer.statistics if self.__ponderer is not None else None
+
+    @property
+    def table(self) -> TranspositionTable | None:
+        """ Table of the in-process search, None when searching across worker processes """
+        return self.__search.table if isinstance(self.__search, Search) else None
+
+    ###########
+    # Setters #
+    ###########
+
+    @time_budget.setter
+    def time_budget(self, value: float):
+        Guard.against_zero_or_less(value, 'time budget')
+        self.__time_budget = value
+
+    @max_depth.setter
+    def max_depth(self, value: int):
+        Guard.against_zero_or_less(value, 'max depth')
+        self.__max_depth = value
+
+    def choose_move(self, board: Board) -> int:
+        """ This method searches the board within the time budget and returns the chosen square (PASS if none) """
+        # Pondering ends first, a hit answers with the search already done on the opponent's time
+        if self.__ponderer is not None:
+            pondered: SearchResult | None = self.__ponderer.resolve(board, self.__time_budget)
+            if pondered is not None:
+                self.__last_result = pondered
+                return pondered.move
+
+        # Book positions are answered without searching
+        if self.__book is not None:
+            start: float = perf_counter()
+            entry: 'BookEntry | None' = self.__book.lookup(board)
+            if entry is not None and board.is_legal(entry.move):
+                self.__last_result = SearchResult(entry.move, entry.score, 0, 0, perf_counter() - start)
+                return entry.move
+
+        self.__last_result = self.__search.run(board, self.__time_budget, self.__max_depth)
+        return self.__last_result.move
+
+    def ponder(self, board: Board) -> int | None:
+        """ This method keeps searching on the opponent's time, after the reply it predicts for the board.
+        Returns the predicted reply, None when there is nothing to ponder or the search runs across worker processes. """
+        if not isinstance(self.__search, Search):
+            return None
+
+        if self.__ponderer is None:
+            # Threads are only imported by players that ponder
+            from core.ai.ponder import Ponderer
+            self.__ponderer = Ponderer(self.__search)
+        return self.__ponderer.start(board, self.__max_depth)
+
+    def stop_pondering(self) -> None:
+        """ This method cancels a ponder search whose position won't come, e.g. once the game is over """
+        if self.__ponderer is not None:
+            self.__ponderer.stop()
+
+    def close(self) -> None:
+        """ This method stops pondering and releases the worker processes of a parallel search """
+        self.stop_pondering()
+        if not isinstance(self.__search, Search):
+            self.__search.close()
+
+    def __repr__(self) -> str:
+        """ This method provides object as string for output """
+        return f"""{'*' * 10} {self.id} {'*' * 10}
+Name:       {self.name}
+Budget:     {self.time_budget}s
+Max Depth:  {self.max_depth}"""
@@ -2,6 +2,8 @@ from uuid import UUID
 
 
 class BaseObject:
+    __slots__ = ('_id',)
+
     def __init__(self, id: UUID):
         self._id: UUID = id
 
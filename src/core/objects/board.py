@@ -0,0 +1,274 @@
+from core.misc.bitboard import FULL, INITIAL_BLACK, INITIAL_WHITE, PASS, square_of, position_of, squares, legal_moves, flips
+from core.misc.zobrist import SIDE, hash_of, move_delta
+from core.misc.symmetry import transform, canonical
+from core.enums.coin_state import CoinState
+from core.misc.position import Position
+from core.misc.func import generate_guid
+from core.objects.move_stack import MoveStack
+from core.objects.coin import Coin
+from core.shield.guard import Guard
+from core.misc.range import Range
+
+_DISCS_RANGE: Range = Range(0, FULL)
+
+
+class Board:
+    # Constructor
+    def __init__(self, black: int = INITIAL_BLACK, white: int = INITIAL_WHITE, turn: CoinState = CoinState.BLACK):
+        # Engine code only builds boards from bitboards it produced, boundary code must not rely on trusted mode
+        if not Guard.trusted():
+            Guard.against_out_of_range(_DISCS_RANGE, black, 'black')
+            Guard.against_out_of_range(_DISCS_RANGE, white, 'white')
+            if black & white:
+                raise ValueError("Black and white discs can't share a square.")
+
+        # Discs are indexed by CoinState value
+        self.__discs: list[int] = [black, white]
+        self.__turn: CoinState = turn
+
+        # Zobrist hash of the discs and side to move, updated incrementally by every move
+        self.__hash: int = hash_of(black, white, turn.value)
+
+        # Played plies for undo and redo, allocated by the first move so boards that are never played stay cheap
+        self.__history: MoveStack | None = None
+
+    ###########
+    # Getters #
+    ###########
+
+    @property
+    def black(self) -> int:
+        return self.__discs[CoinState.BLACK.value]
+
+    @property
+    def white(self) -> int:
+        return self.__discs[CoinState.WHITE.value]
+
+    @property
+    def turn(self) -> CoinState:
+        return self.__turn
+
+    @property
+    def hash(self) -> int:
+        return self.__hash
+
+    @property
+    def player(self) -> int:
+        """ Discs of the side to move """
+        return self.__discs[self.__turn.value]
+
+    @property
+    def opponent(self) -> int:
+        """ Discs of the side waiting """
+        return self.__discs[1 - self.__turn.value]
+
+    @property
+    def empties(self) -> int:
+        return ~(self.black | self.white) & FULL
+
+    @property
+    def legal_moves(self) -> int:
+        return legal_moves(self.player, self.opponent)
+
+    @property
+    def must_pass(self) -> bool:
+        return not self.legal_moves and not self.is_game_over
+
+    @property
+    def is_game_over(self) -> bool:
+        return not legal_moves(self.player, self.opponent) and not legal_moves(self.opponent, self.player)
+
+    @property
+    def can_undo(self) -> bool:
+        return self.__history is not None and self.__history.can_undo
+
+    @property
+    def can_redo(self) -> bool:
+        return self.__history is not None and self.__history.can_redo
+
+    @property
+    def moves(self) -> list[int]:
+        """ Squares played on this board, PASS for a pass, oldest first """
+        return self.__history.squares() if self.__history is not None else []
+
+    @property
+    def winner(self) -> CoinState | None:
+        """ Side with more discs, None on a draw """
+        black: int = self.count(CoinState.BLACK)
+        white: int = self.count(CoinState.WHITE)
+
+        if black == white:
+            return None
+        return CoinState.BLACK if black > white else CoinState.WHITE
+
+    def count(self, state: CoinState) -> int:
+        """ This method counts the discs of a side """
+        return self.__discs[state.value].bit_count()
+
+    def state_at(self, square: int) -> CoinState | None:
+        """ This method returns the state of the disc on a square, None if it is empty """
+        bit: int = 1 << square
+        if self.black & bit:
+            return CoinState.BLACK
+        if self.white & bit:
+            return CoinState.WHITE
+        return None
+
+    def is_legal(self, square: int) -> bool:
+        """ This method checks whether the side to move can play on the square """
+        return 0 <= square < 64 and bool(self.legal_moves >> square & 1)
+
+    def flips(self, square: int) -> int:
+        """ This method returns the mask of discs a move on the square would flip """
+        return flips(self.player, self.opponent, square)
+
+    ############
+    # Mutators #
+    ############
+
+    def play(self, square: int) -> int:
+        """ This method plays a move for the side to move and returns the flipped mask """
+        if square == PASS:
+            self.pass_turn()
+            return 0
+
+        if not Guard.trusted() and not self.is_legal(square):
+            raise ValueError(f"Move {position_of(square) if 0 <= square < 64 else square} is not legal.")
+
+        flipped: int = self.flips(square)
+        me: int = self.__turn.value
+
+        self.__discs[me] |= flipped | (1 << square)
+        self.__discs[1 - me] ^= flipped
+        self.__turn = CoinState(1 - me)
+        delta: int = move_delta(me, square, flipped)
+        self.__hash ^= delta
+        self.__record(square, flipped, delta)
+
+        return flipped
+
+    def pass_turn(self) -> None:
+        """ This method hands the turn over when the side to move has no legal move """
+        if not self.must_pass:
+            raise ValueError("Passing is only allowed when there is no legal move.")
+
+        self.__turn = CoinState(1 - self.__turn.value)
+        self.__hash ^= SIDE
+        self.__record(PASS, 0, SIDE)
+
+    def undo(self) -> int:
+        """ This method takes back the last ply in constant time and returns its square, PASS for a pass """
+        if self.__history is None:
+            raise ValueError("There is no move to undo.")
+
+        square, flipped, delta = self.__history.undo()
+        # The side that played the ply is the one waiting after it
+        self.__toggle(1 - self.__turn.value, square, flipped, delta)
+        return square
+
+    def redo(self) -> int:
+        """ This method plays the last undone ply again and returns its square, PASS for a pass """
+        if self.__history is None:
+            raise ValueError("There is no move to redo.")
+
+        square, flipped, delta = self.__history.redo()
+        self.__toggle(self.__turn.value, square, flipped, delta)
+        return square
+
+    def seek(self, ply: int) -> None:
+        """ This method undoes or redoes plies until the given number of plies is played, for scrubbing through a replay """
+        played: int = len(self.__history) if self.__history is not None else 0
+        undone: int = self.__history.redo_count if self.__history is not None else 0
+        Guard.against_out_of_range(Range(0, played + undone), ply, 'ply')
+
+        while played > ply:
+            self.undo()
+            played -= 1
+        while played < ply:
+            self.redo()
+            played += 1
+
+    def __record(self, square: int, flipped: int, delta: int) -> None:
+        """ This method pushes a played ply on the history """
+        if self.__history is None:
+            self.__history = MoveStack()
+        self.__history.push(square, flipped, delta)
+
+    def __toggle(self, mover: int, square: int, flipped: int, delta: int) -> None:
+        """ This method XORs a ply's discs, hash and turn, which plays it when undone and takes it back when played """
+        if square != PASS:
+            self.__discs[mover] ^= flipped | (1 << square)
+            self.__discs[1 - mover] ^= flipped
+
+        self.__turn = CoinState(1 - self.__turn.value)
+        self.__hash ^= delta
+
+    def copy(self) -> 'Board':
+        """ This method returns an independent copy of the board """
+        return Board(self.black, self.white, self.__turn)
+
+    def transformed(self, transform_id: int) -> 'Board':
+        """ This method returns the board under one of the 8 symmetries, moves map with transform_square """
+        return Board(transform(self.black, transform_id), transform(self.white, transform_id), self.__turn)
+
+    def canonical(self) -> tuple['Board', int]:
+        """ This method returns the canonical image shared by all 8 symmetric boards and the transform producing it """
+        player, opponent, transform_id = canonical(self.player, self.opponent)
+        if self.__turn == CoinState.BLACK:
+            return Board(player, opponent, self.__turn), transform_id
+        return Board(opponent, player, self.__turn), transform_id
+
+    ###############
+    # UI Boundary #
+    ###############
+
+    def play_at(self, position: Position) -> int:
+        """ This method plays a move given as a position, moves from the UI are checked in every guard mode """
+        square: int = square_of(position)
+        if not self.is_legal(square):
+            raise ValueError(f"Move {position} is not legal.")
+
+        return self.play(square)
+
+    def legal_positions(self) -> list[Position]:
+        """ This method returns legal moves of the side to move as positions """
+        return [position_of(square) for square in squares(self.legal_moves)]
+
+    def to_coins(self) -> list[Coin]:
+        """ This method builds placed coin objects for every disc on the board """
+        coins: list[Coin] = []
+
+        for state in (CoinState.BLACK, CoinState.WHITE):
+            for square in squares(self.__discs[state.value]):
+                coins.append(Coin(generate_guid(), state, position_of(square)))
+
+        return coins
+
+    @staticmethod
+    def from_coins(coins: list[Coin], turn: CoinState = CoinState.BLACK) -> 'Board':
+        """ This method builds a board from placed coin objects """
+        discs: list[int] = [0, 0]
+
+        for coin in coins:
+            if not coin.placed:
+                continue
+
+            bit: int = 1 << square_of(coin.position)
+            if (discs[0] | discs[1]) & bit:
+                raise ValueError(f"More than one coin is placed at position {coin.position}.")
+
+            discs[coin.state.value] |= bit
+
+        return Board(discs[CoinState.BLACK.value], discs[CoinState.WHITE.value], turn)
+
+    def __repr__(self) -> str:
+        """ This method provides object as string for output """
+        symbols: dict[CoinState | None, str] = {CoinState.BLACK: 'B', CoinState.WHITE: 'W', None: '.'}
+        lines: list[str] = ['  A B C D E F G H']
+
+        for row in range(8):
+            cells: str = ' '.join(symbols[self.state_at(row * 8 + column)] for column in range(8))
+            lines.append(f"{row + 1} {cells}")
+
+        lines.append(f"Turn: {self.turn.name}")
+        return '\n'.join(lines)
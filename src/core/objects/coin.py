@@ -6,6 +6,8 @@ from uuid import UUID
 
 
 class Coin(BaseObject):
+    __slots__ = ('__state', '__position')
+
     # Constructor
     def __init__(self, id: UUID, state: CoinState = CoinState.WHITE, position: Position | None = None):
         super().__init__(id)
@@ -0,0 +1,119 @@
+from core.enums.attributes.match import MatchAttribute
+from core.misc.func import generate_guid
+from core.misc.square import label_of
+from core.misc.bitboard import PASS
+from core.objects.base_object import BaseObject
+from core.objects.ai_player import AIPlayer
+from core.enums.coin_state import CoinState
+from core.objects.board import Board
+from typing import Callable
+from time import perf_counter
+from uuid import UUID
+
+
+def move_label(move: int) -> str:
+    """ This function converts a move to its label, '--' for a pass """
+    return label_of(move)
+
+
+class MatchRecord(BaseObject):
+    def __init__(self, id: UUID, black: UUID, white: UUID, moves: list[int], times: list[float], black_discs: int, white_discs: int):
+        super().__init__(id)
+        self.black: UUID = black
+        self.white: UUID = white
+        self.moves: list[int] = moves
+        self.times: list[float] = times
+        self.black_discs: int = black_discs
+        self.white_discs: int = white_discs
+
+    @property
+    def result(self) -> int:
+        """ Final disc differential for black """
+        return self.black_discs - self.white_discs
+
+    @property
+    def winner(self) -> CoinState | None:
+        if self.result == 0:
+            return None
+        return CoinState.BLACK if self.result > 0 else CoinState.WHITE
+
+    @staticmethod
+    def get_attributes_list() -> list[MatchAttribute]:
+        """ This method returns attributes list of the match record """
+        return [
+            MatchAttribute.ID,
+            MatchAttribute.BLACK,
+            MatchAttribute.WHITE,
+            MatchAttribute.MOVES,
+            MatchAttribute.LENGTH,
+            MatchAttribute.BLACK_DISCS,
+            MatchAttribute.WHITE_DISCS,
+            MatchAttribute.RESULT
+        ]
+
+    def get_attributes(self) -> dict[MatchAttribute, object]:
+        """ This method returns the value of every attribute of the match record """
+        return {
+            MatchAttribute.ID: self.id,
+            MatchAttribute.BLACK: self.black,
+            MatchAttribute.WHITE: self.white,
+            MatchAttribute.MOVES: ''.join(move_label(move) for move in self.moves),
+            MatchAttribute.LENGTH: len(self.moves),
+            MatchAttribute.BLACK_DISCS: self.black_discs,
+            MatchAttribute.WHITE_DISCS: self.white_discs,
+            MatchAttribute.RESULT: self.result
+        }
+
+    def to_dict(self) -> dict:
+        """ This method provides the record as plain values for serialization """
+        return {
+            'id': str(self.id),
+            'black': str(self.black),
+            'white': str(self.white),
+            'moves': ''.join(move_label(move) for move in self.moves),
+            'times': [round(seconds, 4) for seconds in self.times],
+            'black_discs': self.black_discs,
+            'white_discs': self.white_discs,
+            'result': self.result
+        }
+
+
+class Match:
+    # Constructor
+    def __init__(self, black: AIPlayer, white: AIPlayer, opening: list[int] | None = None,
+                 on_move: Callable[[Board, int], None] | None = None):
+        self.__players: tuple[AIPlayer, AIPlayer] = (black, white)
+        self.__opening: list[int] = opening or []
+
+        # Called with the board and the move after every move, e.g. to show the game live
+        self.__on_move: Callable[[Board, int], None] | None = on_move
+
+    def play(self) -> MatchRecord:
+        """ This method plays the opening moves, then lets the players move until the game is over """
+        board: Board = Board()
+        moves: list[int] = []
+        times: list[float] = []
+
+        for move in self.__opening:
+            if board.must_pass:
+                board.pass_turn()
+                moves.append(PASS)
+                times.append(0.0)
+            board.play(move)
+            moves.append(move)
+            times.append(0.0)
+            if self.__on_move is not None:
+                self.__on_move(board, move)
+
+        while not board.is_game_over:
+            start: float = perf_counter()
+            move = PASS if board.must_pass else self.__players[board.turn.value].choose_move(board)
+            times.append(perf_counter() - start)
+
+            board.play(move)
+            moves.append(move)
+            if self.__on_move is not None:
+                self.__on_move(board, move)
+
+        black, white = self.__players
+        return MatchRecord(generate_guid(), black.id, white.id, moves, times, board.count(CoinState.BLACK), board.count(CoinState.WHITE))
@@ -0,0 +1,101 @@
+from core.shield.guard import Guard
+from array import array
+
+# A game has at most 60 moves and never two passes in a row, so 128 plies never grow the arrays
+DEFAULT_CAPACITY: int = 128
+
+
+class MoveStack:
+    # Constructor
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        Guard.against_zero_or_less(capacity, 'capacity')
+
+        # Parallel arrays per ply: the square played (PASS for a pass), the discs it flipped and what it XORed into the hash
+        self.__squares: array = array('B', bytes(capacity))
+        self.__flips: array = array('Q', bytes(8 * capacity))
+        self.__deltas: array = array('Q', bytes(8 * capacity))
+
+        # Plies below the cursor are played, plies from the cursor up to the end were undone and can be redone
+        self.__cursor: int = 0
+        self.__end: int = 0
+
+    ###########
+    # Getters #
+    ###########
+
+    @property
+    def capacity(self) -> int:
+        return len(self.__squares)
+
+    @property
+    def can_undo(self) -> bool:
+        return self.__cursor > 0
+
+    @property
+    def can_redo(self) -> bool:
+        return self.__cursor < self.__end
+
+    @property
+    def redo_count(self) -> int:
+        return self.__end - self.__cursor
+
+    def __len__(self) -> int:
+        """ Number of plies played """
+        return self.__cursor
+
+    def squares(self) -> list[int]:
+        """ This method returns the squares of the played plies, oldest first """
+        return self.__squares[:self.__cursor].tolist()
+
+    def peek(self) -> tuple[int, int, int]:
+        """ This method returns (square, flipped, delta) of the last played ply """
+        if not self.__cursor:
+            raise ValueError("There is no move to undo.")
+
+        ply: int = self.__cursor - 1
+        return self.__squares[ply], self.__flips[ply], self.__deltas[ply]
+
+    ############
+    # Mutators #
+    ############
+
+    def push(self, square: int, flipped: int, delta: int) -> None:
+        """ This method records a played ply, the plies that could be redone are dropped """
+        ply: int = self.__cursor
+        if ply == len(self.__squares):
+            self.__grow()
+
+        self.__squares[ply] = square
+        self.__flips[ply] = flipped
+        self.__deltas[ply] = delta
+        self.__cursor = self.__end = ply + 1
+
+    def undo(self) -> tuple[int, int, int]:
+        """ This method steps back over the last played ply and returns its (square, flipped, delta) """
+        entry: tuple[int, int, int] = self.peek()
+        self.__cursor -= 1
+        return entry
+
+    def redo(self) -> tuple[int, int, int]:
+        """ This method steps forward over the next undone ply and returns its (square, flipped, delta) """
+        if self.__cursor == self.__end:
+            raise ValueError("There is no move to redo.")
+
+        ply: int = self.__cursor
+        self.__cursor += 1
+        return self.__squares[ply], self.__flips[ply], self.__deltas[ply]
+
+    def clear(self) -> None:
+        """ This method forgets every ply, the arrays are kept for reuse """
+        self.__cursor = self.__end = 0
+
+    def __grow(self) -> None:
+        """ This method doubles the arrays, only callers pushing more plies than a game can hold get here """
+        size: int = len(self.__squares)
+        self.__squares.extend(bytes(size))
+        self.__flips.extend(array('Q', bytes(8 * size)))
+        self.__deltas.extend(array('Q', bytes(8 * size)))
+
+    def __repr__(self) -> str:
+        """ This method provides object as string for output """
+        return f"(plies: {self.__cursor}, redo: {self.redo_count}, capacity: {self.capacity})"
@@ -5,6 +5,8 @@ from uuid import UUID
 
 
 class Player(BaseObject):
+    __slots__ = ('__name', '__email', '__score', '__credits', '__xp')
+
     # Constructor
     def __init__(self, id: UUID, name: str, email: str, score: int, credits: int, xp: int):
         super().__init__(id)
@@ -75,7 +77,7 @@ class Player(BaseObject):
     def increment_xp(self, value: int = 1):
         """ This method increases XP by a value """
         Guard.against_zero_or_less(value, 'value')
-        self.__xp = value
+        self.__xp += value
 
     @staticmethod
     def get_attributes_list() -> list[PlayerAttribute]:
@@ -89,6 +91,17 @@ class Player(BaseObject):
             PlayerAttribute.XP
         ]
 
+    def get_attributes(self) -> dict[PlayerAttribute, object]:
+        """ This method returns the value of every attribute of the player """
+        return {
+            PlayerAttribute.ID: self.id,
+            PlayerAttribute.NAME: self.name,
+            PlayerAttribute.EMAIL: self.email,
+            PlayerAttribute.SCORE: self.score,
+            PlayerAttribute.CREDITS: self.credits,
+            PlayerAttribute.XP: self.xp
+        }
+
     def __repr__(self) -> str:
         """ This method provides object as string for output """
         return f"""{'*' * 10} {self.id} {'*' * 10}
@@ -0,0 +1,100 @@
+from core.misc.leaderboard import Leaderboard
+from core.objects.player import Player
+from core.shield.guard import Guard
+from core.misc.range import Range
+from typing import Iterable
+from uuid import UUID
+
+
+def _rank_key(player: Player) -> tuple[int, int, UUID]:
+    """ Highest score first, then highest xp, ties broken by id so keys stay unique """
+    return -player.score, -player.xp, player.id
+
+
+class PlayerStore:
+    # Constructor
+    def __init__(self, players: Iterable[Player] = ()):
+        self.__players: dict[UUID, Player] = {}
+        self.__emails: dict[str, UUID] = {}
+
+        # Email and key each player was indexed under, needed to find them again once the player has changed
+        self.__indexed_emails: dict[UUID, str] = {}
+        self.__keys: dict[UUID, tuple[int, int, UUID]] = {}
+        self.__leaderboard: Leaderboard = Leaderboard()
+
+        for player in players:
+            self.add(player)
+
+    def __len__(self) -> int:
+        return len(self.__players)
+
+    def __contains__(self, id: UUID) -> bool:
+        return id in self.__players
+
+    def __iter__(self):
+        return iter(self.__players.values())
+
+    def add(self, player: Player) -> None:
+        if player.id in self.__players:
+            raise ValueError(f"Player {player.id} is already stored.")
+        if player.email.lower() in self.__emails:
+            raise ValueError(f"Email {player.email} is already taken.")
+
+        self.__players[player.id] = player
+        self.__emails[player.email.lower()] = player.id
+        self.__indexed_emails[player.id] = player.email.lower()
+        self.__keys[player.id] = _rank_key(player)
+        self.__leaderboard.add(self.__keys[player.id])
+
+    def remove(self, id: UUID) -> Player:
+        player: Player = self.__players.pop(id)
+        del self.__emails[self.__indexed_emails.pop(id)]
+        self.__leaderboard.remove(self.__keys.pop(id))
+        return player
+
+    def get(self, id: UUID) -> Player | None:
+        return self.__players.get(id)
+
+    def get_by_email(self, email: str) -> Player | None:
+        id: UUID | None = self.__emails.get(email.lower())
+        return None if id is None else self.__players[id]
+
+    def set_score(self, id: UUID, score: int) -> None:
+        """ This method changes the score of a player and re-ranks them """
+        self.__players[id].score = score
+        self.refresh(id)
+
+    def increment_xp(self, id: UUID, value: int = 1) -> None:
+        self.__players[id].increment_xp(value)
+        self.refresh(id)
+
+    def refresh(self, id: UUID) -> None:
+        """ This method re-indexes a player after it was changed directly, in O(log n) """
+        player: Player = self.__players[id]
+
+        email: str = player.email.lower()
+        if email != self.__indexed_emails[id]:
+            if email in self.__emails:
+                raise ValueError(f"Email {player.email} is already taken.")
+            del self.__emails[self.__indexed_emails[id]]
+            self.__emails[email] = id
+            self.__indexed_emails[id] = email
+
+        key: tuple[int, int, UUID] = _rank_key(player)
+        if key != self.__keys[id]:
+            self.__leaderboard.remove(self.__keys[id])
+            self.__leaderboard.add(key)
+            self.__keys[id] = key
+
+    def rank(self, id: UUID) -> int:
+        """ This method returns the 1-based leaderboard rank of a player """
+        return self.__leaderboard.rank(self.__keys[id]) + 1
+
+    def at_rank(self, rank: int) -> Player:
+        """ This method returns the player at a 1-based leaderboard rank """
+        # The leaderboard counts negative indexes from the end, rank 0 would be the last player
+        Guard.against_out_of_range(Range(1, len(self)), rank, 'rank')
+        return self.__players[self.__leaderboard[rank - 1][2]]
+
+    def top(self, count: int) -> list[Player]:
+        return [self.__players[key[2]] for key in self.__leaderboard.top(count)]
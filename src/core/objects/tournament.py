@@ -0,0 +1,251 @@
+from core.misc.rating import INITIAL_RATING, INITIAL_DEVIATION, elo_update, glicko_update, glicko_widen
+from core.enums.tournament_format import TournamentFormat
+from core.shield.guard import Guard
+from math import ceil, log2
+
+# Points of a win, a draw and a bye
+WIN_POINTS: float = 1.0
+DRAW_POINTS: float = 0.5
+BYE_POINTS: float = 1.0
+
+
+class Entrant:
+    __slots__ = ('name', 'elo', 'rating', 'deviation', 'points', 'games', 'blacks', 'byes', 'opponents')
+
+    def __init__(self, name: str, elo: float = INITIAL_RATING, rating: float = INITIAL_RATING, deviation: float = INITIAL_DEVIATION):
+        self.name: str = name
+        self.elo: float = elo
+        self.rating: float = rating
+        self.deviation: float = deviation
+        self.points: float = 0.0
+        self.games: int = 0
+        self.blacks: int = 0
+        self.byes: int = 0
+        self.opponents: set[str] = set()
+
+    def to_dict(self) -> dict:
+        """ This method provides the entrant as plain values for serialization """
+        return {
+            'name': self.name, 'elo': self.elo, 'rating': self.rating, 'deviation': self.deviation, 'points': self.points,
+            'games': self.games, 'blacks': self.blacks, 'byes': self.byes, 'opponents': sorted(self.opponents)
+        }
+
+    @staticmethod
+    def from_dict(values: dict) -> 'Entrant':
+        entrant: Entrant = Entrant(values['name'], values['elo'], values['rating'], values['deviation'])
+        entrant.points = values['points']
+        entrant.games = values['games']
+        entrant.blacks = values['blacks']
+        entrant.byes = values['byes']
+        entrant.opponents = set(values['opponents'])
+        return entrant
+
+    def __repr__(self) -> str:
+        """ This method provides object as string for output """
+        return f"({self.name}: {self.points:g} points, {self.rating:.0f} ± {self.deviation:.0f}, elo {self.elo:.0f})"
+
+
+class Tournament:
+    # Constructor
+    def __init__(self, names: list[str], format: TournamentFormat = TournamentFormat.ROUND_ROBIN, rounds: int | None = None):
+        if len(names) < 2:
+            raise ValueError("A tournament needs at least 2 entrants.")
+        if len(set(names)) != len(names):
+            raise ValueError("Entrant names must be unique.")
+
+        self.__entrants: dict[str, Entrant] = {name: Entrant(name) for name in names}
+        self.__format: TournamentFormat = format
+
+        # Round robin plays everyone once, a bye takes the place of the missing entrant when the count is odd
+        if format == TournamentFormat.ROUND_ROBIN:
+            if rounds is not None and rounds != len(names) - 1 + len(names) % 2:
+                raise ValueError(f"A round robin of {len(names)} entrants has {len(names) - 1 + len(names) % 2} rounds, not {rounds}.")
+            self.__rounds: int = len(names) - 1 + len(names) % 2
+        else:
+            # Enough rounds for a single entrant to be left with a perfect score, unless asked for more or fewer
+            self.__rounds = rounds if rounds is not None else ceil(log2(len(names)))
+            Guard.against_zero_or_less(self.__rounds, 'rounds')
+
+        # Games of the current round as (black, white), the ones still waiting for a result, and its bye
+        self.__round: int = 0
+        self.__pairings: list[tuple[str, str]] = []
+        self.__pending: set[tuple[str, str]] = set()
+        self.__bye: str | None = None
+
+    ###########
+    # Getters #
+    ###########
+
+    @property
+    def format(self) -> TournamentFormat:
+        return self.__format
+
+    @property
+    def rounds(self) -> int:
+        return self.__rounds
+
+    @property
+    def round(self) -> int:
+        """ Number of the current round, 0 before the first one is paired """
+        return self.__round
+
+    @property
+    def pairings(self) -> list[tuple[str, str]]:
+        return list(self.__pairings)
+
+    @property
+    def pending(self) -> list[tuple[str, str]]:
+        """ Games of the current round still waiting for a result, in pairing order """
+        return [pairing for pairing in self.__pairings if pairing in self.__pending]
+
+    @property
+    def bye(self) -> str | None:
+        return self.__bye
+
+    @property
+    def is_round_complete(self) -> bool:
+        return not self.__pending
+
+    @property
+    def is_finished(self) -> bool:
+        return self.__round >= self.__rounds and not self.__pending
+
+    def __len__(self) -> int:
+        return len(self.__entrants)
+
+    def entrant(self, name: str) -> Entrant:
+        return self.__entrants[name]
+
+    def standings(self) -> list[Entrant]:
+        """ This method returns the entrants by points, then by rating """
+        return sorted(self.__entrants.values(), key=lambda entrant: (-entrant.points, -entrant.rating, entrant.name))
+
+    ############
+    # Mutators #
+    ############
+
+    def next_round(self) -> list[tuple[str, str]]:
+        """ This method pairs the next round once the current one is complete and returns its games """
+        if self.__pending:
+            raise ValueError(f"Round {self.__round} still has {len(self.__pending)} games without a result.")
+        if self.__round >= self.__rounds:
+            raise ValueError("Every round of the tournament has been played.")
+
+        self.__round += 1
+        if self.__format == TournamentFormat.ROUND_ROBIN:
+            pairings, bye = self.__round_robin(self.__round)
+        else:
+            pairings, bye = self.__swiss()
+
+        # Ratings get less certain with every round an entrant sits out, a bye included
+        if bye is not None:
+            entrant: Entrant = self.__entrants[bye]
+            entrant.points += BYE_POINTS
+            entrant.byes += 1
+            entrant.deviation = glicko_widen(entrant.deviation)
+
+        self.__pairings = pairings
+        self.__pending = set(pairings)
+        self.__bye = bye
+        return self.pairings
+
+    def record(self, black: str, white: str, result: int) -> None:
+        """ This method applies the result of a game of the current round, result is the disc differential for black """
+        if (black, white) not in self.__pending:
+            raise ValueError(f"{black} - {white} is not a pending game of round {self.__round}.")
+        self.__pending.discard((black, white))
+
+        first: Entrant = self.__entrants[black]
+        second: Entrant = self.__entrants[white]
+        score: float = WIN_POINTS if result > 0 else DRAW_POINTS if result == 0 else 0.0
+
+        # Both ratings move together from the values before the game, nothing is recomputed from the history
+        first.elo, second.elo = elo_update(first.elo, second.elo, score), elo_update(second.elo, first.elo, 1 - score)
+        (first.rating, first.deviation), (second.rating, second.deviation) = (
+            glicko_update(first.rating, first.deviation, second.rating, second.deviation, score),
+            glicko_update(second.rating, second.deviation, first.rating, first.deviation, 1 - score)
+        )
+
+        first.points += score
+        second.points += 1 - score
+        first.games += 1
+        second.games += 1
+        first.blacks += 1
+        first.opponents.add(white)
+        second.opponents.add(black)
+
+    def __round_robin(self, round: int) -> tuple[list[tuple[str, str]], str | None]:
+        """ This method pairs a round with the circle method: the first entrant stays, the others rotate a place per round """
+        names: list[str | None] = list(self.__entrants)
+        if len(names) % 2:
+            names.append(None)
+
+        count: int = len(names)
+        rotation: int = (round - 1) % (count - 1)
+        circle: list[str | None] = names[:1] + names[1 + rotation:] + names[1:1 + rotation]
+
+        pairings: list[tuple[str, str]] = []
+        bye: str | None = None
+        for index in range(count // 2):
+            first, second = circle[index], circle[count - 1 - index]
+            if first is None or second is None:
+                bye = first if second is None else second
+                continue
+
+            # The fixed entrant alternates colours, the others play black on the top half of the circle and rotate through it
+            if index == 0 and round % 2 == 0:
+                first, second = second, first
+            pairings.append((first, second))
+
+        return pairings, bye
+
+    def __swiss(self) -> tuple[list[tuple[str, str]], str | None]:
+        """ This method pairs a round Monrad style: down the standings, each entrant meets the next one it hasn't played """
+        unpaired: list[Entrant] = self.standings()
+        bye: str | None = None
+
+        # The lowest ranked entrant that hasn't had a bye yet sits out an odd round
+        if len(unpaired) % 2:
+            sitting: Entrant = min(reversed(unpaired), key=lambda entrant: entrant.byes)
+            unpaired.remove(sitting)
+            bye = sitting.name
+
+        pairings: list[tuple[str, str]] = []
+        while unpaired:
+            first: Entrant = unpaired.pop(0)
+            # A rematch is only allowed when every remaining entrant was already met
+            index: int = next((index for index, other in enumerate(unpaired) if other.name not in first.opponents), 0)
+            second: Entrant = unpaired.pop(index)
+
+            # Whoever played black less often gets black
+            pairings.append((first.name, second.name) if first.blacks <= second.blacks else (second.name, first.name))
+
+        return pairings, bye
+
+    ###############
+    # Persistence #
+    ###############
+
+    def to_dict(self) -> dict:
+        """ This method provides the whole state as plain values, enough to resume the tournament after a crash """
+        return {
+            'format': self.__format.value,
+            'rounds': self.__rounds,
+            'round': self.__round,
+            'pairings': [list(pairing) for pairing in self.__pairings],
+            'pending': [list(pairing) for pairing in self.pending],
+            'bye': self.__bye,
+            'entrants': [entrant.to_dict() for entrant in self.__entrants.values()]
+        }
+
+    @staticmethod
+    def from_dict(values: dict) -> 'Tournament':
+        entrants: list[Entrant] = [Entrant.from_dict(entrant) for entrant in values['entrants']]
+        tournament: Tournament = Tournament([entrant.name for entrant in entrants], TournamentFormat(values['format']), values['rounds'])
+
+        tournament.__entrants = {entrant.name: entrant for entrant in entrants}
+        tournament.__round = values['round']
+        tournament.__pairings = [tuple(pairing) for pairing in values['pairings']]
+        tournament.__pending = {tuple(pairing) for pairing in values['pending']}
+        tournament.__bye = values['bye']
+        return tournament
@@ -1,9 +1,46 @@
-from string import whitespace
+from core.enums.guard_mode import GuardMode
+from contextlib import contextmanager
 from core.misc.range import Range
 import re
 
+EMAIL_PATTERN: str = r'^[^@\s]+@[^@\s]+\.[^@\s]+$'
+
+# string.whitespace, spelled out so importing the guard doesn't import string
+_WHITESPACE: str = ' \t\n\r\x0b\x0c'
+
+# typing, which most modules load at startup, imports re anyway, so the pattern is compiled up front
+_EMAIL: re.Pattern = re.compile(EMAIL_PATTERN)
+
 
 class Guard:
+    # Strict runs the original checks, fast runs the same checks with C-level helpers,
+    # trusted also lets engine code skip checks the bitboards already guarantee
+    __mode: GuardMode = GuardMode.STRICT
+
+    @staticmethod
+    def get_mode() -> GuardMode:
+        return Guard.__mode
+
+    @staticmethod
+    def set_mode(mode: GuardMode) -> None:
+        Guard.__mode = mode
+
+    @staticmethod
+    @contextmanager
+    def using(mode: GuardMode):
+        """ This method switches the mode for a block, e.g. a bulk import """
+        previous: GuardMode = Guard.__mode
+        Guard.__mode = mode
+        try:
+            yield
+        finally:
+            Guard.__mode = previous
+
+    @staticmethod
+    def trusted() -> bool:
+        """ Engine code asks this before re-checking its own values, user input and loaded files never do """
+        return Guard.__mode is GuardMode.TRUSTED
+
     @staticmethod
     def against_zero_or_less(value: int | float, name: str = 'value') -> None:
         """ This method raises exception if given value is zero or negative """
@@ -37,9 +74,15 @@ class Guard:
     @staticmethod
     def against_whitespace(value: str, name: str = 'value') -> None:
         """ This method raises exception if given value is whitespace """
+        if Guard.__mode is not GuardMode.STRICT:
+            # Also counts unicode spaces as whitespace
+            if not value or value.isspace():
+                raise ValueError(f"{name.capitalize()} can't be whitespace.")
+            return
+
         eligible: bool = False
         for char in value:
-            if char not in whitespace:
+            if char not in _WHITESPACE:
                 eligible = True
                 break
 
@@ -80,8 +123,10 @@ class Guard:
     @staticmethod
     def against_wrong_email(email: str) -> None:
         """ This method raises exception if given email is wrong """
-        pattern = r'^[^@\s]+@[^@\s]+\.[^@\s]+$'
-        valid: bool = bool(re.match(pattern, email))
+        if Guard.__mode is GuardMode.STRICT:
+            valid: bool = bool(re.match(EMAIL_PATTERN, email))
+        else:
+            valid = _EMAIL.match(email) is not None
 
         if not valid:
             raise ValueError(f"{email} has invalid pattern.")
@@ -0,0 +1,56 @@
+from core.misc.bitboard import INITIAL_BLACK, INITIAL_WHITE, PASS, legal_moves, flips
+from array import array
+
+
+class ArchiveGame:
+    __slots__ = ('moves', 'result', 'black', 'white')
+
+    def __init__(self, moves: array, result: int, black: str = '', white: str = ''):
+        # Bit indexes with PASS for a pass, the way Match records them and book and pattern training read them
+        self.moves: array = moves
+        # Final disc differential for black
+        self.result: int = result
+        self.black: str = black
+        self.white: str = white
+
+    def __len__(self) -> int:
+        return len(self.moves)
+
+    def __repr__(self) -> str:
+        """ This method provides object as string for output """
+        return f"(black: {self.black}, white: {self.white}, moves: {len(self.moves)}, result: {self.result:+d})"
+
+
+def replay(squares) -> tuple[array, int]:
+    """ This function plays archived moves from the initial position, inserts the passes archives leave out and
+    returns the moves with the final disc differential for black, an illegal move raises ValueError """
+    moves: array = array('B')
+    player: int = INITIAL_BLACK
+    opponent: int = INITIAL_WHITE
+    black_to_move: bool = True
+
+    for square in squares:
+        if square == PASS:
+            continue
+
+        # Plain ints instead of a Board, and a move flipping discs onto an empty square is legal, so the only
+        # bitboard work per move is its flip mask. Mobility is only computed when a move flips nothing.
+        flipped: int = flips(player, opponent, square) if not (player | opponent) >> square & 1 else 0
+        if not flipped:
+            # Only a side without any move passes, and the move then has to be legal for the other side
+            if legal_moves(player, opponent) or (player | opponent) >> square & 1:
+                raise ValueError(f"Move {len(moves) + 1} on square {square} is not legal.")
+
+            moves.append(PASS)
+            player, opponent = opponent, player
+            black_to_move = not black_to_move
+            flipped = flips(player, opponent, square)
+            if not flipped:
+                raise ValueError(f"Move {len(moves)} on square {square} is not legal.")
+
+        moves.append(square)
+        player, opponent = opponent ^ flipped, player | flipped | (1 << square)
+        black_to_move = not black_to_move
+
+    black, white = (player, opponent) if black_to_move else (opponent, player)
+    return moves, black.bit_count() - white.bit_count()
@@ -0,0 +1,98 @@
+from data.archive.statistics import ImportStatistics
+from data.archive.game import ArchiveGame, replay
+from core.misc.square import INDEXES
+from core.misc.bitboard import PASS
+from pathlib import Path
+from array import array
+import re
+
+# Games look like (;GM[Othello]PB[name]PW[name]TY[8]RE[+12.000]BO[8 ...64 squares... *]B[f5//1.2]W[d6]...;)
+_PROPERTY: re.Pattern = re.compile(r'([A-Z]+)\[([^\]]*)\]')
+
+# Board property of the standard start without its spaces: the size, rows 1 to 8 with '*' black and 'O' white,
+# then the side to move. Writers differ in whether they put spaces between the rows.
+INITIAL_BOARD: str = '8' + '-' * 24 + '---O*------*O---' + '-' * 24 + '*'
+
+
+class GgfReader:
+    # Constructor
+    def __init__(self, path: str | Path, encoding: str = 'latin-1'):
+        self.__path: Path = Path(path)
+        self.__encoding: str = encoding
+
+    ###########
+    # Getters #
+    ###########
+
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    def games(self, statistics: ImportStatistics | None = None, validate: bool = True):
+        """ This method yields every standard 8x8 game of the file as an ArchiveGame, the others are skipped and counted.
+        Validation replays every game to check legality and insert passes the file leaves out. """
+        statistics = statistics if statistics is not None else ImportStatistics(str(self.__path))
+
+        # Read a line at a time, a game spanning several lines is collected until its closing ';)'
+        with open(self.__path, 'r', encoding=self.__encoding) as file:
+            pending: str = ''
+            for line in file:
+                pending += line.strip()
+
+                while True:
+                    start: int = pending.find('(;')
+                    end: int = pending.find(';)', start + 2)
+                    if start < 0 or end < 0:
+                        break
+
+                    game: ArchiveGame | None = self.__parse(pending[start + 2:end], statistics, validate)
+                    if game is not None:
+                        yield game
+                    pending = pending[end + 2:]
+
+                if '(;' not in pending:
+                    pending = ''
+
+    @staticmethod
+    def __parse(text: str, statistics: ImportStatistics, validate: bool) -> ArchiveGame | None:
+        """ This method converts the properties of one game, None when it is skipped """
+        statistics.games += 1
+        properties: dict[str, str] = {}
+        moves: array = array('B')
+
+        for name, value in _PROPERTY.findall(text):
+            if name == 'B' or name == 'W':
+                # Moves carry an optional evaluation and time after slashes, e.g. 'f5/1.20/0.03'
+                label: str = value.split('/', 1)[0].upper()
+                square: int | None = PASS if label == 'PA' else INDEXES.get(label)
+                if square is None:
+                    statistics.skip('invalid move label')
+                    return None
+                moves.append(square)
+            else:
+                properties[name] = value
+
+        if properties.get('GM', 'Othello') != 'Othello' or properties.get('TY', '8') != '8' or \
+                ''.join(properties.get('BO', INITIAL_BOARD).split()) != INITIAL_BOARD:
+            statistics.skip('unsupported variant')
+            return None
+
+        # Results are black's disc differential, a ':r', ':t' or ':s' suffix marks a resigned, timed out or agreed game.
+        # Those end before the board is full, they are imported with the result the server recorded for them.
+        outcome: str = properties.get('RE', '?').split(':', 1)[0]
+        try:
+            result: int = round(float(outcome))
+        except ValueError:
+            statistics.skip('unfinished game')
+            return None
+
+        if validate:
+            try:
+                moves, _ = replay(moves)
+            except ValueError:
+                statistics.skip('illegal move')
+                return None
+
+        statistics.imported += 1
+        statistics.moves += len(moves) - moves.count(PASS)
+        return ArchiveGame(moves, result, properties.get('PB', ''), properties.get('PW', ''))
@@ -0,0 +1,30 @@
+from data.archive.statistics import ImportStatistics
+from data.archive.selfplay import SelfplayReader
+from data.archive.wthor import WthorFile
+from data.archive.ggf import GgfReader
+from pathlib import Path
+
+# Archive formats by file suffix
+WTHOR_SUFFIXES: tuple[str, ...] = ('.wtb',)
+GGF_SUFFIXES: tuple[str, ...] = ('.ggf',)
+SELFPLAY_SUFFIXES: tuple[str, ...] = ('.jsonl',)
+
+
+def is_archive(path: str | Path) -> bool:
+    return Path(path).suffix.lower() in WTHOR_SUFFIXES + GGF_SUFFIXES + SELFPLAY_SUFFIXES
+
+def read_archive(path: str | Path, statistics: ImportStatistics | None = None, validate: bool = True):
+    """ This function yields the games of a WTHOR, GGF or selfplay JSONL file, picked by its suffix """
+    path = Path(path)
+    suffix: str = path.suffix.lower()
+
+    if suffix in WTHOR_SUFFIXES:
+        with WthorFile(path) as archive:
+            yield from archive.games(statistics, validate)
+    elif suffix in GGF_SUFFIXES:
+        yield from GgfReader(path).games(statistics, validate)
+    elif suffix in SELFPLAY_SUFFIXES:
+        yield from SelfplayReader(path).games(statistics, validate)
+    else:
+        raise ValueError(f"{path} is not a WTHOR ({', '.join(WTHOR_SUFFIXES)}), GGF ({', '.join(GGF_SUFFIXES)}) "
+                         f"or selfplay ({', '.join(SELFPLAY_SUFFIXES)}) archive.")
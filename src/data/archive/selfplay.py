@@ -0,0 +1,51 @@
+from data.archive.statistics import ImportStatistics
+from data.archive.game import ArchiveGame, replay
+from core.misc.square import parse_moves
+from core.misc.bitboard import PASS
+from pathlib import Path
+from array import array
+import json
+
+
+class SelfplayReader:
+    # Constructor
+    def __init__(self, path: str | Path):
+        self.__path: Path = Path(path)
+
+    ###########
+    # Getters #
+    ###########
+
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    def games(self, statistics: ImportStatistics | None = None, validate: bool = True):
+        """ This method yields every game the selfplay launcher wrote, one JSON record per line, as an ArchiveGame.
+        Validation replays every game to check legality, unreadable records are skipped and counted. """
+        statistics = statistics if statistics is not None else ImportStatistics(str(self.__path))
+
+        with open(self.__path, 'r', encoding='utf-8') as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                statistics.games += 1
+
+                try:
+                    record: dict = json.loads(line)
+                    moves: array = parse_moves(record['moves'])
+                    result: int = int(record['result'])
+                except (ValueError, KeyError, TypeError):
+                    statistics.skip('invalid record')
+                    continue
+
+                if validate:
+                    try:
+                        moves, _ = replay(moves)
+                    except ValueError:
+                        statistics.skip('illegal move')
+                        continue
+
+                statistics.imported += 1
+                statistics.moves += len(moves) - moves.count(PASS)
+                yield ArchiveGame(moves, result, record.get('black_engine', ''), record.get('white_engine', ''))
@@ -0,0 +1,23 @@
+class ImportStatistics:
+    # Constructor
+    def __init__(self, source: str):
+        self.source: str = source
+        self.games: int = 0
+        self.imported: int = 0
+        self.moves: int = 0
+
+        # Skipped games per reason, e.g. 'illegal move' or 'unsupported variant'
+        self.skipped: dict[str, int] = {}
+
+    @property
+    def skipped_count(self) -> int:
+        return sum(self.skipped.values())
+
+    def skip(self, reason: str) -> None:
+        """ This method counts a game that was read but not imported """
+        self.skipped[reason] = self.skipped.get(reason, 0) + 1
+
+    def __repr__(self) -> str:
+        """ This method provides object as string for output """
+        reasons: str = ', '.join(f"{reason}: {count}" for reason, count in sorted(self.skipped.items()))
+        return f"({self.source}: {self.imported}/{self.games} games imported, {self.moves} moves, skipped {{{reasons}}})"
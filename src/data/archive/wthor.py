@@ -0,0 +1,139 @@
+from data.archive.statistics import ImportStatistics
+from data.archive.game import ArchiveGame, replay
+from core.misc.bitboard import PASS
+from pathlib import Path
+from array import array
+import numpy as np
+import struct
+import mmap
+
+# File layout: a 16-byte header, then fixed-size game records
+# Header: creation century, year, month, day, game count, player/tournament count, games' year, board size, solitaire flag, depth
+HEADER: struct.Struct = struct.Struct('<BBBBIHHBBBx')
+RECORD: np.dtype = np.dtype([
+    ('tournament', '<u2'),
+    ('black', '<u2'),
+    ('white', '<u2'),
+    ('black_discs', 'u1'),      # Black's final discs, empty squares counted for the winner
+    ('theoretical', 'u1'),      # Black's discs under perfect play from the position `depth` empties before the end
+    ('moves', 'u1', (60,))      # 10 * row + column, both 1-based, 0 after the last move
+])
+
+# WTHOR move codes to bit indexes, 0 ends the game and every code that isn't a square is marked invalid
+END: int = 0xFE
+INVALID: int = 0xFF
+_CODES: np.ndarray = np.full(256, INVALID, dtype=np.uint8)
+_CODES[0] = END
+for _row in range(1, 9):
+    for _column in range(1, 9):
+        _CODES[10 * _row + _column] = (_row - 1) * 8 + _column - 1
+
+
+class WthorFile:
+    # Constructor
+    def __init__(self, path: str | Path):
+        self.__path: Path = Path(path)
+
+        # The file is mapped read-only, records are read in place and only the pages in use stay resident
+        with open(self.__path, 'rb') as file:
+            self.__map: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self.__map) < HEADER.size:
+            self.close()
+            raise ValueError(f"{self.__path} is too short for a WTHOR header.")
+
+        _, _, _, _, count, _, self.__year, size, solitaire, self.__depth = HEADER.unpack_from(self.__map, 0)
+        if size not in (0, 8) or solitaire:
+            self.close()
+            raise ValueError(f"{self.__path} is not an 8x8 WTHOR game file.")
+
+        # Some writers leave the count at 0 or append games without updating it, the file size is what holds
+        self.__declared: int = count
+        self.__count: int = (len(self.__map) - HEADER.size) // RECORD.itemsize
+
+    ###########
+    # Getters #
+    ###########
+
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    @property
+    def year(self) -> int:
+        return self.__year
+
+    @property
+    def depth(self) -> int:
+        """ Empties left when the theoretical scores were computed """
+        return self.__depth
+
+    @property
+    def declared_count(self) -> int:
+        """ Game count written in the header """
+        return self.__declared
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def records(self) -> np.ndarray:
+        """ This method returns the game records as a structured array viewing the mapped file, nothing is copied """
+        return np.frombuffer(self.__map, dtype=RECORD, count=self.__count, offset=HEADER.size)
+
+    def squares(self) -> np.ndarray:
+        """ This method returns a (games, 60) array of bit indexes, END after the last move and INVALID for bad codes """
+        return _CODES[self.records()['moves']]
+
+    def games(self, statistics: ImportStatistics | None = None, validate: bool = True, chunk: int = 65536):
+        """ This method yields every game as an ArchiveGame, broken records are skipped and counted in the statistics.
+        Validation replays every game to insert passes and check legality, without it passes stay missing and the
+        result is the one recorded in the file. """
+        statistics = statistics if statistics is not None else ImportStatistics(str(self.__path))
+        records: np.ndarray = self.records()
+
+        # Decoded a chunk at a time, memory stays flat however large the file is
+        for start in range(0, self.__count, chunk):
+            block: np.ndarray = records[start:start + chunk]
+            squares: np.ndarray = _CODES[block['moves']]
+            lengths: np.ndarray = np.argmax(squares == END, axis=1)
+            lengths[(squares != END).all(axis=1)] = 60
+            broken: np.ndarray = (squares == INVALID).any(axis=1)
+
+            # Plain lists for the per-game loop, indexing numpy arrays one element at a time is slow
+            data: bytes = squares.tobytes()
+            fields: zip = zip(lengths.tolist(), broken.tolist(), block['black_discs'].tolist(),
+                              block['black'].tolist(), block['white'].tolist())
+
+            for index, (length, invalid, black_discs, black, white) in enumerate(fields):
+                statistics.games += 1
+                if invalid:
+                    statistics.skip('invalid move code')
+                    continue
+
+                moves: array = array('B', data[60 * index:60 * index + length])
+                recorded: int = 2 * black_discs - 64
+
+                if validate:
+                    try:
+                        played, result = replay(moves)
+                    except ValueError:
+                        statistics.skip('illegal move')
+                        continue
+                    # Recorded scores give the empty squares to the winner, a replay counts only the discs
+                    if (result > 0) != (recorded > 0) or (result < 0) != (recorded < 0):
+                        statistics.skip('result mismatch')
+                        continue
+                    moves = played
+
+                statistics.imported += 1
+                statistics.moves += len(moves) - moves.count(PASS)
+                yield ArchiveGame(moves, recorded, str(black), str(white))
+
+    def close(self) -> None:
+        self.__map.close()
+
+    def __enter__(self) -> 'WthorFile':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
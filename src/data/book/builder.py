@@ -0,0 +1,92 @@
+from data.book.opening_book import HEADER, MAGIC, RECORD, VERSION, OpeningBook, book_key
+from core.misc.bitboard import PASS
+from core.misc.symmetry import transform_square
+from core.enums.coin_state import CoinState
+from core.objects.board import Board
+from core.shield.guard import Guard
+from pathlib import Path
+
+
+class BookBuilder:
+    # Constructor
+    def __init__(self, depth: int = 20, min_count: int = 1):
+        Guard.against_zero_or_less(depth, 'depth')
+        self.__depth: int = depth
+
+        Guard.against_zero_or_less(min_count, 'min count')
+        self.__min_count: int = min_count
+
+        # key -> canonical move -> [games, summed final disc differential for the side to move]
+        self.__stats: dict[int, dict[int, list[int]]] = {}
+
+    ###########
+    # Getters #
+    ###########
+
+    @property
+    def depth(self) -> int:
+        return self.__depth
+
+    def __len__(self) -> int:
+        return len(self.__stats)
+
+    def add_game(self, moves: list[int], result: int) -> None:
+        """ This method records the opening of a game, result is the final disc differential for black """
+        board: Board = Board()
+
+        for move in moves[:self.__depth]:
+            # Game records may leave forced passes out
+            if move == PASS or board.must_pass:
+                board.pass_turn()
+                if move == PASS:
+                    continue
+
+            key, transform_id = book_key(board.player, board.opponent)
+            canonical_move: int = transform_square(move, transform_id)
+            stats: list[int] = self.__stats.setdefault(key, {}).setdefault(canonical_move, [0, 0])
+
+            stats[0] += 1
+            stats[1] += result if board.turn == CoinState.BLACK else -result
+
+            board.play(move)
+
+    def add_book(self, book: OpeningBook) -> None:
+        """ This method seeds the statistics with an existing book so it can grow instead of being rebuilt """
+        for index in range(len(book)):
+            key, move, score, count = book.record(index)
+            stats: list[int] = self.__stats.setdefault(key, {}).setdefault(move, [0, 0])
+            stats[0] += count
+            stats[1] += score * count
+
+    def records(self) -> list[tuple[int, int, int, int]]:
+        """ This method picks the best move of every position seen often enough, sorted by key """
+        records: list[tuple[int, int, int, int]] = []
+
+        for key, moves in self.__stats.items():
+            played: list[tuple[int, list[int]]] = [(move, stats) for move, stats in moves.items() if stats[0] >= self.__min_count]
+            if not played:
+                continue
+
+            # Best average result, the more often played move wins ties. The count is the move's own, so a book
+            # seeded back through add_book carries the same sample size the score was averaged over
+            move, (count, total) = max(played, key=lambda item: (item[1][1] / item[1][0], item[1][0]))
+            records.append((key, move, round(total / count), count))
+
+        records.sort()
+        return records
+
+    def write(self, path: str | Path) -> int:
+        """ This method writes the book file and returns the number of records """
+        records: list[tuple[int, int, int, int]] = self.records()
+
+        # Written next to the target and renamed over it, so readers never map a half-written book
+        path = Path(path)
+        temporary: Path = path.with_suffix(path.suffix + '.tmp')
+
+        with open(temporary, 'wb') as file:
+            file.write(HEADER.pack(MAGIC, VERSION, len(records)))
+            for key, move, score, count in records:
+                file.write(RECORD.pack(key, move, max(-64, min(64, score)), min(count, 0xFFFFFFFF)))
+
+        temporary.replace(path)
+        return len(records)
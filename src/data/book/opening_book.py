@@ -0,0 +1,105 @@
+from core.misc.symmetry import canonical, restore_square
+from core.misc.zobrist import hash_of
+from core.objects.board import Board
+from pathlib import Path
+import struct
+import mmap
+
+# File layout: a 16-byte header, then fixed-size records sorted by key
+MAGIC: bytes = b'RVBK'
+VERSION: int = 1
+HEADER: struct.Struct = struct.Struct('<4sHxxQ')           # magic, version, record count
+RECORD: struct.Struct = struct.Struct('<QBxhI')            # key, move, score, count
+KEY: struct.Struct = struct.Struct('<Q')
+
+
+def book_key(player: int, opponent: int) -> tuple[int, int]:
+    """ This function returns the key of a position's canonical image and the transform producing it """
+    player, opponent, transform_id = canonical(player, opponent)
+    return hash_of(player, opponent, 0), transform_id
+
+
+class BookEntry:
+    def __init__(self, move: int, score: int, count: int):
+        self.move: int = move
+        self.score: int = score
+        self.count: int = count
+
+    def __repr__(self) -> str:
+        """ This method provides object as string for output """
+        return f"(move: {self.move}, score: {self.score}, count: {self.count})"
+
+
+class OpeningBook:
+    # Constructor
+    def __init__(self, path: str | Path):
+        self.__path: Path = Path(path)
+
+        # The file is mapped read-only, so every process using the book shares the same pages
+        with open(self.__path, 'rb') as file:
+            self.__map: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.__size = HEADER.unpack_from(self.__map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{self.__path} is not a version {VERSION} opening book.")
+
+        if HEADER.size + self.__size * RECORD.size > len(self.__map):
+            self.close()
+            raise ValueError(f"{self.__path} is truncated.")
+
+    ###########
+    # Getters #
+    ###########
+
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def record(self, index: int) -> tuple[int, int, int, int]:
+        """ This method returns (key, move, score, count) of a record, the move in canonical orientation """
+        return RECORD.unpack_from(self.__map, HEADER.size + index * RECORD.size)
+
+    def find(self, key: int) -> int | None:
+        """ This method binary searches the record index of a key """
+        low: int = 0
+        high: int = self.__size - 1
+
+        while low <= high:
+            middle: int = (low + high) // 2
+            found: int = KEY.unpack_from(self.__map, HEADER.size + middle * RECORD.size)[0]
+
+            if found < key:
+                low = middle + 1
+            elif found > key:
+                high = middle - 1
+            else:
+                return middle
+
+        return None
+
+    def lookup(self, board: Board) -> BookEntry | None:
+        """ This method returns the book move for the side to move, None if the position is not in the book """
+        key, transform_id = book_key(board.player, board.opponent)
+        index: int | None = self.find(key)
+        if index is None:
+            return None
+
+        _, move, score, count = self.record(index)
+
+        # Moves are stored for the canonical image, so they are mapped back onto the real board
+        return BookEntry(restore_square(move, transform_id), score, count)
+
+    def close(self) -> None:
+        """ This method releases the mapping """
+        self.__map.close()
+
+    def __enter__(self) -> 'OpeningBook':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
@@ -0,0 +1,41 @@
+from core.enums.attributes.player import PlayerAttribute
+from core.objects.player_store import PlayerStore
+from data.csv_handler.writer import CsvWriter
+from data.csv_handler.reader import CsvReader
+from core.enums.guard_mode import GuardMode
+from core.shield.guard import Guard
+from core.objects.player import Player
+from pathlib import Path
+from uuid import UUID
+
+
+def save_players(store: PlayerStore, path: str | Path, batch_size: int = 10000) -> None:
+    """ This function writes every player of a store, replacing the file in one go """
+    path = Path(path)
+
+    # Written next to the target and renamed over it, so an interrupted save keeps the previous profiles
+    temporary: Path = path.with_suffix(path.suffix + '.tmp')
+    temporary.unlink(missing_ok=True)
+    with CsvWriter(temporary, Player.get_attributes_list(), batch_size) as writer:
+        for player in store:
+            writer.write(player.get_attributes())
+    temporary.replace(path)
+
+
+def load_players(path: str | Path) -> PlayerStore:
+    """ This function reads the players saved in a file into a new store """
+    store: PlayerStore = PlayerStore()
+
+    # Every profile is still validated, with the precompiled checks
+    with Guard.using(GuardMode.FAST):
+        for row in CsvReader(path).rows(Player.get_attributes_list()):
+            store.add(Player(
+                UUID(row[PlayerAttribute.ID]),
+                row[PlayerAttribute.NAME],
+                row[PlayerAttribute.EMAIL],
+                int(row[PlayerAttribute.SCORE]),
+                int(row[PlayerAttribute.CREDITS]),
+                int(row[PlayerAttribute.XP])
+            ))
+
+    return store
@@ -0,0 +1,39 @@
+from pathlib import Path
+from enum import Enum
+import csv
+
+
+class CsvReader:
+    # Constructor
+    def __init__(self, path: str | Path):
+        self.__path: Path = Path(path)
+
+    ###########
+    # Getters #
+    ###########
+
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    @property
+    def columns(self) -> list[str]:
+        with open(self.__path, newline='', encoding='utf-8') as file:
+            return next(csv.reader(file), [])
+
+    def rows(self, columns: list[Enum] | None = None):
+        """ This method yields one dict per row holding only the requested columns, reading a line at a time """
+        with open(self.__path, newline='', encoding='utf-8') as file:
+            reader = csv.reader(file)
+            header: list[str] = next(reader, [])
+
+            names: list[str] = [column.value for column in columns] if columns else header
+            missing: list[str] = [name for name in names if name not in header]
+            if missing:
+                raise ValueError(f"{self.__path} has no column {', '.join(missing)}.")
+
+            keys: list = columns if columns else header
+            indexes: list[int] = [header.index(name) for name in names]
+
+            for record in reader:
+                yield {key: record[index] for key, index in zip(keys, indexes)}
@@ -0,0 +1,59 @@
+from core.enums.attributes.match import MatchAttribute
+from data.csv_handler.reader import CsvReader
+from pathlib import Path
+
+
+class PlayerStatistics:
+    def __init__(self):
+        self.games: int = 0
+        self.wins: int = 0
+        self.draws: int = 0
+
+    @property
+    def losses(self) -> int:
+        return self.games - self.wins - self.draws
+
+    @property
+    def win_rate(self) -> float:
+        """ Share of points scored, a draw counts half """
+        return (self.wins + self.draws / 2) / self.games if self.games else 0.0
+
+
+class MatchStatistics:
+    # Constructor
+    def __init__(self):
+        self.games: int = 0
+        self.total_length: int = 0
+        self.players: dict[str, PlayerStatistics] = {}
+
+    @property
+    def average_length(self) -> float:
+        return self.total_length / self.games if self.games else 0.0
+
+    def win_rate(self, player: str) -> float:
+        return self.players[player].win_rate if player in self.players else 0.0
+
+    def add(self, black: str, white: str, result: int, length: int) -> None:
+        """ This method counts a single match, result is the disc differential for black """
+        self.games += 1
+        self.total_length += length
+
+        for player, sign in ((black, 1), (white, -1)):
+            statistics: PlayerStatistics = self.players.setdefault(player, PlayerStatistics())
+            statistics.games += 1
+            if result == 0:
+                statistics.draws += 1
+            elif result * sign > 0:
+                statistics.wins += 1
+
+    @staticmethod
+    def from_csv(path: str | Path) -> 'MatchStatistics':
+        """ This method aggregates a match history in one streaming pass, reading only the needed columns """
+        statistics: MatchStatistics = MatchStatistics()
+        columns: list[MatchAttribute] = [MatchAttribute.BLACK, MatchAttribute.WHITE, MatchAttribute.RESULT, MatchAttribute.LENGTH]
+
+        for row in CsvReader(path).rows(columns):
+            statistics.add(row[MatchAttribute.BLACK], row[MatchAttribute.WHITE],
+                           int(row[MatchAttribute.RESULT]), int(row[MatchAttribute.LENGTH]))
+
+        return statistics
@@ -0,0 +1,71 @@
+from core.shield.guard import Guard
+from pathlib import Path
+from enum import Enum
+import csv
+
+
+class CsvWriter:
+    # Constructor
+    def __init__(self, path: str | Path, attributes: list[Enum], batch_size: int = 1000):
+        Guard.against_empty(attributes, 'attributes')
+        Guard.against_zero_or_less(batch_size, 'batch size')
+
+        self.__path: Path = Path(path)
+        self.__attributes: list[Enum] = attributes
+        self.__batch_size: int = batch_size
+        self.__batch: list[list] = []
+
+        # Appending keeps existing history, the header is only written to a new file
+        new: bool = not self.__path.exists() or self.__path.stat().st_size == 0
+        self.__file = open(self.__path, 'a', newline='', encoding='utf-8')
+        self.__writer = csv.writer(self.__file)
+
+        if new:
+            self.__writer.writerow([attribute.value for attribute in attributes])
+        else:
+            self._check_header()
+
+    ###########
+    # Getters #
+    ###########
+
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    @property
+    def attributes(self) -> list[Enum]:
+        return self.__attributes
+
+    def write(self, row: dict[Enum, object]) -> None:
+        """ This method queues a row, rows reach the file in batches """
+        self.__batch.append([row.get(attribute, '') for attribute in self.__attributes])
+
+        if len(self.__batch) >= self.__batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """ This method writes the queued rows """
+        if self.__batch:
+            self.__writer.writerows(self.__batch)
+            self.__batch = []
+        self.__file.flush()
+
+    def close(self) -> None:
+        self.flush()
+        self.__file.close()
+
+    def _check_header(self) -> None:
+        """ This method refuses to append to a file whose columns differ """
+        with open(self.__path, newline='', encoding='utf-8') as file:
+            header: list[str] = next(csv.reader(file), [])
+
+        if header != [attribute.value for attribute in self.__attributes]:
+            self.__file.close()
+            raise ValueError(f"{self.__path} has columns {header}, expected {[a.value for a in self.__attributes]}.")
+
+    def __enter__(self) -> 'CsvWriter':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -0,0 +1,156 @@
+from core.enums.coin_state import CoinState
+from core.objects.board import Board
+from core.misc.bitboard import PASS
+from pathlib import Path
+from uuid import UUID
+import struct
+import zlib
+import os
+
+# File layout: a 60-byte header holding the base position, then a journal of 2-byte move records
+MAGIC: bytes = b'RVSV'
+VERSION: int = 1
+HEADER: struct.Struct = struct.Struct('<4sHBxQQ16s16sI')    # magic, version, turn, black, white, black id, white id, crc
+RECORD: struct.Struct = struct.Struct('<BB')                # move, check
+
+
+def _check(seed: int, ply: int, move: int) -> int:
+    """ This function returns the check byte of the journal record at a ply """
+    return (seed ^ (ply * 0x9D) ^ (move * 0x3B)) & 0xFF
+
+
+class SaveFile:
+    # Constructor
+    def __init__(self, path: Path, base: Board, black: UUID, white: UUID, seed: int):
+        self.__path: Path = path
+        self.__base: Board = base
+        self.__board: Board = base.copy()
+        self.__black: UUID = black
+        self.__white: UUID = white
+        self.__moves: list[int] = []
+
+        # Check bytes are derived from the header crc, so a journal can't be replayed onto another header
+        self.__seed: int = seed
+        self.__truncated: int = 0
+
+    ###########
+    # Getters #
+    ###########
+
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    @property
+    def board(self) -> Board:
+        """ Latest state of the game """
+        return self.__board
+
+    @property
+    def base(self) -> Board:
+        """ State the journal starts from """
+        return self.__base
+
+    @property
+    def black(self) -> UUID:
+        return self.__black
+
+    @property
+    def white(self) -> UUID:
+        return self.__white
+
+    @property
+    def moves(self) -> list[int]:
+        return list(self.__moves)
+
+    @property
+    def truncated(self) -> int:
+        """ Bytes of corrupt journal tail dropped while loading """
+        return self.__truncated
+
+    @staticmethod
+    def create(path: str | Path, board: Board, black: UUID, white: UUID) -> 'SaveFile':
+        """ This method writes a new save whose journal starts from the given board """
+        path = Path(path)
+        header: bytes = SaveFile._header(board, black, white)
+
+        # Written next to the target and renamed over it, so an interrupted write never leaves a broken save
+        temporary: Path = path.with_suffix(path.suffix + '.tmp')
+        with open(temporary, 'wb') as file:
+            file.write(header)
+            file.flush()
+            os.fsync(file.fileno())
+        temporary.replace(path)
+
+        return SaveFile(path, board.copy(), black, white, zlib.crc32(header) & 0xFF)
+
+    @staticmethod
+    def load(path: str | Path) -> 'SaveFile':
+        """ This method reads a save, replays its journal and cuts off a corrupt tail """
+        path = Path(path)
+        with open(path, 'rb') as file:
+            data: bytes = file.read()
+
+        if len(data) < HEADER.size:
+            raise ValueError(f"{path} is too short to be a save file.")
+
+        magic, version, turn, black, white, black_id, white_id, crc = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} save file.")
+        if zlib.crc32(data[:HEADER.size - 4]) != crc:
+            raise ValueError(f"{path} has a corrupt header.")
+        if black & white or turn not in (CoinState.BLACK.value, CoinState.WHITE.value):
+            raise ValueError(f"{path} holds an impossible position.")
+
+        save: SaveFile = SaveFile(path, Board(black, white, CoinState(turn)), UUID(bytes=black_id), UUID(bytes=white_id),
+                                  zlib.crc32(data[:HEADER.size]) & 0xFF)
+        valid: int = save._replay(data[HEADER.size:])
+
+        # Everything after the last record that checks out and replays legally is dropped
+        end: int = HEADER.size + valid
+        if end < len(data):
+            save.__truncated = len(data) - end
+            with open(path, 'r+b') as file:
+                file.truncate(end)
+
+        return save
+
+    def append(self, move: int) -> None:
+        """ This method plays a move on the saved board and journals it with a 2-byte append """
+        self.__board.play(move)
+        self.__moves.append(move)
+
+        with open(self.__path, 'ab') as file:
+            file.write(RECORD.pack(move, _check(self.__seed, len(self.__moves), move)))
+
+    def compact(self) -> None:
+        """ This method rewrites the header with the latest state and empties the journal """
+        compacted: SaveFile = SaveFile.create(self.__path, self.__board, self.__black, self.__white)
+
+        self.__base = compacted.base
+        self.__moves = []
+        self.__seed = compacted.__seed
+
+    def _replay(self, journal: bytes) -> int:
+        """ This method replays journal records onto the board and returns the length of the valid part """
+        for offset in range(0, len(journal) - RECORD.size + 1, RECORD.size):
+            move, check = RECORD.unpack_from(journal, offset)
+            ply: int = len(self.__moves) + 1
+
+            if check != _check(self.__seed, ply, move):
+                return offset
+            if move != PASS and not self.__board.is_legal(move):
+                return offset
+            if move == PASS and not self.__board.must_pass:
+                return offset
+
+            self.__board.play(move)
+            self.__moves.append(move)
+
+        return len(self.__moves) * RECORD.size
+
+    @staticmethod
+    def _header(board: Board, black: UUID, white: UUID) -> bytes:
+        """ This method packs the header, its crc covers every field before it """
+        fields: bytes = HEADER.pack(MAGIC, VERSION, board.turn.value, board.black, board.white, black.bytes, white.bytes, 0)
+        return fields[:-4] + struct.pack('<I', zlib.crc32(fields[:-4]))
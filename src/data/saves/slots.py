@@ -0,0 +1,63 @@
+from data.saves.save_file import SaveFile
+from core.shield.guard import Guard
+from core.objects.board import Board
+from pathlib import Path
+from uuid import UUID
+
+# Saves live next to this module: general/ for autosaves, slots/ for user-controlled slots
+SAVES_ROOT: Path = Path(__file__).resolve().parent
+EXTENSION: str = '.rvs'
+AUTOSAVE: str = 'autosave'
+
+
+class SaveSlots:
+    # Constructor
+    def __init__(self, root: str | Path = SAVES_ROOT):
+        self.__root: Path = Path(root)
+
+    ###########
+    # Getters #
+    ###########
+
+    @property
+    def general(self) -> Path:
+        return self.__root / 'general'
+
+    @property
+    def slots(self) -> Path:
+        return self.__root / 'slots'
+
+    def slot_path(self, slot: int) -> Path:
+        """ This method returns the file of a numbered slot """
+        Guard.against_zero_or_less(slot, 'slot')
+        return self.slots / f'slot-{slot}{EXTENSION}'
+
+    def autosave_path(self) -> Path:
+        return self.general / f'{AUTOSAVE}{EXTENSION}'
+
+    def used_slots(self) -> list[int]:
+        """ This method lists the numbered slots holding a save """
+        if not self.slots.exists():
+            return []
+
+        # Stray files matching the pattern, e.g. 'slot-old.rvs', aren't slots
+        numbers: list[str] = [path.stem.removeprefix('slot-') for path in self.slots.glob(f'slot-*{EXTENSION}')]
+        return sorted(int(number) for number in numbers if number.isdigit())
+
+    def start_autosave(self, board: Board, black: UUID, white: UUID) -> SaveFile:
+        """ This method starts the autosave of a new game, every move is then appended to it """
+        self.general.mkdir(parents=True, exist_ok=True)
+        return SaveFile.create(self.autosave_path(), board, black, white)
+
+    def save_to_slot(self, slot: int, save: SaveFile) -> SaveFile:
+        """ This method copies a game into a slot as a compact snapshot """
+        self.slots.mkdir(parents=True, exist_ok=True)
+        return SaveFile.create(self.slot_path(slot), save.board, save.black, save.white)
+
+    def load_autosave(self) -> SaveFile | None:
+        path: Path = self.autosave_path()
+        return SaveFile.load(path) if path.exists() else None
+
+    def load_slot(self, slot: int) -> SaveFile | None:
+        path: Path = self.slot_path(slot)
+        return SaveFile.load(path) if path.exists() else None
@@ -0,0 +1,24 @@
+from core.objects.tournament import Tournament
+from pathlib import Path
+import json
+import os
+
+
+def save_tournament(tournament: Tournament, path: str | Path, settings: dict | None = None) -> None:
+    """ This function checkpoints a tournament with the settings needed to resume it, replacing the file in one go """
+    path = Path(path)
+
+    # Written and synced next to the target before being renamed over it, a crash leaves either checkpoint intact
+    temporary: Path = path.with_suffix(path.suffix + '.tmp')
+    with open(temporary, 'w') as file:
+        json.dump({'settings': settings or {}, 'tournament': tournament.to_dict()}, file)
+        file.flush()
+        os.fsync(file.fileno())
+    temporary.replace(path)
+
+def load_tournament(path: str | Path) -> tuple[Tournament, dict]:
+    """ This function reads a checkpoint back into the tournament and its settings """
+    with open(path) as file:
+        values: dict = json.load(file)
+
+    return Tournament.from_dict(values['tournament']), values['settings']
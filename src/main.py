@@ -1,17 +1,39 @@
-from prototype.text.menu.main_menu import *
-from prototype.text.message import Message
-from core.misc.func import clear_screen
+from importlib import import_module
+import sys
 
-if __name__ == '__main__':
-    menu: MainMenu = MainMenu()
-    option: MainMenuOption | None = None
+# Every command's launcher module, imported only when the command runs, so a launch pays for the one it starts
+LAUNCHERS: dict[str, str] = {
+    # Interactive menus, the default without a command
+    'console': 'prototype.launcher.console',
+    # Headless engine matches, e.g. `python main.py selfplay --games 1000`
+    'selfplay': 'prototype.launcher.selfplay',
+    # Pattern weights fitted on a match history, e.g. `python main.py train history.csv --output weights.bin`
+    'train': 'prototype.launcher.train',
+    # Engine games drawn live in the terminal, e.g. `python main.py spectate --a-budget 0.05`
+    'spectate': 'prototype.launcher.spectate',
+    # Games against the engine over TCP, e.g. `python main.py serve --port 7878`
+    'serve': 'prototype.launcher.serve',
+    # Simultaneous network games reporting move latency, e.g. `python main.py loadtest --connections 1000`
+    'loadtest': 'prototype.launcher.loadtest',
+    # Rated engine tournaments resumed from their checkpoint, e.g. `python main.py tournament entrants.json --format swiss`
+    'tournament': 'prototype.launcher.tournament',
+    # A game against the engine in the terminal, pondering on your time, e.g. `python main.py play --color white`
+    'play': 'prototype.launcher.play'
+}
+
+
+def launch(argv: list[str]) -> int:
+    """ This function imports the launcher of the command in argv and runs it with the remaining arguments """
+    # Import times of a command's launcher, e.g. `python main.py --profile-startup selfplay`
+    if argv[:1] == ['--profile-startup']:
+        from prototype.launcher.startup import main as profile
+        command: str = argv[1] if len(argv) > 1 else 'console'
+        return profile([LAUNCHERS.get(command, command), *argv[2:]])
 
-    while True:
-        clear_screen()
-        Message.info(f"You've selected: '{option.name if option is not None else "None"}'\n")
-        option = menu.display_and_take_input()
+    command: str = argv[0] if argv and argv[0] in LAUNCHERS else 'console'
+    arguments: list[str] = argv[1:] if argv and argv[0] in LAUNCHERS else argv
+    return import_module(LAUNCHERS[command]).main(arguments)
 
-        if option == MainMenuOption.EXIT:
-            clear_screen()
-            print('Quiting...')
-            break
+
+if __name__ == '__main__':
+    sys.exit(launch(sys.argv[1:]))
@@ -0,0 +1,108 @@
+from network.protocol import HELLO, WELCOME, PLAY, GAME, MOVE, END, QUIT, MAX_LINE, encode, decode
+from core.misc.square import INDEXES, label_of
+from core.misc.bitboard import PASS, squares
+from core.enums.coin_state import CoinState
+from core.objects.board import Board
+from contextlib import suppress
+from time import perf_counter
+from random import Random
+from uuid import uuid4
+import asyncio
+
+
+def percentile(values: list[float], share: float) -> float:
+    """ This function returns the value below which the given share of sorted values falls, nearest rank """
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, max(0, round(share * len(values)) - 1))]
+
+
+class LoadReport:
+    # Constructor
+    def __init__(self):
+        # Seconds from sending a move to receiving the server's answer
+        self.latencies: list[float] = []
+        self.games: int = 0
+        self.errors: dict[str, int] = {}
+        self.elapsed: float = 0.0
+
+    def error(self, reason: str) -> None:
+        self.errors[reason] = self.errors.get(reason, 0) + 1
+
+    def __repr__(self) -> str:
+        """ This method provides object as string for output """
+        latencies: list[float] = sorted(self.latencies)
+        errors: str = ', '.join(f"{reason}: {count}" for reason, count in sorted(self.errors.items())) or 'none'
+        return (f"{self.games} games, {len(latencies)} moves in {self.elapsed:.1f}s "
+                f"({len(latencies) / self.elapsed if self.elapsed else 0:.0f} moves/s)\n"
+                f"move latency p50 {percentile(latencies, 0.5) * 1000:.1f} ms, p99 {percentile(latencies, 0.99) * 1000:.1f} ms, "
+                f"max {latencies[-1] * 1000 if latencies else 0:.1f} ms\n"
+                f"errors: {errors}")
+
+
+async def _expect(reader: asyncio.StreamReader, *commands: str) -> list[str]:
+    """ This function reads the next line and returns its command and arguments, any other command raises """
+    command, arguments = decode(await reader.readline())
+    if command not in commands:
+        raise ConnectionError(f"expected {' or '.join(commands)}, got {command or 'nothing'} {' '.join(arguments)}".strip())
+    return [command, *arguments]
+
+async def play_games(host: str, port: int, games: int, random: Random, report: LoadReport) -> None:
+    """ This function connects once and plays random legal moves against the server's engine for a number of games """
+    reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE)
+
+    try:
+        writer.write(encode(HELLO, uuid4()))
+        await _expect(reader, WELCOME)
+
+        for game in range(games):
+            # Colours alternate, so the engine opens every other game
+            color: CoinState = CoinState.BLACK if game % 2 == 0 else CoinState.WHITE
+            writer.write(encode(PLAY, color.name.lower()))
+            await _expect(reader, GAME)
+            board: Board = Board()
+
+            while True:
+                # The server's moves, and its END once the game is over, arrive without being asked for
+                if board.is_game_over or board.turn != color:
+                    reply: list[str] = await _expect(reader, MOVE, END)
+                else:
+                    moves: int = board.legal_moves
+                    move: int = random.choice(list(squares(moves))) if moves else PASS
+                    board.play(move)
+
+                    start: float = perf_counter()
+                    writer.write(encode(MOVE, label_of(move)))
+                    await writer.drain()
+                    reply = await _expect(reader, MOVE, END)
+                    report.latencies.append(perf_counter() - start)
+
+                if reply[0] == END:
+                    report.games += 1
+                    break
+                board.play(INDEXES[reply[1]])
+
+        writer.write(encode(QUIT))
+        await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError, OSError) as error:
+        report.error(type(error).__name__ if not str(error) else str(error).split(',')[0])
+    finally:
+        writer.close()
+        with suppress(OSError):
+            await writer.wait_closed()
+
+
+async def run_load(host: str, port: int, connections: int, games: int, seed: int = 0, connect_rate: int = 200) -> LoadReport:
+    """ This function plays games over many simultaneous connections and reports move latencies """
+    report: LoadReport = LoadReport()
+    random: Random = Random(seed)
+
+    # Connections are opened in waves, so the listen backlog isn't flooded by thousands of SYNs at once
+    async def connection(index: int) -> None:
+        await asyncio.sleep(index // connect_rate * 0.05)
+        await play_games(host, port, games, Random(random.getrandbits(64) ^ index), report)
+
+    start: float = perf_counter()
+    await asyncio.gather(*(connection(index) for index in range(connections)))
+    report.elapsed = perf_counter() - start
+    return report
@@ -0,0 +1,37 @@
+# Line protocol: one ASCII command per line, its arguments separated by single spaces.
+#
+#   client                          server
+#   HELLO <player uuid>             WELCOME <player uuid>
+#   PLAY <black|white>              GAME <game uuid>, then the engine's MOVE when it opens
+#   MOVE <label>                    MOVE <label> of the engine, or END <result> <reason>
+#   QUIT                            BYE
+#
+# Labels are squares like 'F5', '--' is a pass. Results are the final disc differential for black.
+# A bad command or an illegal move gets ERROR <message>, the connection and the game stay usable.
+# A refused HELLO gets ERROR <message> and the connection is closed. A line over MAX_LINE bytes,
+# or no line within the server's move timeout, closes the connection without an answer.
+
+HELLO: str = 'HELLO'
+WELCOME: str = 'WELCOME'
+PLAY: str = 'PLAY'
+GAME: str = 'GAME'
+MOVE: str = 'MOVE'
+END: str = 'END'
+QUIT: str = 'QUIT'
+BYE: str = 'BYE'
+ERROR: str = 'ERROR'
+
+# The longest valid line is a HELLO with its 36-character uuid, anything much longer is a broken or hostile peer
+MAX_LINE: int = 128
+
+ENCODING: str = 'ascii'
+
+
+def encode(command: str, *arguments: object) -> bytes:
+    """ This function builds the line of a command """
+    return ' '.join((command, *map(str, arguments))).encode(ENCODING) + b'\n'
+
+def decode(line: bytes) -> tuple[str, list[str]]:
+    """ This function splits a received line into its command and arguments, an empty line has an empty command """
+    parts: list[str] = line.decode(ENCODING, 'replace').split()
+    return (parts[0].upper(), parts[1:]) if parts else ('', [])
@@ -0,0 +1,216 @@
+from network.protocol import HELLO, WELCOME, PLAY, GAME, MOVE, END, QUIT, BYE, ERROR, MAX_LINE, encode, decode
+from concurrent.futures import ProcessPoolExecutor
+from core.objects.player_store import PlayerStore
+from core.misc.square import INDEXES, label_of
+from core.objects.ai_player import AIPlayer
+from core.enums.guard_mode import GuardMode
+from core.enums.coin_state import CoinState
+from core.misc.bitboard import PASS
+from core.objects.board import Board
+from core.shield.guard import Guard
+from uuid import UUID, uuid4
+import asyncio
+
+# Colours a client can ask for
+COLORS: dict[str, CoinState] = {'BLACK': CoinState.BLACK, 'WHITE': CoinState.WHITE}
+
+# Engines of the worker process per (time budget, max depth), built once and reused for every move it searches
+_engines: dict[tuple[float, int], AIPlayer] = {}
+
+
+def _init_worker() -> None:
+    """ This function prepares an engine worker process """
+    # Workers only search boards the server already checked
+    Guard.set_mode(GuardMode.TRUSTED)
+
+def _engine_move(black: int, white: int, turn: int, time_budget: float, max_depth: int) -> int:
+    """ This function searches a move inside a worker process """
+    engine: AIPlayer | None = _engines.get((time_budget, max_depth))
+    if engine is None:
+        engine = _engines[(time_budget, max_depth)] = AIPlayer(uuid4(), 'Server', time_budget, max_depth)
+    return engine.choose_move(Board(black, white, CoinState(turn)))
+
+
+class GameServer:
+    # Constructor
+    def __init__(self, host: str = '127.0.0.1', port: int = 7878, time_budget: float = 0.05, max_depth: int = 60,
+                 move_timeout: float = 30.0, workers: int | None = None, store: PlayerStore | None = None):
+        Guard.against_zero_or_less(time_budget, 'time budget')
+        Guard.against_zero_or_less(max_depth, 'max depth')
+        Guard.against_zero_or_less(move_timeout, 'move timeout')
+
+        self.__host: str = host
+        self.__port: int = port
+        self.__time_budget: float = time_budget
+        self.__max_depth: int = max_depth
+        self.__move_timeout: float = move_timeout
+        self.__workers: int | None = workers
+
+        # Without a store any uuid may connect, with one only its players may
+        self.__store: PlayerStore | None = store
+        self.__connected: set[UUID] = set()
+
+        self.__server: asyncio.Server | None = None
+        self.__executor: ProcessPoolExecutor | None = None
+
+        self.games_started: int = 0
+        self.games_finished: int = 0
+
+    ###########
+    # Getters #
+    ###########
+
+    @property
+    def host(self) -> str:
+        return self.__host
+
+    @property
+    def port(self) -> int:
+        """ Port the server listens on, the one picked by the system once started on port 0 """
+        return self.__port
+
+    @property
+    def connections(self) -> int:
+        return len(self.__connected)
+
+    async def start(self) -> None:
+        """ This method starts the engine workers and begins accepting connections """
+        # Searches are CPU bound, they run in worker processes so the event loop keeps serving every other game
+        self.__executor = ProcessPoolExecutor(self.__workers, initializer=_init_worker)
+        self.__server = await asyncio.start_server(self.__handle, self.__host, self.__port, limit=MAX_LINE, backlog=4096)
+        self.__port = self.__server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        if self.__server is None:
+            await self.start()
+        await self.__server.serve_forever()
+
+    async def close(self) -> None:
+        if self.__server is not None:
+            self.__server.close()
+            await self.__server.wait_closed()
+        if self.__executor is not None:
+            # Shutting down waits for searches in progress, on a thread so the event loop isn't blocked meanwhile
+            await asyncio.to_thread(self.__executor.shutdown, cancel_futures=True)
+
+    async def __aenter__(self) -> 'GameServer':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    ##############
+    # Connection #
+    ##############
+
+    async def __handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """ This method serves one connection until the client quits, times out or goes away """
+        player: UUID | None = None
+
+        try:
+            player = await self.__hello(reader, writer)
+            while player is not None:
+                command, arguments = await self.__read(reader)
+
+                if command == QUIT:
+                    await self.__send(writer, BYE)
+                    break
+                if command == PLAY and len(arguments) == 1 and arguments[0].upper() in COLORS:
+                    if not await self.__play(reader, writer, player, COLORS[arguments[0].upper()]):
+                        break
+                else:
+                    await self.__send(writer, ERROR, 'expected PLAY black, PLAY white or QUIT')
+
+        # A silent client, a dropped connection and an over-long line all end the connection the same way
+        except (TimeoutError, ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            # Closing needn't be awaited, the transport flushes what is left on its own
+            self.__connected.discard(player)
+            writer.close()
+
+    async def __hello(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> UUID | None:
+        """ This method reads the greeting and returns the player of the connection, None when it is refused """
+        command, arguments = await self.__read(reader)
+
+        try:
+            player: UUID | None = UUID(arguments[0]) if command == HELLO and len(arguments) == 1 else None
+        except ValueError:
+            player = None
+
+        if player is None:
+            await self.__send(writer, ERROR, 'expected HELLO <player uuid>')
+        elif self.__store is not None and player not in self.__store:
+            await self.__send(writer, ERROR, 'unknown player')
+        elif player in self.__connected:
+            await self.__send(writer, ERROR, 'player already connected')
+        else:
+            self.__connected.add(player)
+            await self.__send(writer, WELCOME, player)
+            return player
+
+        return None
+
+    async def __play(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, player: UUID, color: CoinState) -> bool:
+        """ This method plays one game against the engine, returns False when the client left during it """
+        board: Board = Board()
+        self.games_started += 1
+        await self.__send(writer, GAME, uuid4())
+
+        while not board.is_game_over:
+            if board.turn != color:
+                move: int = PASS if board.must_pass else await self.__engine_move(board)
+                board.play(move)
+                await self.__send(writer, MOVE, label_of(move))
+                continue
+
+            # Every move of the client has its own deadline, a client that stops answering ends the game as it stands
+            try:
+                command, arguments = await self.__read(reader)
+            except TimeoutError:
+                await self.__send(writer, END, self.__result(board), 'timeout')
+                raise
+
+            if command == QUIT:
+                await self.__send(writer, END, self.__result(board), 'resigned')
+                await self.__send(writer, BYE)
+                return False
+
+            square: int | None = INDEXES.get(arguments[0].upper()) if command == MOVE and len(arguments) == 1 else None
+            if square is None:
+                await self.__send(writer, ERROR, 'expected MOVE <label>')
+            elif square == PASS and not board.must_pass or square != PASS and not board.is_legal(square):
+                await self.__send(writer, ERROR, f'{label_of(square)} is not legal')
+            else:
+                board.play(square)
+
+        self.games_finished += 1
+        if self.__store is not None and player in self.__store:
+            self.__store.increment_xp(player)
+
+        await self.__send(writer, END, self.__result(board), 'finished')
+        return True
+
+    async def __engine_move(self, board: Board) -> int:
+        """ This method searches the engine's move in a worker, the event loop serves other games meanwhile """
+        return await asyncio.get_running_loop().run_in_executor(
+            self.__executor, _engine_move, board.black, board.white, board.turn.value, self.__time_budget, self.__max_depth
+        )
+
+    async def __read(self, reader: asyncio.StreamReader) -> tuple[str, list[str]]:
+        """ This method reads the next command, the connection ends when it doesn't come in time """
+        line: bytes = await asyncio.wait_for(reader.readline(), self.__move_timeout)
+        if not line:
+            raise ConnectionResetError('Client closed the connection.')
+        return decode(line)
+
+    @staticmethod
+    async def __send(writer: asyncio.StreamWriter, command: str, *arguments: object) -> None:
+        """ This method writes a command, waiting while the client's receive buffer is full """
+        writer.write(encode(command, *arguments))
+        await writer.drain()
+
+    @staticmethod
+    def __result(board: Board) -> str:
+        return f'{board.count(CoinState.BLACK) - board.count(CoinState.WHITE):+d}'
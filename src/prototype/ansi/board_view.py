@@ -0,0 +1,56 @@
+from prototype.ansi.enums.foreground import Foreground
+from prototype.ansi.enums.background import Background
+from prototype.ansi.enums.style import Style
+from prototype.ansi.color import Decoration
+from prototype.ansi.screen import Screen
+from core.enums.coin_state import CoinState
+from core.misc.bitboard import PASS
+from core.objects.board import Board
+
+# Every cell is 2 characters wide, the frame is 2 wide columns of labels plus 8 cells
+WIDTH: int = 2 + 8 * 2
+HEIGHT: int = 1 + 8 + 2
+
+_LABEL: Decoration = Decoration.of(Foreground.BRIGHT_BLACK)
+_EMPTY: Decoration = Decoration.of(Foreground.BLACK, Background.GREEN)
+_LEGAL: Decoration = Decoration.of(Foreground.BRIGHT_YELLOW, Background.GREEN, Style.BOLD)
+_DISCS: dict[CoinState, Decoration] = {
+    CoinState.BLACK: Decoration.of(Foreground.BLACK, Background.GREEN, Style.BOLD),
+    CoinState.WHITE: Decoration.of(Foreground.BRIGHT_WHITE, Background.GREEN, Style.BOLD)
+}
+_LAST: Decoration = Decoration.of(Foreground.BRIGHT_RED, Background.GREEN, Style.BOLD)
+
+
+class BoardView:
+    # Constructor
+    def __init__(self, screen: Screen, top: int = 0, left: int = 0):
+        self.__screen: Screen = screen
+        self.__top: int = top
+        self.__left: int = left
+
+    def draw(self, board: Board, last_move: int = PASS, status: str = '', highlight: bool = True) -> None:
+        """ This method draws the board into the screen's back buffer, the caller presents the frame """
+        screen: Screen = self.__screen
+        top: int = self.__top
+        left: int = self.__left
+        legal: int = board.legal_moves if highlight else 0
+
+        screen.write(top, left, '  ' + ''.join(f'{label} ' for label in 'ABCDEFGH'), _LABEL)
+
+        for row in range(8):
+            screen.write(top + 1 + row, left, f'{row + 1} ', _LABEL)
+
+            for column in range(8):
+                square: int = row * 8 + column
+                state: CoinState | None = board.state_at(square)
+                x: int = left + 2 + column * 2
+
+                if state is None:
+                    screen.write(top + 1 + row, x, '· ', _LEGAL if legal >> square & 1 else _EMPTY)
+                else:
+                    screen.write(top + 1 + row, x, '● ', _LAST if square == last_move else _DISCS[state])
+
+        black: int = board.count(CoinState.BLACK)
+        white: int = board.count(CoinState.WHITE)
+        screen.write(top + 9, left, f'B {black:<2}  W {white:<2}  {board.turn.name.lower()} to move'.ljust(screen.width - left))
+        screen.write(top + 10, left, status.ljust(screen.width - left))
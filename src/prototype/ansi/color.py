@@ -6,50 +6,72 @@ RESET = '\033[0m'
 
 
 class Decoration:
+    __slots__ = ('__fg', '__bg', '__style', '__code')
+
+    # Constructor
     def __init__(self, **kwargs):
-        self.fg: Foreground | None = kwargs.get('foreground', None)
-        self.bg: Background | None = kwargs.get('background', None)
-        self.style: Style | None = kwargs.get('style', None)
+        self.__fg: Foreground | None = kwargs.get('foreground', None)
+        self.__bg: Background | None = kwargs.get('background', None)
+        self.__style: Style | None = kwargs.get('style', None)
+
+        # Decorations never change, so the escape code is built once
+        values: list[str] = [part.value for part in (self.__fg, self.__bg, self.__style) if part is not None]
+        self.__code: str = f"\033[{';'.join(values)}m" if values else ''
 
     ###########
     # Getters #
     ###########
 
+    @property
+    def fg(self) -> Foreground | None:
+        return self.__fg
+
+    @property
+    def bg(self) -> Background | None:
+        return self.__bg
+
+    @property
+    def style(self) -> Style | None:
+        return self.__style
+
     @property
     def exists(self) -> bool:
-        return self.fg is not None or self.bg is not None or self.style is not None
+        return self.__fg is not None or self.__bg is not None or self.__style is not None
 
     @property
     def code(self) -> str:
-        # If the decoration doesn't exist
-        if not self.exists:
-            return ''
+        return self.__code
+
+    @staticmethod
+    def of(foreground: Foreground | None = None, background: Background | None = None, style: Style | None = None) -> 'Decoration':
+        """ This method returns the shared instance of a decoration, built on first use """
+        key: tuple = (foreground, background, style)
+        decoration: Decoration | None = _SHARED.get(key)
+
+        if decoration is None:
+            decoration = _SHARED[key] = Decoration(foreground=foreground, background=background, style=style)
+        return decoration
 
-        ansi_code: str = '\033['
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Decoration) and self.__code == other.__code
 
-        # Add foreground code
-        if self.fg:
-            ansi_code += self.fg.value
+    def __hash__(self) -> int:
+        return hash(self.__code)
 
-        # Add background code
-        if self.bg:
-            if self.fg:
-                ansi_code += ';'
+    def __repr__(self) -> str:
+        """ This method provides object as string for output """
+        return f"(foreground: {self.__fg}, background: {self.__bg}, style: {self.__style})"
 
-            ansi_code += self.bg.value
 
-        # Add style code
-        if self.style:
-            if self.bg or self.fg:
-                ansi_code += ';'
+# Decorations handed out by Decoration.of, keyed by (foreground, background, style)
+_SHARED: dict[tuple, Decoration] = {}
 
-            ansi_code += self.style.value
+PLAIN: Decoration = Decoration.of()
 
-        return ansi_code + 'm'
 
 def colored_text(**kwargs) -> str:
     """ This function provides ansi encoded text """
     text: str = kwargs.get('text', 'Text')
-    decor: Decoration | None = kwargs.get('decoration', Decoration())
+    decor: Decoration | None = kwargs.get('decoration', PLAIN)
 
     return decor.code + text + RESET
@@ -0,0 +1,115 @@
+from prototype.ansi.color import RESET, Decoration
+from core.shield.guard import Guard
+from typing import TextIO
+import sys
+
+CLEAR: str = '\033[2J'
+HOME: str = '\033[H'
+HIDE_CURSOR: str = '\033[?25l'
+SHOW_CURSOR: str = '\033[?25h'
+
+# A cell is its character and the escape code decorating it, '' when plain
+Cell = tuple[str, str]
+BLANK: Cell = (' ', '')
+
+
+def move_to(row: int, column: int) -> str:
+    """ This function returns the escape moving the cursor to a 0-based cell """
+    return f'\033[{row + 1};{column + 1}H'
+
+
+class Screen:
+    # Constructor
+    def __init__(self, width: int, height: int, stream: TextIO | None = None):
+        Guard.against_zero_or_less(width, 'width')
+        Guard.against_zero_or_less(height, 'height')
+        self.__width: int = width
+        self.__height: int = height
+        self.__stream: TextIO = stream if stream is not None else sys.stdout
+
+        # Frames are drawn into the back buffer, the front buffer holds what the terminal shows
+        self.__front: list[Cell | None] = [None] * (width * height)
+        self.__back: list[Cell] = [BLANK] * (width * height)
+        self.__cleared: bool = False
+
+    ###########
+    # Getters #
+    ###########
+
+    @property
+    def width(self) -> int:
+        return self.__width
+
+    @property
+    def height(self) -> int:
+        return self.__height
+
+    def clear(self) -> None:
+        """ This method blanks the back buffer, the terminal only changes on present """
+        self.__back = [BLANK] * (self.__width * self.__height)
+
+    def write(self, row: int, column: int, text: str, decoration: Decoration | None = None) -> None:
+        """ This method puts text into the back buffer, cut off at the right edge """
+        if not 0 <= row < self.__height or not 0 <= column < self.__width:
+            return
+
+        code: str = decoration.code if decoration is not None else ''
+        start: int = row * self.__width + column
+        for offset, char in enumerate(text[:self.__width - column]):
+            self.__back[start + offset] = (char, code)
+
+    def invalidate(self) -> None:
+        """ This method makes the next present redraw every cell, e.g. after something else wrote to the terminal """
+        self.__front = [None] * (self.__width * self.__height)
+        self.__cleared = False
+
+    def present(self) -> int:
+        """ This method writes the cells changed since the last frame in a single write and returns how many changed """
+        width: int = self.__width
+        front: list[Cell | None] = self.__front
+        parts: list[str] = []
+
+        if not self.__cleared:
+            parts.append(HIDE_CURSOR + CLEAR + HOME)
+            self.__cleared = True
+
+        code: str = ''
+        cursor: int = -1
+        changed: int = 0
+
+        for index, cell in enumerate(self.__back):
+            if cell == front[index]:
+                continue
+
+            # Runs of changed cells are written after one cursor move, a new row always gets its own
+            if index != cursor or index % width == 0:
+                parts.append(move_to(index // width, index % width))
+            if cell[1] != code:
+                parts.append(RESET + cell[1])
+                code = cell[1]
+
+            parts.append(cell[0])
+            cursor = index + 1
+            changed += 1
+
+        if code:
+            parts.append(RESET)
+
+        if parts:
+            self.__stream.write(''.join(parts))
+            self.__stream.flush()
+
+        # The shown frame stays in the back buffer too, so the next frame only redraws what it changes
+        self.__front = list(self.__back)
+        return changed
+
+    def close(self) -> None:
+        """ This method leaves the cursor below the screen and shows it again """
+        self.__stream.write(RESET + move_to(self.__height, 0) + SHOW_CURSOR)
+        self.__stream.flush()
+
+    def __enter__(self) -> 'Screen':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -0,0 +1,25 @@
+from prototype.text.menu.main_menu import MainMenu, MainMenuOption
+from prototype.text.message import Message
+from core.enums.guard_mode import GuardMode
+from core.misc.func import clear_screen
+from core.shield.guard import Guard
+
+
+def main(argv: list[str]) -> int:
+    # Menus and moves are user input, they are always checked, only with the cheaper checks
+    Guard.set_mode(GuardMode.FAST)
+
+    menu: MainMenu = MainMenu()
+    option: MainMenuOption | None = None
+
+    while True:
+        clear_screen()
+        Message.info(f"You've selected: '{option.name if option is not None else 'None'}'\n")
+        option = menu.display_and_take_input()
+
+        if option == MainMenuOption.EXIT:
+            clear_screen()
+            print('Quiting...')
+            break
+
+    return 0
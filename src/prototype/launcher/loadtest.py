@@ -0,0 +1,45 @@
+from prototype.launcher.serve import raise_open_files_limit
+from network.client import LoadReport, run_load
+from core.enums.guard_mode import GuardMode
+from network.server import GameServer
+from core.shield.guard import Guard
+from argparse import ArgumentParser, Namespace
+import asyncio
+import sys
+
+
+def parse_args(argv: list[str]) -> Namespace:
+    parser: ArgumentParser = ArgumentParser(prog='loadtest', description='Play many simultaneous games against a server and report move latency')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=7878)
+    parser.add_argument('--connections', type=int, default=1000)
+    parser.add_argument('--games', type=int, default=1, help='games played over every connection')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--local', action='store_true', help='start a server on a free loopback port in this process')
+    parser.add_argument('--budget', type=float, default=0.01, help='seconds per engine move of the local server')
+    parser.add_argument('--depth', type=int, default=2, help='maximum engine search depth of the local server')
+    parser.add_argument('--workers', type=int, default=None, help='engine processes of the local server')
+    return parser.parse_args(argv)
+
+async def load(args: Namespace) -> LoadReport:
+    if not args.local:
+        return await run_load(args.host, args.port, args.connections, args.games, args.seed)
+
+    # Clients and server share one event loop here, a separate `serve` process gives the server's latency alone
+    async with GameServer('127.0.0.1', 0, args.budget, args.depth, workers=args.workers) as server:
+        return await run_load(server.host, server.port, args.connections, args.games, args.seed)
+
+def main(argv: list[str]) -> int:
+    args: Namespace = parse_args(argv)
+
+    # The client replays the server's moves on its own boards, they are checked like any network input
+    Guard.set_mode(GuardMode.FAST)
+    raise_open_files_limit()
+
+    report: LoadReport = asyncio.run(load(args))
+    print(report)
+    return 1 if report.errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
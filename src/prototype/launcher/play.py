@@ -0,0 +1,123 @@
+from core.misc.square import INDEXES, label_of
+from core.objects.ai_player import AIPlayer
+from core.enums.coin_state import CoinState
+from core.enums.guard_mode import GuardMode
+from core.ai.evaluation import evaluate
+from prototype.text.message import Message
+from core.misc.func import generate_guid
+from core.objects.board import Board
+from core.misc.bitboard import PASS
+from core.shield.guard import Guard
+from argparse import ArgumentParser, BooleanOptionalAction, Namespace
+import sys
+
+_PROMPT: str = 'Your move (e.g. d3), undo, redo or quit: '
+
+
+def parse_args(argv: list[str]) -> Namespace:
+    parser: ArgumentParser = ArgumentParser(prog='play', description='Play the engine in the terminal')
+    parser.add_argument('--color', choices=['black', 'white'], default='black', help='colour you play')
+    parser.add_argument('--budget', type=float, default=1.0, help='seconds per engine move')
+    parser.add_argument('--depth', type=int, default=60)
+    parser.add_argument('--table-mb', type=float, default=16)
+    parser.add_argument('--weights', help='pattern weights of the engine, the default evaluation without')
+    parser.add_argument('--ponder', action=BooleanOptionalAction, default=True, help='let the engine think on your time')
+    return parser.parse_args(argv)
+
+def take_back(board: Board, human: CoinState, redo: bool = False) -> bool:
+    """ This function undoes, or redoes, moves until it is the human's turn again, returns False when there was none """
+    step = board.redo if redo else board.undo
+    steps: int = 0
+
+    while (board.can_redo if redo else board.can_undo) and (steps == 0 or board.turn != human):
+        step()
+        steps += 1
+
+    return steps > 0
+
+def play_game(engine: AIPlayer, human: CoinState, ponder: bool) -> bool:
+    """ This function plays one game against the engine, returns False when the human quit """
+    board: Board = Board()
+
+    while not board.is_game_over:
+        if board.turn != human:
+            move: int = engine.choose_move(board) if not board.must_pass else PASS
+            board.play(move)
+            Message.info(f"Engine plays {label_of(move)} ({engine.last_result.elapsed if move != PASS else 0:.2f}s)")
+            # The engine keeps searching its answer to the reply it expects while the human types
+            if ponder:
+                engine.ponder(board)
+            continue
+
+        print(board)
+        if board.must_pass:
+            Message.warning('You have no legal move and pass.')
+            board.pass_turn()
+            continue
+
+        try:
+            command: str = input(_PROMPT).strip().upper()
+        except EOFError:
+            return False
+
+        if command == 'QUIT':
+            return False
+
+        if command in ('UNDO', 'REDO'):
+            if not take_back(board, human, command == 'REDO'):
+                Message.error(f"There is nothing to {command.lower()}.")
+            elif ponder:
+                # The position changed under the ponder search, it restarts from the new one
+                engine.ponder(board)
+            continue
+
+        square: int | None = INDEXES.get(command)
+        if square is None or square == PASS or not board.is_legal(square):
+            Message.error(f"'{command}' is not a legal move.")
+            continue
+        board.play(square)
+
+    # A last move of the human the engine didn't predict leaves a ponder search running, it ends with the game
+    engine.stop_pondering()
+    print(board)
+    difference: int = board.count(human) - board.count(CoinState.WHITE if human == CoinState.BLACK else CoinState.BLACK)
+    if difference > 0:
+        Message.success(f"You won by {difference}.")
+    else:
+        Message.info(f"Game over, {'a draw' if difference == 0 else f'you lost by {-difference}'}.")
+    return True
+
+def main(argv: list[str]) -> int:
+    args: Namespace = parse_args(argv)
+    # Moves are user input, they are always checked, only with the cheaper checks
+    Guard.set_mode(GuardMode.FAST)
+
+    evaluator = evaluate
+    if args.weights:
+        from core.ai.patterns import PatternEvaluator
+        evaluator = PatternEvaluator.load(args.weights)
+
+    engine: AIPlayer = AIPlayer(generate_guid(), 'Engine', args.budget, args.depth, args.table_mb, evaluator=evaluator)
+    human: CoinState = CoinState[args.color.upper()]
+
+    try:
+        while play_game(engine, human, args.ponder):
+            if engine.ponder_statistics is not None:
+                statistics = engine.ponder_statistics
+                Message.info(f"Pondering: {statistics.hits}/{statistics.ponders} hits ({statistics.hit_rate:.0%}), "
+                             f"{statistics.saved:.1f}s of engine time saved this game")
+                statistics.reset()
+
+            try:
+                if input('Play again? [y/N] ').strip().lower() != 'y':
+                    break
+            except EOFError:
+                break
+    finally:
+        engine.close()
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,147 @@
+from concurrent.futures import ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+from core.objects.match import Match, MatchRecord
+from data.book.opening_book import OpeningBook
+from core.objects.ai_player import AIPlayer
+from core.ai.evaluation import evaluate
+from core.misc.bitboard import squares
+from core.misc.rating import elo_difference
+from core.enums.guard_mode import GuardMode
+from core.objects.board import Board
+from core.shield.guard import Guard
+from argparse import ArgumentParser, Namespace
+from time import perf_counter
+from random import Random
+from uuid import UUID, uuid4
+from os import cpu_count
+import json
+import sys
+
+# Engines of the worker process, built once and reused for every game it plays
+_engines: dict[str, AIPlayer] = {}
+
+
+def _init_worker(engines: dict[str, tuple[UUID, float, int, str | None]]) -> None:
+    """ This function builds the engines of a worker process """
+    # Workers only play engine moves on engine-built boards
+    Guard.set_mode(GuardMode.TRUSTED)
+    for name, (id, time_budget, max_depth, weights) in engines.items():
+        if weights:
+            # Pattern tables need numpy, runs with the default evaluation never import it
+            from core.ai.patterns import PatternEvaluator
+            evaluator = PatternEvaluator.load(weights)
+        else:
+            evaluator = evaluate
+        _engines[name] = AIPlayer(id, name, time_budget, max_depth, evaluator=evaluator)
+
+def _play(game: int, opening: list[int], black: str, white: str) -> dict:
+    """ This function plays one game inside a worker and returns its record as plain values """
+    record: MatchRecord = Match(_engines[black], _engines[white], opening).play()
+    return {'game': game, 'black_engine': black, 'white_engine': white, **record.to_dict()}
+
+def random_opening(random: Random, plies: int, book: OpeningBook | None = None) -> list[int]:
+    """ This function picks opening moves at random, preferring moves that stay inside the book """
+    board: Board = Board()
+    moves: list[int] = []
+
+    while len(moves) < plies and not board.is_game_over:
+        if board.must_pass:
+            board.pass_turn()
+            continue
+
+        candidates: list[int] = list(squares(board.legal_moves))
+        if book is not None:
+            in_book: list[int] = [move for move in candidates if _in_book(book, board, move)]
+            candidates = in_book or candidates
+
+        move: int = random.choice(candidates)
+        board.play(move)
+        moves.append(move)
+
+    return moves
+
+def _in_book(book: OpeningBook, board: Board, move: int) -> bool:
+    """ This function checks whether a move leads to a book position """
+    child: Board = board.copy()
+    child.play(move)
+    return book.lookup(child) is not None
+
+def parse_args(argv: list[str]) -> Namespace:
+    parser: ArgumentParser = ArgumentParser(prog='selfplay', description='Play engine A against engine B headless')
+    parser.add_argument('--games', type=int, default=100, help='games to play, openings are played twice with colours swapped')
+    parser.add_argument('--workers', type=int, default=cpu_count() or 1)
+    parser.add_argument('--a-budget', type=float, default=0.1, help='seconds per move of engine A')
+    parser.add_argument('--b-budget', type=float, default=0.1, help='seconds per move of engine B')
+    parser.add_argument('--a-depth', type=int, default=60, help='maximum search depth of engine A')
+    parser.add_argument('--b-depth', type=int, default=60, help='maximum search depth of engine B')
+    parser.add_argument('--a-weights', help='pattern weights file of engine A, static evaluation if omitted')
+    parser.add_argument('--b-weights', help='pattern weights file of engine B, static evaluation if omitted')
+    parser.add_argument('--opening-plies', type=int, default=6, help='random moves played before the engines take over')
+    parser.add_argument('--book', help='opening book to draw the random openings from')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', default='-', help="file receiving one JSON record per game, '-' for stdout")
+    return parser.parse_args(argv)
+
+def main(argv: list[str]) -> int:
+    args: Namespace = parse_args(argv)
+    engines: dict[str, tuple[UUID, float, int, str | None]] = {
+        'A': (uuid4(), args.a_budget, args.a_depth, args.a_weights),
+        'B': (uuid4(), args.b_budget, args.b_depth, args.b_weights)
+    }
+
+    random: Random = Random(args.seed)
+    book: OpeningBook | None = OpeningBook(args.book) if args.book else None
+    output = sys.stdout if args.output == '-' else open(args.output, 'a')
+
+    # Wins, draws and losses of engine A
+    tally: list[int] = [0, 0, 0]
+    start: float = perf_counter()
+
+    def collect(pending: set[Future]) -> set[Future]:
+        """ This function streams out every finished game and returns the games still running """
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+        for future in done:
+            record: dict = future.result()
+            output.write(json.dumps(record) + '\n')
+            output.flush()
+
+            result: int = record['result'] if record['black_engine'] == 'A' else -record['result']
+            tally[0 if result > 0 else 1 if result == 0 else 2] += 1
+
+            played: int = sum(tally)
+            sys.stderr.write(f"\r{played}/{args.games} games  {played / (perf_counter() - start):.2f} games/sec  "
+                             f"A +{tally[0]} ={tally[1]} -{tally[2]}")
+            sys.stderr.flush()
+
+        return pending
+
+    pending: set[Future] = set()
+    opening: list[int] = []
+
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker, initargs=(engines,)) as pool:
+        for game in range(args.games):
+            # Only a few games per worker are queued, so nothing grows with the number of games
+            if len(pending) >= args.workers * 2:
+                pending = collect(pending)
+
+            # Each opening is played by both engines with either colour
+            if game % 2 == 0:
+                opening = random_opening(random, args.opening_plies, book)
+            black, white = ('A', 'B') if game % 2 == 0 else ('B', 'A')
+            pending.add(pool.submit(_play, game, opening, black, white))
+
+        while pending:
+            pending = collect(pending)
+
+    if output is not sys.stdout:
+        output.close()
+    if book is not None:
+        book.close()
+
+    elo, margin = elo_difference(*tally)
+    sys.stderr.write(f"\nEngine A vs B: {elo:+.1f} ± {margin:.1f} Elo (95%) over {sum(tally)} games\n")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,56 @@
+from data.csv_handler.players import load_players
+from core.objects.player_store import PlayerStore
+from core.enums.guard_mode import GuardMode
+from network.server import GameServer
+from core.shield.guard import Guard
+from argparse import ArgumentParser, Namespace
+import asyncio
+import sys
+
+
+def parse_args(argv: list[str]) -> Namespace:
+    parser: ArgumentParser = ArgumentParser(prog='serve', description='Host games against the engine over TCP')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=7878)
+    parser.add_argument('--budget', type=float, default=0.05, help='seconds per engine move')
+    parser.add_argument('--depth', type=int, default=60, help='maximum engine search depth')
+    parser.add_argument('--move-timeout', type=float, default=30.0, help='seconds a client has for every move')
+    parser.add_argument('--workers', type=int, default=None, help='engine processes, one per core by default')
+    parser.add_argument('--players', default=None, help='players CSV, only its players may connect')
+    return parser.parse_args(argv)
+
+def raise_open_files_limit() -> None:
+    """ This function lifts the soft limit of open files to the hard one, every connection holds a socket """
+    try:
+        import resource
+    except ImportError:
+        return
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft != hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+async def serve(args: Namespace) -> None:
+    store: PlayerStore | None = load_players(args.players) if args.players else None
+    server: GameServer = GameServer(args.host, args.port, args.budget, args.depth, args.move_timeout, args.workers, store)
+
+    async with server:
+        sys.stderr.write(f"Serving on {server.host}:{server.port}\n")
+        await server.serve_forever()
+
+def main(argv: list[str]) -> int:
+    args: Namespace = parse_args(argv)
+
+    # Moves come from the network, they are always checked, only with the cheaper checks
+    Guard.set_mode(GuardMode.FAST)
+    raise_open_files_limit()
+
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,57 @@
+from prototype.ansi.board_view import BoardView, HEIGHT, WIDTH
+from core.objects.match import Match, MatchRecord, move_label
+from core.objects.ai_player import AIPlayer
+from core.enums.guard_mode import GuardMode
+from prototype.ansi.screen import Screen
+from core.objects.board import Board
+from core.shield.guard import Guard
+from core.misc.func import generate_guid
+from argparse import ArgumentParser, Namespace
+from time import perf_counter, sleep
+import sys
+
+
+def parse_args(argv: list[str]) -> Namespace:
+    parser: ArgumentParser = ArgumentParser(prog='spectate', description='Watch engine A play engine B')
+    parser.add_argument('--games', type=int, default=1)
+    parser.add_argument('--a-budget', type=float, default=0.1, help='seconds per move of engine A')
+    parser.add_argument('--b-budget', type=float, default=0.1, help='seconds per move of engine B')
+    parser.add_argument('--delay', type=float, default=0.0, help='extra seconds every move stays on screen')
+    args: Namespace = parser.parse_args(argv)
+
+    if args.games < 1:
+        parser.error('--games must be at least 1')
+    return args
+
+def main(argv: list[str]) -> int:
+    args: Namespace = parse_args(argv)
+    Guard.set_mode(GuardMode.TRUSTED)
+
+    engines: tuple[AIPlayer, AIPlayer] = (AIPlayer(generate_guid(), 'A', args.a_budget), AIPlayer(generate_guid(), 'B', args.b_budget))
+    frames: list[int] = [0, 0]
+
+    with Screen(max(WIDTH, 40), HEIGHT) as screen:
+        view: BoardView = BoardView(screen)
+        start: float = perf_counter()
+
+        for game in range(args.games):
+            black, white = engines if game % 2 == 0 else engines[::-1]
+
+            def show(board: Board, move: int) -> None:
+                """ This function draws the position after a move, only the changed cells reach the terminal """
+                elapsed: float = perf_counter() - start
+                view.draw(board, move, f'game {game + 1}/{args.games} {black.name}-{white.name}  {move_label(move)}  '
+                                       f'{frames[0] / elapsed if elapsed else 0:.0f} fps')
+                frames[1] += screen.present()
+                frames[0] += 1
+                if args.delay:
+                    sleep(args.delay)
+
+            record: MatchRecord = Match(black, white, on_move=show).play()
+
+    sys.stderr.write(f"{frames[0]} frames, {frames[1] / max(frames[0], 1):.1f} cells redrawn per frame, last result {record.result:+d}\n")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
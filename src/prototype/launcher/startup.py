@@ -0,0 +1,54 @@
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+import subprocess
+import sys
+
+# `-X importtime` lines look like "import time:   self [us] | cumulative | imported package"
+_PREFIX: str = 'import time:'
+
+
+def parse_args(argv: list[str]) -> Namespace:
+    parser: ArgumentParser = ArgumentParser(prog='--profile-startup', description='Report the import time of every module a launcher loads')
+    parser.add_argument('module', help='launcher module to profile, e.g. prototype.launcher.console')
+    parser.add_argument('--top', type=int, default=25, help='modules listed, slowest cumulative import first')
+    return parser.parse_args(argv)
+
+def profile_imports(module: str) -> list[tuple[str, int, int]]:
+    """ This function imports a module in a fresh interpreter and returns (module, self us, cumulative us) of every import """
+    # A fresh interpreter sees the cold start every scripted launch pays, nothing is cached in sys.modules yet
+    completed: subprocess.CompletedProcess = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=Path(__file__).resolve().parents[2], capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        raise ImportError(f"Importing {module} failed:\n{completed.stderr}")
+
+    imports: list[tuple[str, int, int]] = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith(_PREFIX):
+            continue
+
+        own, cumulative, name = line[len(_PREFIX):].split('|')
+        # Nested imports are indented 2 spaces per level past the separator's own space
+        if own.strip().isdigit():
+            imports.append((name[1:].rstrip(), int(own), int(cumulative)))
+
+    return imports
+
+def main(argv: list[str]) -> int:
+    args: Namespace = parse_args(argv)
+    imports: list[tuple[str, int, int]] = profile_imports(args.module)
+
+    # Top level imports are the ones not indented, their cumulative times add up to the whole startup
+    total: int = sum(cumulative for name, _, cumulative in imports if not name.startswith(' '))
+    own_total: int = sum(own for _, own, _ in imports)
+
+    print(f"{'module':<48} {'self ms':>9} {'cumul. ms':>10}")
+    for name, own, cumulative in sorted(imports, key=lambda entry: entry[2], reverse=True)[:args.top]:
+        print(f"{name.strip():<48} {own / 1000:>9.2f} {cumulative / 1000:>10.2f}")
+    print(f"{len(imports)} modules, {total / 1000:.1f} ms total, {own_total / 1000:.1f} ms in module bodies")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
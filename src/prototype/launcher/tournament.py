@@ -0,0 +1,146 @@
+from concurrent.futures import ProcessPoolExecutor, Future, as_completed
+from data.saves.tournament_file import save_tournament, load_tournament
+from data.csv_handler.players import load_players, save_players
+from core.enums.tournament_format import TournamentFormat
+from core.objects.player_store import PlayerStore
+from prototype.launcher.selfplay import random_opening
+from core.objects.tournament import Tournament
+from core.objects.ai_player import AIPlayer
+from core.ai.evaluation import evaluate
+from core.enums.guard_mode import GuardMode
+from core.objects.match import Match
+from core.shield.guard import Guard
+from argparse import ArgumentParser, Namespace
+from time import perf_counter
+from pathlib import Path
+from random import Random
+from uuid import UUID, uuid4
+from os import cpu_count
+import json
+import sys
+
+# Evaluators of the worker process per weights file, loaded once and shared by every game it plays
+_evaluators: dict[str, object] = {}
+
+
+def _init_worker() -> None:
+    """ This function prepares a worker process """
+    # Workers only play engine moves on engine-built boards
+    Guard.set_mode(GuardMode.TRUSTED)
+
+def _engine(entrant: dict, table_mb: float) -> AIPlayer:
+    """ This function builds the engine of an entrant inside a worker """
+    weights: str | None = entrant.get('weights')
+    evaluator = evaluate
+    if weights:
+        if weights not in _evaluators:
+            # Pattern tables need numpy, entrants with the default evaluation never import it
+            from core.ai.patterns import PatternEvaluator
+            _evaluators[weights] = PatternEvaluator.load(weights)
+        evaluator = _evaluators[weights]
+
+    return AIPlayer(uuid4(), entrant['name'], entrant.get('budget', 0.1), entrant.get('depth', 60), table_mb, evaluator=evaluator)
+
+def _play(black: dict, white: dict, opening: list[int], table_mb: float) -> int:
+    """ This function plays one game inside a worker and returns the disc differential for black """
+    # Engines are built per game with small tables, hundreds of entrants never sit in a worker's memory at once
+    return Match(_engine(black, table_mb), _engine(white, table_mb), opening).play().result
+
+def parse_args(argv: list[str]) -> Namespace:
+    parser: ArgumentParser = ArgumentParser(prog='tournament', description='Play a rated engine tournament, resuming from its checkpoint')
+    parser.add_argument('entrants', nargs='?', help='JSON list of entrants: {"name", "budget", "depth", "weights", "player"}')
+    parser.add_argument('--format', choices=[format.value for format in TournamentFormat], default=TournamentFormat.ROUND_ROBIN.value)
+    parser.add_argument('--rounds', type=int, default=None, help='rounds of a swiss tournament')
+    parser.add_argument('--workers', type=int, default=cpu_count() or 1)
+    parser.add_argument('--table-mb', type=float, default=1, help='transposition table of every engine')
+    parser.add_argument('--opening-plies', type=int, default=6, help='random moves played before the engines take over')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--checkpoint', default='tournament.json', help='state file, an existing one is resumed')
+    parser.add_argument('--checkpoint-interval', type=float, default=5.0, help='most seconds between checkpoints within a round')
+    parser.add_argument('--players', help='players CSV receiving the ratings of entrants with a "player" uuid')
+    parser.add_argument('--top', type=int, default=20, help='entrants listed in the final standings')
+    args: Namespace = parser.parse_args(argv)
+
+    # A round robin's length follows from its entrants
+    if args.rounds is not None and args.format == TournamentFormat.ROUND_ROBIN.value:
+        parser.error('--rounds only applies to swiss tournaments')
+    return args
+
+def start(args: Namespace) -> tuple[Tournament, dict]:
+    """ This function resumes the tournament of the checkpoint, or starts a new one from the entrants file """
+    if Path(args.checkpoint).exists():
+        tournament, settings = load_tournament(args.checkpoint)
+        sys.stderr.write(f"Resuming round {tournament.round}/{tournament.rounds} with {len(tournament.pending)} games left in it\n")
+        return tournament, settings
+
+    if args.entrants is None:
+        raise ValueError(f"There is no checkpoint at {args.checkpoint}, an entrants file is needed to start.")
+
+    with open(args.entrants) as file:
+        entrants: list[dict] = json.load(file)
+
+    # Entrants and seed are kept in the checkpoint, so a resumed run pairs and opens its games like an uninterrupted one
+    settings: dict = {'entrants': entrants, 'seed': args.seed, 'opening_plies': args.opening_plies}
+    tournament: Tournament = Tournament([entrant['name'] for entrant in entrants], TournamentFormat(args.format), args.rounds)
+    return tournament, settings
+
+def rate_players(tournament: Tournament, entrants: dict[str, dict], path: str) -> None:
+    """ This function stores the final ratings as the scores of the players behind the entrants """
+    store: PlayerStore = load_players(path)
+
+    for name, entrant in entrants.items():
+        if entrant.get('player') and UUID(entrant['player']) in store:
+            id: UUID = UUID(entrant['player'])
+            store.set_score(id, max(0, round(tournament.entrant(name).rating)))
+            store.increment_xp(id, tournament.entrant(name).games)
+
+    save_players(store, path)
+
+def main(argv: list[str]) -> int:
+    args: Namespace = parse_args(argv)
+    tournament, settings = start(args)
+    entrants: dict[str, dict] = {entrant['name']: entrant for entrant in settings['entrants']}
+    start_time: float = perf_counter()
+    played: int = 0
+
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker) as pool:
+        while not tournament.is_finished:
+            if tournament.is_round_complete:
+                tournament.next_round()
+                save_tournament(tournament, args.checkpoint, settings)
+
+            # A round's games don't depend on each other, they all run at once and are rated as they finish
+            futures: dict[Future, tuple[str, str]] = {}
+            for black, white in tournament.pending:
+                opening: list[int] = random_opening(Random(f"{settings['seed']}:{tournament.round}:{black}:{white}"), settings['opening_plies'])
+                futures[pool.submit(_play, entrants[black], entrants[white], opening, args.table_mb)] = (black, white)
+
+            saved: float = perf_counter()
+            for future in as_completed(futures):
+                black, white = futures[future]
+                tournament.record(black, white, future.result())
+                played += 1
+
+                # Checkpoints are throttled, a crash only replays the games finished since the last one
+                if perf_counter() - saved >= args.checkpoint_interval:
+                    save_tournament(tournament, args.checkpoint, settings)
+                    saved = perf_counter()
+
+                sys.stderr.write(f"\rround {tournament.round}/{tournament.rounds}  {played} games  "
+                                 f"{played / (perf_counter() - start_time):.2f} games/sec")
+                sys.stderr.flush()
+
+            save_tournament(tournament, args.checkpoint, settings)
+
+    sys.stderr.write('\n')
+    print(f"{'#':>4} {'entrant':<24} {'points':>7} {'glicko':>7} {'± rd':>5} {'elo':>6} {'games':>6}")
+    for rank, entrant in enumerate(tournament.standings()[:args.top], start=1):
+        print(f"{rank:>4} {entrant.name:<24} {entrant.points:>7g} {entrant.rating:>7.0f} {entrant.deviation:>5.0f} {entrant.elo:>6.0f} {entrant.games:>6}")
+
+    if args.players:
+        rate_players(tournament, entrants, args.players)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
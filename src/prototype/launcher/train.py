@@ -0,0 +1,52 @@
+from core.enums.attributes.match import MatchAttribute
+from core.misc.square import parse_moves
+from core.ai.training import PatternTrainer
+from data.csv_handler.reader import CsvReader
+from data.archive.importer import is_archive, read_archive
+from data.archive.statistics import ImportStatistics
+from core.enums.guard_mode import GuardMode
+from core.shield.guard import Guard
+from argparse import ArgumentParser, Namespace
+from time import perf_counter
+import sys
+
+
+def parse_args(argv: list[str]) -> Namespace:
+    parser: ArgumentParser = ArgumentParser(prog='train', description='Fit pattern evaluation weights on recorded games')
+    parser.add_argument('history', nargs='+', help='CSV match history files, selfplay output (.jsonl) or WTHOR (.wtb) and GGF (.ggf) archives')
+    parser.add_argument('--output', required=True, help='pattern weights file to write')
+    parser.add_argument('--iterations', type=int, default=100, help='conjugate gradient iterations per phase')
+    parser.add_argument('--regularization', type=float, default=1.0)
+    return parser.parse_args(argv)
+
+def main(argv: list[str]) -> int:
+    args: Namespace = parse_args(argv)
+
+    # Recorded games come from files, so moves stay checked, only with the cheaper checks
+    Guard.set_mode(GuardMode.FAST)
+    trainer: PatternTrainer = PatternTrainer(args.regularization)
+    start: float = perf_counter()
+
+    games: int = 0
+    for path in args.history:
+        # Selfplay output and historical games from WTHOR/GGF archives, the replay inserts the passes the trainer expects
+        if is_archive(path):
+            statistics: ImportStatistics = ImportStatistics(path)
+            for game in read_archive(path, statistics):
+                trainer.add_game(game.moves, game.result)
+                games += 1
+            sys.stderr.write(f"{statistics}\n")
+            continue
+
+        for row in CsvReader(path).rows([MatchAttribute.MOVES, MatchAttribute.RESULT]):
+            trainer.add_game(parse_moves(row[MatchAttribute.MOVES]), int(row[MatchAttribute.RESULT]))
+            games += 1
+
+    sys.stderr.write(f"{games} games, {trainer.positions} positions read in {perf_counter() - start:.1f}s\n")
+    trainer.fit(args.iterations).save(args.output)
+    sys.stderr.write(f"Weights written to {args.output} after {perf_counter() - start:.1f}s\n")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
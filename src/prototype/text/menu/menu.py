@@ -4,7 +4,8 @@ from prototype.ansi.color import Decoration
 from prototype.text.message import Message
 from prototype.text.text import Text
 from core.shield.guard import Guard
-from core.misc.func import print_n
+
+_PROMPT: Text = Text(text='Select an option: ', decoration=Decoration.of(Foreground.BRIGHT_GREEN))
 
 
 class Menu:
@@ -19,6 +20,11 @@ class Menu:
         self._options_decoration: Decoration = options_decoration
         self._options: list[Text] = []
 
+        # Title band and option lines only change with the options, so they are rendered then instead of per display
+        self._rendered_title: str = ''
+        self._rendered_options: str = ''
+        self._render()
+
     ###########
     # Getters #
     ###########
@@ -45,8 +51,15 @@ class Menu:
         if self._max_length < len(option):
             self._max_length = len(option)
 
-    def _print_title(self) -> None:
-        """ This method prints title of the menu """
+        self._render()
+
+    def _render(self) -> None:
+        """ This method renders the title and options again after they changed """
+        self._rendered_title = self._render_title()
+        self._rendered_options = self._render_options()
+
+    def _render_title(self) -> str:
+        """ This method renders title of the menu """
         # Calculations
         """
         self._max_length: Maximum text length in title and options
@@ -62,56 +75,34 @@ class Menu:
 
         padding: int = int(remaining_size / 2)
 
-        # Upper band
-        print_n(
-            value=self.title_decorator.__repr__(),
-            limit=decor_size
-        )
-
-        # Left Symbol
-        print(self.title_decorator, end='')
+        decorator: str = self.title_decorator.__repr__()
+        band: str = Text(text=self._title_decorator * decor_size, decoration=self.title.decoration).__repr__()
+        left: str = ' ' * (padding + 1 if remaining_size % 2 else padding)
+        right: str = ' ' * padding
 
-        # Left Padding
-        print_n(
-            value=' ',
-            limit=padding + 1 if remaining_size % 2 else padding,
-            line_break=False
-        )
+        return f"{band}\n{decorator}{left}{self.title}{right}{decorator}\n{band}"
 
-        # Title
-        print(self.title, end='')
+    def _render_options(self) -> str:
+        """ This method renders all options """
+        number_decoration: Decoration = Decoration.of(self._options_decoration.fg, self._options_decoration.bg, Style.BOLD)
+        lines: list[str] = []
+        for i in range(len(self._options)):
+            # Number
+            number: Text = Text(text=f'[{i + 1}] ', decoration=number_decoration)
 
-        # Right Padding
-        print_n(
-            value=' ',
-            limit=padding,
-            line_break=False
-        )
+            # Option
+            lines.append(f"{number}{self._options[i]}")
 
-        # Right Symbol
-        print(self.title_decorator)
+        return '\n'.join(lines)
 
-        # Lower band
-        print_n(
-            value=self.title_decorator.__repr__(),
-            limit=decor_size
-        )
+    def _print_title(self) -> None:
+        """ This method prints title of the menu """
+        print(self._rendered_title)
 
     def _print_options(self) -> None:
         """ This method prints all options """
-        for i in range(len(self._options)):
-            # Number
-            print(Text(
-                text=f'[{i + 1}] ',
-                decoration=Decoration(
-                    foreground=self._options_decoration.fg,
-                    background=self._options_decoration.bg,
-                    style=Style.BOLD
-                )
-            ), end='')
-
-            # Option
-            print(self._options[i])
+        if self._rendered_options:
+            print(self._rendered_options)
 
     def display(self) -> None:
         """ This method displays the menu on the terminal """
@@ -121,12 +112,7 @@ class Menu:
 
     def take_input(self) -> int:
         """ This method read's user input for option selection in the menu """
-        prompt: Text = Text(
-            text='Select an option: ',
-            decoration=Decoration(
-                foreground=Foreground.BRIGHT_GREEN
-            )
-        )
+        prompt: Text = _PROMPT
         valid: bool = False
         option: int = 0
 
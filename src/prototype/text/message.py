@@ -3,6 +3,12 @@ from prototype.ansi.enums.style import Style
 from prototype.ansi.color import Decoration
 from prototype.text.text import Text
 
+# Headers are built once and reused by every message
+_INFO: Text = Text(text='[INFO]', decoration=Decoration.of(Foreground.BRIGHT_CYAN, style=Style.BOLD))
+_ERROR: Text = Text(text='[ERROR]', decoration=Decoration.of(Foreground.BRIGHT_RED, style=Style.BOLD))
+_WARNING: Text = Text(text='[WARNING]', decoration=Decoration.of(Foreground.BRIGHT_YELLOW, style=Style.BOLD))
+_SUCCESS: Text = Text(text='[SUCCESS]', decoration=Decoration.of(Foreground.BRIGHT_GREEN, style=Style.BOLD))
+
 
 class Message:
     def __init__(self, header: Text, message: str):
@@ -11,51 +17,19 @@ class Message:
 
     @staticmethod
     def info(message: str) -> None:
-        header: Text = Text(
-            text='[INFO]',
-            decoration=Decoration(
-                foreground=Foreground.BRIGHT_CYAN,
-                style=Style.BOLD
-            )
-        )
-
-        print(Message(header, message))
+        print(Message(_INFO, message))
 
     @staticmethod
     def error(message: str) -> None:
-        header: Text = Text(
-            text='[ERROR]',
-            decoration=Decoration(
-                foreground=Foreground.BRIGHT_RED,
-                style=Style.BOLD
-            )
-        )
-
-        print(Message(header, message))
+        print(Message(_ERROR, message))
 
     @staticmethod
     def warning(message: str) -> None:
-        header: Text = Text(
-            text='[WARNING]',
-            decoration=Decoration(
-                foreground=Foreground.BRIGHT_YELLOW,
-                style=Style.BOLD
-            )
-        )
-
-        print(Message(header, message))
+        print(Message(_WARNING, message))
 
     @staticmethod
     def success(message: str) -> None:
-        header: Text = Text(
-            text='[SUCCESS]',
-            decoration=Decoration(
-                foreground=Foreground.BRIGHT_GREEN,
-                style=Style.BOLD
-            )
-        )
-
-        print(header, message)
+        print(_SUCCESS, message)
 
     def __repr__(self) -> str:
         return self.header.__repr__() + ' ' + self.message
@@ -1,13 +1,18 @@
-from prototype.ansi.color import Decoration, colored_text
+from prototype.ansi.color import PLAIN, Decoration, colored_text
 from core.shield.guard import Guard
 
 
 class Text:
-    def __init__(self, text: str, decoration: Decoration = Decoration()):
+    __slots__ = ('__text', '__decoration', '__rendered')
+
+    def __init__(self, text: str, decoration: Decoration = PLAIN):
         Guard.against_empty_or_whitespace(text, 'text')
         self.__text: str = text
         self.__decoration: Decoration = decoration
 
+        # Text and decoration are fixed, so the escaped string is rendered once
+        self.__rendered: str = colored_text(text=text, decoration=decoration)
+
     ###########
     # Getters #
     ###########
@@ -21,4 +26,4 @@ class Text:
         return self.__decoration
 
     def __repr__(self) -> str:
-        return colored_text(text=self.value, decoration=self.decoration)
+        return self.__rendered